@@ -14,7 +14,7 @@ from werkzeug.utils import secure_filename
 import threading
 import time
 import json
-from database.local_db import init_db, get_jobs, get_job_count, get_stats, fetch_companies, get_connection
+from database.local_db import init_db, get_jobs, get_job_count, get_stats, fetch_companies, get_connection, close_connections
 from tools.cv_parser import extract_cv_text, clean_cv_text
 from tools.ollama_client import test_connection, extract_skills_from_cv, match_job_to_cv
 
@@ -37,6 +37,12 @@ def ensure_db():
     init_db()
 
 
+@app.teardown_appcontext
+def close_db(exc):
+    """Close this request thread's cached database connections."""
+    close_connections()
+
+
 @app.route("/")
 def index():
     """Home page with job listings."""
@@ -107,8 +113,39 @@ def api_jobs():
     sort_by = request.args.get("sort", "first_seen_at")
     sort_order = request.args.get("order", "DESC")
     
+    # Optional keyset cursor (next_cursor from the previous response)
+    after_seen = request.args.get("after_seen")
+    after_id = request.args.get("after_id", type=int)
+    
     offset = (page - 1) * per_page
     
+    if after_seen is not None or after_id is not None:
+        if not after_seen or after_id is None:
+            return jsonify({"error": "after_seen and after_id must be given together"}), 400
+        if sort_by != "first_seen_at":
+            return jsonify({"error": "Cursor paging is only supported with sort=first_seen_at"}), 400
+        
+        jobs = get_jobs(
+            limit=per_page,
+            company_id=company_id,
+            min_score=min_score,
+            search=search if search else None,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            after_seen=after_seen,
+            after_id=after_id,
+        )
+        
+        # Counting every match would undo the cheap seek, so it's opt-in
+        result = {"jobs": jobs, "per_page": per_page, "next_cursor": _next_cursor(jobs, per_page)}
+        if request.args.get("with_total", type=int):
+            result["total"] = get_job_count(
+                company_id=company_id,
+                min_score=min_score,
+                search=search if search else None,
+            )
+        return jsonify(result)
+    
     jobs = get_jobs(
         limit=per_page,
         offset=offset,
@@ -118,7 +155,6 @@ def api_jobs():
         sort_by=sort_by,
         sort_order=sort_order,
     )
-    
     total = get_job_count(
         company_id=company_id,
         min_score=min_score,
@@ -131,9 +167,17 @@ def api_jobs():
         "page": page,
         "per_page": per_page,
         "total_pages": (total + per_page - 1) // per_page,
+        "next_cursor": _next_cursor(jobs, per_page) if sort_by == "first_seen_at" else None,
     })
 
 
+def _next_cursor(jobs: list, per_page: int):
+    """Cursor for the page after `jobs`, or None when this was the last one."""
+    if len(jobs) < per_page:
+        return None
+    return {"after_seen": jobs[-1]["first_seen_at"], "after_id": jobs[-1]["id"]}
+
+
 @app.route("/api/stats")
 def api_stats():
     """API endpoint for statistics."""
@@ -240,6 +284,8 @@ def upload_cv():
                     "progress": f"Error: {str(e)}",
                     "result": None
                 }
+            finally:
+                close_connections()
         
         thread = threading.Thread(target=analyze_cv_async)
         thread.start()
@@ -357,6 +403,8 @@ def match_jobs():
                 "total": 0,
                 "high_matches": 0
             }
+        finally:
+            close_connections()
     
     thread = threading.Thread(target=match_jobs_async)
     thread.start()
@@ -0,0 +1,142 @@
+# connectors/_browser_pool.py
+"""
+Process-wide Playwright browser pool.
+
+One Chromium is launched lazily and shared by every async scraper.
+Callers check out a fresh BrowserContext and close only that context
+when done, so the 1-2s browser cold start is paid once per process and
+Chromium child processes don't pile up across runs.
+
+Async Playwright objects are bound to the event loop that created them,
+so the pool lives on its own background loop. Sync entry points must use
+run() instead of asyncio.run() - a new loop per call would orphan the
+shared browser.
+"""
+import asyncio
+import atexit
+import re
+import threading
+from typing import Optional
+
+try:
+    from playwright.async_api import async_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+
+LAUNCH_ARGS = ['--disable-blink-features=AutomationControlled', '--disable-dev-shm-usage', '--no-sandbox']
+MAX_CONTEXTS = 8          # concurrent checkouts before acquire_context() waits
+SHUTDOWN_TIMEOUT = 15     # seconds
+
+# Never read by the scrapers, so don't download them (also used by
+# play_renderer)
+BLOCKED_RESOURCES = {'image', 'font', 'media', 'stylesheet'}
+# For scrapers that read rendered text (inner_text), whose line breaks and
+# hidden elements follow the page's CSS: everything above but stylesheets
+LAYOUT_SAFE_BLOCKED_RESOURCES = frozenset(BLOCKED_RESOURCES - {'stylesheet'})
+BLOCKED_URL_RE = re.compile(r'analytics|doubleclick|googletagmanager', re.I)
+
+_pw = None
+_browser = None
+_launch_lock: Optional[asyncio.Lock] = None
+_slots: Optional[asyncio.Semaphore] = None
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Start the pool's event loop thread on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="browser-pool", daemon=True).start()
+        return _loop
+
+
+def run(coro, timeout: Optional[float] = None):
+    """Run a coroutine on the pool's loop and block for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result(timeout)
+
+
+async def _get_browser():
+    """Launch Chromium once; relaunch only if it crashed or disconnected."""
+    global _pw, _browser, _launch_lock
+    if _launch_lock is None:
+        _launch_lock = asyncio.Lock()
+
+    async with _launch_lock:
+        if _browser is None or not _browser.is_connected():
+            if _pw is None:
+                _pw = await async_playwright().start()
+            _browser = await _pw.chromium.launch(headless=True, args=LAUNCH_ARGS)
+    return _browser
+
+
+async def _block_heavy(route):
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCES or BLOCKED_URL_RE.search(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def acquire_context(block_resources: bool = True, **context_kwargs):
+    """
+    Check out a new BrowserContext from the shared browser.
+
+    Blocks while MAX_CONTEXTS are already checked out. Every call must be
+    paired with release_context().
+
+    Args:
+        block_resources: Abort images/fonts/media/stylesheets and analytics requests
+        **context_kwargs: Passed to browser.new_context (user_agent, viewport...)
+    """
+    global _slots
+    if not PLAYWRIGHT_AVAILABLE:
+        raise RuntimeError("Playwright not installed. Run: pip install playwright && playwright install chromium")
+    if _slots is None:
+        _slots = asyncio.Semaphore(MAX_CONTEXTS)
+
+    await _slots.acquire()
+    try:
+        browser = await _get_browser()
+        ctx = await browser.new_context(**context_kwargs)
+        if block_resources:
+            await ctx.route('**/*', _block_heavy)
+        return ctx
+    except BaseException:
+        _slots.release()
+        raise
+
+
+async def release_context(ctx):
+    """Close a context from acquire_context(); the browser stays up."""
+    try:
+        await ctx.close()
+    finally:
+        _slots.release()
+
+
+async def _shutdown():
+    global _pw, _browser
+    if _browser is not None:
+        await _browser.close()
+        _browser = None
+    if _pw is not None:
+        await _pw.stop()
+        _pw = None
+
+
+@atexit.register
+def _close_on_exit():
+    if _loop is None:
+        return
+    try:
+        run(_shutdown(), timeout=SHUTDOWN_TIMEOUT)
+    except Exception:
+        pass
+    finally:
+        _loop.call_soon_threadsafe(_loop.stop)
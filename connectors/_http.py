@@ -0,0 +1,385 @@
+# connectors/_http.py
+"""
+Shared HTTP helpers for the API-based connectors.
+Per-host rate limiting, retry-with-backoff on 429/5xx, a short-lived
+result cache for fetch(), and fetch_many() to run several connector
+fetches at once.
+"""
+import functools
+import json
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# urllib3 decodes Brotli transparently, but only when a brotli package is
+# installed - never advertise `br` without one
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+ACCEPT_ENCODING = "br, gzip" if BROTLI_AVAILABLE else "gzip, deflate"
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+DEFAULT_RATE = 10       # requests per `DEFAULT_PER` seconds, per host
+DEFAULT_PER = 1.0
+MAX_ATTEMPTS = 4
+RETRY_STATUSES = (429, 502, 503, 504)
+CACHE_TTL = 900         # seconds
+CACHE_MAXSIZE = 256
+POOL_MAXSIZE = 20       # keep-alive connections per host
+FETCH_WORKERS = 16      # concurrent connector fetches in fetch_many()
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at `rate` per `per` seconds. The server can
+    resize the bucket (X-Rate-Limit-Limit / -Interval), drain it early
+    (X-RateLimit-Remaining: 0) or pause it entirely (Retry-After), so we
+    back off before it starts returning 429s.
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, per: float = DEFAULT_PER):
+        self.rate = float(rate)
+        self.per = float(per)
+        self._tokens = float(rate)
+        self._last = time.monotonic()
+        self._paused_until = 0.0
+        self._sized_by_server = False
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self._last
+        self._tokens = min(self.rate, self._tokens + elapsed * self.rate / self.per)
+        self._last = now
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._paused_until - now
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) * self.per / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Hold back every caller for this host for `seconds`."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def update_from_headers(self, headers):
+        """Sync bucket state with the server's rate-limit headers."""
+        if not self._sized_by_server:
+            limit = _header(headers, "X-Rate-Limit-Limit", "X-RateLimit-Limit")
+            interval = _interval_seconds(
+                _header(headers, "X-Rate-Limit-Interval", "X-RateLimit-Interval")
+            )
+            try:
+                if limit is not None and interval:
+                    with self._lock:
+                        self.rate, self.per = float(limit), interval
+                        self._tokens = min(self._tokens, self.rate)
+                        self._sized_by_server = True
+            except ValueError:
+                pass
+
+        remaining = _header(headers, "X-Rate-Limit-Remaining", "X-RateLimit-Remaining")
+        if remaining is not None:
+            try:
+                with self._lock:
+                    self._tokens = min(self._tokens, float(remaining))
+            except ValueError:
+                pass
+
+        delay = retry_after(headers)
+        if delay:
+            self.pause(delay)
+
+
+def make_session(
+    headers: Optional[dict] = None,
+    pool_maxsize: int = POOL_MAXSIZE,
+    retry_statuses: bool = True
+) -> requests.Session:
+    """
+    requests.Session with a sized keep-alive pool.
+
+    Meant to be created once per connector module so TCP/TLS setup is paid
+    once per host rather than per page. Connection errors (and, unless
+    retry_statuses=False, 502/503/504 on idempotent requests) get two quick
+    retries at the adapter level. Pass retry_statuses=False for sessions
+    driven by request_with_retry, which already handles those statuses.
+    """
+    session = requests.Session()
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    if headers:
+        session.headers.update(headers)
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=2, backoff_factor=0.3,
+                          status_forcelist=[502, 503, 504] if retry_statuses else [],
+                          raise_on_status=False),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _header(headers, *names) -> Optional[str]:
+    """First of `names` present in headers (vendors spell these differently)."""
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            return value
+    return None
+
+
+_INTERVAL_RE = re.compile(r'^(?:PT)?(\d+(?:\.\d+)?)\s*([smh]?)$', re.I)
+
+
+def _interval_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a rate-limit interval like "60", "60s", "1m" or "PT60S" to seconds."""
+    m = _INTERVAL_RE.match((value or "").strip())
+    if not m:
+        return None
+    n = float(m.group(1))
+    return n * {"": 1, "s": 1, "m": 60, "h": 3600}[m.group(2).lower()] or None
+
+
+def json_loads(body):
+    """
+    Decode a JSON response body (bytes or str).
+
+    Uses orjson when installed - several times faster than the stdlib on
+    the large board payloads, and it reads bytes without a str decode.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+_BUCKETS: Dict[str, TokenBucket] = {}
+_BUCKETS_LOCK = threading.Lock()
+
+
+def bucket_for(url: str) -> TokenBucket:
+    """Get (or create) the token bucket for the URL's host."""
+    host = urlparse(url).netloc.lower()
+    with _BUCKETS_LOCK:
+        bucket = _BUCKETS.get(host)
+        if bucket is None:
+            bucket = _BUCKETS[host] = TokenBucket()
+        return bucket
+
+
+def set_host_rate(url: str, rate: float, per: float = DEFAULT_PER):
+    """Give the URL's host its own rate (e.g. our own backend, not a job board)."""
+    host = urlparse(url).netloc.lower()
+    with _BUCKETS_LOCK:
+        _BUCKETS[host] = TokenBucket(rate, per)
+
+
+def retry_after(headers) -> Optional[float]:
+    """
+    Parse a Retry-After header into seconds.
+
+    Accepts both forms from RFC 9110: delay-seconds and HTTP-date.
+    """
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        when = parsedate_to_datetime(value)
+        return max(0.0, when.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def request_with_retry(
+    method: str,
+    url: str,
+    session: Optional[requests.Session] = None,
+    attempts: int = MAX_ATTEMPTS,
+    **kwargs
+) -> requests.Response:
+    """
+    Send an HTTP request gated by the per-host token bucket.
+
+    Retries on 429/502/503/504 with exponential backoff plus jitter, or
+    exactly `Retry-After` seconds when the server provides it. The last
+    response is returned as-is so callers keep their own status handling.
+
+    Args:
+        method: HTTP method ("GET", "POST", ...)
+        url: Request URL (its host selects the rate-limit bucket)
+        session: Optional requests.Session to send through
+        attempts: Maximum number of tries
+        **kwargs: Passed through to requests (headers, params, json, timeout...)
+
+    Returns:
+        requests.Response
+    """
+    bucket = bucket_for(url)
+    sender = session or requests
+
+    for attempt in range(attempts):
+        bucket.acquire()
+        r = sender.request(method, url, **kwargs)
+        bucket.update_from_headers(r.headers)
+
+        if r.status_code not in RETRY_STATUSES or attempt == attempts - 1:
+            return r
+
+        delay = retry_after(r.headers)
+        if delay is None:
+            delay = (2 ** attempt) * 0.5 + random.random()
+        print(f"    HTTP {r.status_code} from {urlparse(url).netloc}, retrying in {delay:.1f}s")
+        time.sleep(delay)
+
+    return r
+
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = frozenset({
+    "gclid", "dclid", "fbclid", "msclkid", "igshid", "mc_cid", "mc_eid",
+    "_ga", "_gl", "src", "source",
+})
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name.startswith("utm_") or name in TRACKING_PARAMS
+
+
+def canon_url(url: str) -> str:
+    """
+    Canonical form of a job URL for dedupe.
+
+    Lowercases scheme/host and drops the fragment, trailing slash and
+    tracking parameters (utm_*, gclid, source...), so tracking variants
+    collapse to one key. The rest of the query is kept, sorted: many
+    boards (e.g. Taleo's ...?jobid=N) carry the job ID there.
+    """
+    s = urlsplit(url)
+    query = ""
+    if s.query:
+        query = urlencode(sorted(
+            (k, v) for k, v in parse_qsl(s.query, keep_blank_values=True)
+            if not _is_tracking_param(k)
+        ))
+    return urlunsplit((s.scheme.lower(), s.netloc.lower(), s.path.rstrip('/'), query, ''))
+
+
+def job_key(url: str, title: Optional[str] = None, page_url: Optional[str] = None):
+    """
+    Dedupe key for a scraped job row: its canonical detail URL.
+
+    When that URL doesn't identify a posting - no path, a non-HTTP link
+    ("#", javascript:...) or the listing page itself - the title is added,
+    so distinct cards sharing one link aren't collapsed.
+    """
+    url = canon_url(url or "")
+    s = urlsplit(url)
+    if (not s.path or s.scheme not in ("http", "https", "")
+            or (page_url and url == canon_url(page_url))):
+        return (url, title)
+    return url
+
+
+def fetch_many(
+    fn: Callable[..., List[dict]],
+    kwargs_list: List[Dict[str, Any]],
+    workers: int = FETCH_WORKERS
+) -> List[Any]:
+    """
+    Call a connector's fetch() once per kwargs dict, concurrently.
+
+    Connector fetches are almost entirely socket I/O (which releases the
+    GIL), so threads overlap them without touching the connectors; their
+    module-level sessions are safe to share across threads. Results come
+    back in input order; a call that raised yields its exception instead,
+    so one failing tenant doesn't lose the others.
+    """
+    def call(kwargs):
+        try:
+            return fn(**kwargs)
+        except Exception as e:
+            return e
+
+    if len(kwargs_list) <= 1:
+        return [call(kw) for kw in kwargs_list]
+    with ThreadPoolExecutor(max_workers=min(workers, len(kwargs_list))) as pool:
+        return list(pool.map(call, kwargs_list))
+
+
+def ttl_cache(ttl: float = CACHE_TTL, maxsize: int = CACHE_MAXSIZE) -> Callable:
+    """
+    Memoize a connector's fetch(endpoint_url, ...) for `ttl` seconds.
+
+    Keyed on endpoint_url only, so overlapping scrape passes within one
+    run hit the network once. Empty results are not cached (that is how
+    connectors report failures), and every hit hands out fresh dict
+    copies so callers can mutate jobs without touching the cache.
+    """
+    def decorator(fn):
+        cache = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = kwargs["endpoint_url"] if "endpoint_url" in kwargs else args[0]
+            now = time.monotonic()
+            with lock:
+                hit = cache.get(key)
+                if hit and hit[0] > now:
+                    cache.move_to_end(key)
+                    return [dict(j) for j in hit[1]]
+
+            out = fn(*args, **kwargs)
+            if out:
+                with lock:
+                    cache[key] = (now + ttl, [dict(j) for j in out])
+                    cache.move_to_end(key)
+                    while len(cache) > maxsize:
+                        cache.popitem(last=False)
+            return out
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
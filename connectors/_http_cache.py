@@ -0,0 +1,216 @@
+# connectors/_http_cache.py
+"""
+On-disk cache for conditional GETs.
+
+Stores the last ETag / Last-Modified and response body per (URL, params,
+JSON body) in a small SQLite file. The next request sends If-None-Match /
+If-Modified-Since and a 304 is served from the stored body, so scheduled
+re-runs against unchanged boards cost almost no bandwidth. Callers can
+also pass max_age to skip the round trip entirely for recent entries.
+
+Entries are pruned so the file stays bounded: bodies stored without any
+validator (only useful within max_age) after UNVALIDATED_TTL, and any
+entry not fetched or revalidated for CACHE_RETENTION.
+"""
+import atexit
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, Tuple
+from urllib.parse import urlencode
+
+import requests
+
+from connectors._http import json_loads, request_with_retry
+
+
+CACHE_PATH = os.environ.get(
+    "HTTP_CACHE_PATH",
+    os.path.join(os.path.dirname(__file__), "..", ".cache", "http_cache.db"),
+)
+CACHE_RETENTION = 7 * 24 * 3600   # seconds an unused entry is kept
+UNVALIDATED_TTL = 3600            # seconds for bodies with no ETag / Last-Modified (> any max_age)
+PRUNE_EVERY = 1000                # writes between prunes within one process
+
+
+_local = threading.local()
+_ready_paths = set()
+_ready_lock = threading.Lock()
+_writes = 0
+
+
+def _open_connection(path: str) -> sqlite3.Connection:
+    # Autocommit: every statement here is a single-row read or write
+    conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+    with _ready_lock:
+        if path not in _ready_paths:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS http_cache (
+                    key TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    body BLOB,
+                    ts INTEGER
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_http_cache_ts ON http_cache (ts)")
+            _prune(conn)
+            _ready_paths.add(path)
+    return conn
+
+
+def _prune(conn: sqlite3.Connection):
+    """Drop expired entries (see CACHE_RETENTION / UNVALIDATED_TTL)."""
+    now = int(time.time())
+    conn.execute(
+        "DELETE FROM http_cache WHERE ts < ? "
+        "OR (ts < ? AND etag IS NULL AND last_modified IS NULL)",
+        (now - CACHE_RETENTION, now - UNVALIDATED_TTL),
+    )
+
+
+def _connect() -> sqlite3.Connection:
+    """The calling thread's cached connection to CACHE_PATH (schema created once)."""
+    path = os.path.abspath(CACHE_PATH)
+    conns = _local.__dict__.setdefault("conns", {})
+    conn = conns.get(path)
+    if conn is None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        conn = conns[path] = _open_connection(path)
+    return conn
+
+
+@atexit.register
+def close_connections():
+    """Close the calling thread's cached connections (runs at exit for the main thread)."""
+    for conn in getattr(_local, "conns", {}).values():
+        conn.close()
+    _local.conns = {}
+
+
+def cache_key(url: str, params: Optional[dict] = None, body=None) -> str:
+    """Stable key for a URL plus its query params (and JSON body, for POSTs)."""
+    query = urlencode(sorted((params or {}).items()))
+    key = f"{url}?{query}"
+    if body is not None:
+        key += "\n" + json.dumps(body, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def get_cached(key: str) -> Tuple[Optional[str], Optional[str], Optional[bytes], int]:
+    """Return (etag, last_modified, body, ts) for a key, or Nones/0 if not cached."""
+    try:
+        row = _connect().execute(
+            "SELECT etag, last_modified, body, ts FROM http_cache WHERE key = ?", (key,)
+        ).fetchone()
+    except sqlite3.Error as e:
+        print(f"  HTTP cache read error: {e}")
+        row = None
+    return tuple(row) if row else (None, None, None, 0)
+
+
+def touch_cached(key: str):
+    """Mark a cached entry as just revalidated (after a 304)."""
+    try:
+        _connect().execute("UPDATE http_cache SET ts = ? WHERE key = ?", (int(time.time()), key))
+    except sqlite3.Error as e:
+        print(f"  HTTP cache write error: {e}")
+
+
+def put_cached(
+    key: str,
+    etag: Optional[str],
+    last_modified: Optional[str],
+    body: bytes,
+    require_validator: bool = True
+):
+    """Store validators and body for a key (by default a no-op without any validator)."""
+    global _writes
+    if require_validator and not etag and not last_modified:
+        return
+    try:
+        conn = _connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO http_cache (key, etag, last_modified, body, ts) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (key, etag, last_modified, body, int(time.time())),
+        )
+        with _ready_lock:
+            _writes += 1
+            due = _writes % PRUNE_EVERY == 0
+        if due:
+            _prune(conn)
+    except sqlite3.Error as e:
+        print(f"  HTTP cache write error: {e}")
+
+
+def conditional_get(
+    url: str,
+    params: Optional[dict] = None,
+    session: Optional[requests.Session] = None,
+    max_age: float = 0,
+    method: str = "GET",
+    json_body=None,
+    **kwargs
+) -> bytes:
+    """
+    GET a URL, revalidating against the cached copy.
+
+    Read-only POST searches (e.g. Workday's) can go through here too: pass
+    method="POST" and json_body, which becomes part of the cache key.
+
+    Sends If-None-Match / If-Modified-Since when validators are cached and
+    returns the stored body on 304. Non-2xx responses raise like
+    raise_for_status().
+
+    Args:
+        url: Request URL
+        params: Query params (part of the cache key)
+        session: Optional requests.Session to send through
+        max_age: Serve a cached body younger than this many seconds without
+            any request (0 = always revalidate)
+        method: HTTP method (GET, or POST for search endpoints)
+        json_body: JSON request body (part of the cache key)
+        **kwargs: Passed through to requests (headers, timeout...)
+
+    Returns:
+        Response body bytes
+    """
+    key = cache_key(url, params, json_body)
+    etag, last_modified, body, ts = get_cached(key)
+    if body is not None and max_age and time.time() - ts < max_age:
+        return body
+
+    headers = dict(kwargs.pop("headers", None) or {})
+    if body is not None:
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    if json_body is not None:
+        kwargs["json"] = json_body
+    r = request_with_retry(method, url, session=session, params=params, headers=headers, **kwargs)
+    if r.status_code == 304 and body is not None:
+        touch_cached(key)
+        return body
+
+    r.raise_for_status()
+    put_cached(key, r.headers.get("ETag"), r.headers.get("Last-Modified"), r.content,
+               require_validator=not max_age)
+    return r.content
+
+
+def conditional_get_json(
+    url: str,
+    params: Optional[dict] = None,
+    session: Optional[requests.Session] = None,
+    **kwargs
+):
+    """conditional_get() decoded as JSON (with orjson when installed)."""
+    body = conditional_get(url, params=params, session=session, **kwargs)
+    return json_loads(body) if body else None
@@ -3,9 +3,15 @@
 Comprehensive scraper for all official company career sites.
 Uses Playwright for JavaScript-rendered pages.
 """
-from typing import List, Dict
+import atexit
+import functools
+import queue
 import re
+import threading
 import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import List, Dict
 
 try:
     from playwright.sync_api import sync_playwright
@@ -13,6 +19,142 @@ try:
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
+from connectors._browser_pool import BLOCKED_URL_RE, LAUNCH_ARGS, LAYOUT_SAFE_BLOCKED_RESOURCES, SHUTDOWN_TIMEOUT
+
+
+# Several scrapers read page.inner_text('body'), so stylesheets stay on
+BLOCKED_TYPES = LAYOUT_SAFE_BLOCKED_RESOURCES
+
+# One Chromium per process, shared by every fetch_* below; each scraper
+# gets its own contexts and closes only those. Sync Playwright objects are
+# bound to the thread that started Playwright, so (like _browser_pool's
+# event loop) all browser work runs on one dedicated thread and fetch_*
+# calls from other threads are handed to it.
+_pw = None
+_browser = None
+_jobs = queue.Queue()
+_thread = None
+_thread_lock = threading.Lock()
+
+
+def _browser_thread_loop():
+    while True:
+        job = _jobs.get()
+        if job is None:
+            return
+        fut, fn, args, kwargs = job
+        if not fut.set_running_or_notify_cancel():
+            continue
+        try:
+            fut.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            fut.set_exception(e)
+
+
+def _submit(fn, *args, **kwargs) -> Future:
+    """Queue fn to run on the browser thread (started on first use)."""
+    global _thread
+    with _thread_lock:
+        if _thread is None:
+            _thread = threading.Thread(target=_browser_thread_loop, name="official-sites-browser", daemon=True)
+            _thread.start()
+    fut = Future()
+    _jobs.put((fut, fn, args, kwargs))
+    return fut
+
+
+def _on_browser_thread(fn):
+    """Run the decorated scraper on the browser thread and wait for it."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if threading.current_thread() is _thread:
+            return fn(*args, **kwargs)
+        return _submit(fn, *args, **kwargs).result()
+    return wrapper
+
+
+def _get_browser():
+    """Launch Chromium once; relaunch only if it crashed or disconnected."""
+    global _pw, _browser
+    if _browser is None or not _browser.is_connected():
+        if _pw is None:
+            _pw = sync_playwright().start()
+        _browser = _pw.chromium.launch(headless=True, args=LAUNCH_ARGS)
+    return _browser
+
+
+def _shutdown():
+    global _pw, _browser
+    try:
+        if _browser is not None:
+            _browser.close()
+        if _pw is not None:
+            _pw.stop()
+    finally:
+        _pw = _browser = None
+
+
+@atexit.register
+def _close_browser():
+    if _thread is None:
+        return
+    try:
+        _submit(_shutdown).result(SHUTDOWN_TIMEOUT)
+    except Exception:
+        pass
+    finally:
+        _jobs.put(None)
+
+
+def _block_heavy(route):
+    request = route.request
+    if request.resource_type in BLOCKED_TYPES or BLOCKED_URL_RE.search(request.url):
+        route.abort()
+    else:
+        route.continue_()
+
+
+class _BrowserLease:
+    """
+    Stand-in for a Browser inside one scraper.
+
+    new_context()/new_page() open contexts on the shared browser (with
+    heavy resources blocked); close() closes just those contexts and
+    leaves the browser running.
+    """
+
+    def __init__(self, browser):
+        self._browser = browser
+        self._contexts = []
+
+    def new_context(self, **kwargs):
+        ctx = self._browser.new_context(**kwargs)
+        self._contexts.append(ctx)
+        ctx.route('**/*', _block_heavy)
+        return ctx
+
+    def new_page(self, **kwargs):
+        return self.new_context(**kwargs).new_page()
+
+    def close(self):
+        while self._contexts:
+            try:
+                self._contexts.pop().close()
+            except Exception:
+                pass
+
+
+@contextmanager
+def _shared_browser():
+    """Yield a _BrowserLease on the shared browser (call on the browser thread)."""
+    lease = _BrowserLease(_get_browser())
+    try:
+        yield lease
+    finally:
+        lease.close()
+
+
+_GS_ROLE_ID_RE = re.compile(r'/roles/(\d+)')
 
 INDIA_CITIES = ['India', 'Bengaluru', 'Bangalore', 'Mumbai', 'Hyderabad', 'Pune', 
                 'Chennai', 'Gurgaon', 'Gurugram', 'Noida', 'Delhi', 'Kolkata']
@@ -54,6 +196,7 @@ def _extract_jobs_from_text(body: str, max_jobs: int = 100) -> List[dict]:
     return jobs
 
 
+@_on_browser_thread
 def fetch_goldman_sachs(max_jobs: int = 100) -> List[dict]:
     """Scrape Goldman Sachs from higher.gs.com."""
     if not PLAYWRIGHT_AVAILABLE:
@@ -62,8 +205,7 @@ def fetch_goldman_sachs(max_jobs: int = 100) -> List[dict]:
     jobs = []
     print("  Scraping higher.gs.com (official GS careers)...")
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+    with _shared_browser() as browser:
         context = browser.new_context(
             user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             viewport={'width': 1920, 'height': 1080}
@@ -96,13 +238,14 @@ def fetch_goldman_sachs(max_jobs: int = 100) -> List[dict]:
                     if href.startswith('/'):
                         href = 'https://higher.gs.com' + href
                     
+                    role_id = _GS_ROLE_ID_RE.search(href)
                     jobs.append({
                         'title': text[:100],
                         'detail_url': href,
                         'location': 'India',
                         'posted': None,
                         'description': None,
-                        'req_id': re.search(r'/roles/(\d+)', href).group(1) if re.search(r'/roles/(\d+)', href) else None,
+                        'req_id': role_id.group(1) if role_id else None,
                         'source': 'Goldman Sachs Official'
                     })
                 except:
@@ -118,6 +261,7 @@ def fetch_goldman_sachs(max_jobs: int = 100) -> List[dict]:
     return jobs
 
 
+@_on_browser_thread
 def fetch_barclays(max_jobs: int = 100) -> List[dict]:
     """Scrape Barclays from search.jobs.barclays."""
     if not PLAYWRIGHT_AVAILABLE:
@@ -126,8 +270,7 @@ def fetch_barclays(max_jobs: int = 100) -> List[dict]:
     jobs = []
     print("  Scraping search.jobs.barclays (official Barclays careers)...")
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+    with _shared_browser() as browser:
         context = browser.new_context(
             user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             viewport={'width': 1920, 'height': 1080}
@@ -180,6 +323,7 @@ def fetch_barclays(max_jobs: int = 100) -> List[dict]:
     return jobs
 
 
+@_on_browser_thread
 def fetch_jpmorgan_india(max_jobs: int = 100) -> List[dict]:
     """Scrape JPMorgan from Oracle HCM."""
     if not PLAYWRIGHT_AVAILABLE:
@@ -188,8 +332,7 @@ def fetch_jpmorgan_india(max_jobs: int = 100) -> List[dict]:
     jobs = []
     print("  Scraping jpmc.fa.oraclecloud.com (official JPMorgan careers)...")
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+    with _shared_browser() as browser:
         context = browser.new_context(
             user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             viewport={'width': 1920, 'height': 1080}
@@ -254,6 +397,7 @@ def fetch_jpmorgan_india(max_jobs: int = 100) -> List[dict]:
     return jobs
 
 
+@_on_browser_thread
 def fetch_morgan_stanley(max_jobs: int = 100) -> List[dict]:
     """Scrape Morgan Stanley from Eightfold AI platform."""
     if not PLAYWRIGHT_AVAILABLE:
@@ -262,8 +406,7 @@ def fetch_morgan_stanley(max_jobs: int = 100) -> List[dict]:
     jobs = []
     print("  Scraping morganstanley.eightfold.ai...")
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+    with _shared_browser() as browser:
         page = browser.new_page()
         
         try:
@@ -304,6 +447,7 @@ def fetch_morgan_stanley(max_jobs: int = 100) -> List[dict]:
     return jobs
 
 
+@_on_browser_thread
 def fetch_hsbc(max_jobs: int = 100) -> List[dict]:
     """Scrape HSBC careers - IMPROVED."""
     if not PLAYWRIGHT_AVAILABLE:
@@ -312,8 +456,7 @@ def fetch_hsbc(max_jobs: int = 100) -> List[dict]:
     jobs = []
     print("  Scraping mycareer.hsbc.com (IMPROVED)...")
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+    with _shared_browser() as browser:
         context = browser.new_context(
             user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             viewport={'width': 1920, 'height': 1080}
@@ -391,6 +534,7 @@ def fetch_hsbc(max_jobs: int = 100) -> List[dict]:
     return jobs
 
 
+@_on_browser_thread
 def fetch_citi(max_jobs: int = 100) -> List[dict]:
     """Scrape Citi careers - IMPROVED."""
     if not PLAYWRIGHT_AVAILABLE:
@@ -399,8 +543,7 @@ def fetch_citi(max_jobs: int = 100) -> List[dict]:
     jobs = []
     print("  Scraping jobs.citi.com (IMPROVED)...")
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+    with _shared_browser() as browser:
         context = browser.new_context(
             user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             viewport={'width': 1920, 'height': 1080}
@@ -464,6 +607,7 @@ def fetch_citi(max_jobs: int = 100) -> List[dict]:
     return jobs
 
 
+@_on_browser_thread
 def fetch_nomura(max_jobs: int = 100) -> List[dict]:
     """Scrape Nomura careers (BrassRing)."""
     if not PLAYWRIGHT_AVAILABLE:
@@ -472,8 +616,7 @@ def fetch_nomura(max_jobs: int = 100) -> List[dict]:
     jobs = []
     print("  Scraping careers.nomura.com...")
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+    with _shared_browser() as browser:
         page = browser.new_page()
         
         try:
@@ -518,6 +661,7 @@ def fetch_nomura(max_jobs: int = 100) -> List[dict]:
     return jobs
 
 
+@_on_browser_thread
 def fetch_deutsche_bank(max_jobs: int = 100) -> List[dict]:
     """Scrape Deutsche Bank careers."""
     if not PLAYWRIGHT_AVAILABLE:
@@ -526,8 +670,7 @@ def fetch_deutsche_bank(max_jobs: int = 100) -> List[dict]:
     jobs = []
     print("  Scraping careers.db.com...")
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+    with _shared_browser() as browser:
         page = browser.new_page()
         
         try:
@@ -598,6 +741,7 @@ def fetch_deutsche_bank(max_jobs: int = 100) -> List[dict]:
     return jobs
 
 
+@_on_browser_thread
 def fetch_wells_fargo(max_jobs: int = 100) -> List[dict]:
     """Scrape Wells Fargo careers."""
     if not PLAYWRIGHT_AVAILABLE:
@@ -606,8 +750,7 @@ def fetch_wells_fargo(max_jobs: int = 100) -> List[dict]:
     jobs = []
     print("  Scraping wellsfargojobs.com...")
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+    with _shared_browser() as browser:
         page = browser.new_page()
         
         try:
@@ -667,6 +810,7 @@ def fetch_wells_fargo(max_jobs: int = 100) -> List[dict]:
     return jobs
 
 
+@_on_browser_thread
 def fetch_blackrock(max_jobs: int = 100) -> List[dict]:
     """Scrape BlackRock careers."""
     if not PLAYWRIGHT_AVAILABLE:
@@ -675,8 +819,7 @@ def fetch_blackrock(max_jobs: int = 100) -> List[dict]:
     jobs = []
     print("  Scraping careers.blackrock.com...")
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+    with _shared_browser() as browser:
         page = browser.new_page()
         
         try:
@@ -729,6 +872,7 @@ def fetch_blackrock(max_jobs: int = 100) -> List[dict]:
     return jobs
 
 
+@_on_browser_thread
 def fetch_ubs(max_jobs: int = 100) -> List[dict]:
     """Scrape UBS careers."""
     if not PLAYWRIGHT_AVAILABLE:
@@ -737,8 +881,7 @@ def fetch_ubs(max_jobs: int = 100) -> List[dict]:
     jobs = []
     print("  Scraping ubs.com/careers...")
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+    with _shared_browser() as browser:
         page = browser.new_page()
         
         try:
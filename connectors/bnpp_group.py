@@ -5,13 +5,21 @@ Handles group.bnpparibas career pages.
 """
 from typing import List
 import requests
+import soupsieve as sv
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 
+from connectors._http import canon_url, make_session
+
 
 HDRS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124 Safari/537.36"
 }
+_SESSION = make_session(HDRS)
+
+# Compiled once instead of per job link
+_LINK_SEL = sv.compile("a[href*='/job-offer/'], a[href*='/en/job/']")
+_LOC_SEL = sv.compile(".job__item__location, .location, [class*='location']")
 
 
 def fetch(india_landing_url: str, max_pages: int = 3) -> List[dict]:
@@ -26,15 +34,15 @@ def fetch(india_landing_url: str, max_pages: int = 3) -> List[dict]:
         List of job dicts
     """
     try:
-        r = requests.get(india_landing_url, headers=HDRS, timeout=45)
+        r = _SESSION.get(india_landing_url, timeout=45)
         if not r.ok:
             print(f"  BNPP returned status {r.status_code}")
             return []
         
-        soup = BeautifulSoup(r.text, "html.parser")
-        out, seen = [], set()
+        soup = BeautifulSoup(r.text, "lxml")
+        out = {}
         
-        for a in soup.select("a[href*='/job-offer/'], a[href*='/en/job/']"):
+        for a in _LINK_SEL.select(soup):
             title = a.get_text(" ", strip=True)
             href = a.get("href") or ""
             
@@ -45,29 +53,30 @@ def fetch(india_landing_url: str, max_pages: int = 3) -> List[dict]:
             if href.startswith("/"):
                 href = urljoin(india_landing_url, href)
             
+            # One row per canonical URL (tracking-param variants collapse); checked
+            # before the location lookup so duplicates skip it
+            key = canon_url(href)
+            if key in out:
+                continue
+
             # Try to find location nearby
             loc = None
             parent = a.find_parent("article") or a.parent
             if parent:
-                el = parent.select_one(".job__item__location, .location, [class*='location']")
+                el = _LOC_SEL.select_one(parent)
                 if el:
                     loc = el.get_text(" ", strip=True)
             
-            key = (title, href)
-            if key in seen:
-                continue
-            seen.add(key)
-            
-            out.append({
+            out[key] = {
                 "title": title,
                 "location": loc or "India",
                 "detail_url": href,
                 "description": None,
                 "req_id": None,
                 "posted": None,
-            })
+            }
         
-        return out
+        return list(out.values())
         
     except requests.exceptions.RequestException as e:
         print(f"  BNPP request error: {e}")
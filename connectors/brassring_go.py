@@ -6,9 +6,12 @@ Supports career sites using IBM BrassRing platform.
 import re
 from typing import Optional, List
 import requests
+import soupsieve as sv
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 
+from connectors._http import canon_url, make_session
+
 
 HDRS = {
     "User-Agent": (
@@ -17,6 +20,7 @@ HDRS = {
         "Chrome/124.0 Safari/537.36"
     )
 }
+_SESSION = make_session(HDRS)
 
 CITY_HINTS = [
     "Mumbai", "Bengaluru", "Bangalore", "Pune", "Hyderabad", "Chennai",
@@ -24,6 +28,11 @@ CITY_HINTS = [
     "Ahmedabad", "Kochi", "Cochin", "Coimbatore", "Jaipur", "Indore", "Surat"
 ]
 
+# Compiled once instead of per page / job card
+_ANCHOR_SEL = sv.compile("a[href*='/job/']")
+_LOC_SEL = sv.compile(".jobLocation, .job-location, .location, [data-ph-at-text='location']")
+_LOCATION_LABEL_RE = re.compile(r"Location", re.I)
+
 
 def _looks_india_collection(url: str, html: str) -> bool:
     """Check if page is India-focused."""
@@ -31,7 +40,7 @@ def _looks_india_collection(url: str, html: str) -> bool:
         return True
     
     try:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         h = soup.find(["h1", "h2", "title"])
         if h and re.search(r"\bIndia\b", h.get_text(" ", strip=True), re.I):
             return True
@@ -62,7 +71,7 @@ def _nearest_location(node) -> Optional[str]:
         return None
     
     # Try common BrassRing markup
-    loc_el = node.select_one(".jobLocation, .job-location, .location, [data-ph-at-text='location']")
+    loc_el = _LOC_SEL.select_one(node)
     if loc_el:
         return loc_el.get_text(" ", strip=True)
 
@@ -71,7 +80,7 @@ def _nearest_location(node) -> Optional[str]:
     for _ in range(3):
         if not parent:
             break
-        label = parent.find(string=re.compile(r"Location", re.I))
+        label = parent.find(string=_LOCATION_LABEL_RE)
         if label and label.parent:
             txt = label.parent.get_text(" ", strip=True)
             # Check for city-like content
@@ -84,22 +93,21 @@ def _nearest_location(node) -> Optional[str]:
 
 def _parse_brassring_go(html: str, base_url: str, force_india: bool) -> List[dict]:
     """Parse job listings from BrassRing GO page."""
-    soup = BeautifulSoup(html, "html.parser")
-    jobs = []
-    seen = set()
+    soup = BeautifulSoup(html, "lxml")
+    jobs = {}
     
     # FIX: Build selector dynamically instead of hardcoding Nomura
     company = _extract_company_from_url(base_url)
     
-    # Build selector patterns
-    selectors = ["a[href*='/job/']"]
+    # Location per card container, so anchors sharing a container
+    # don't each rescan its subtree
+    loc_by_container = {}
+
+    # One pass over the page; the company's own job links go first
+    anchors = _ANCHOR_SEL.select(soup)
     if company:
-        selectors.insert(0, f"a[href*='/{company}/job/']")
-    
-    # Find all matching anchors
-    anchors = []
-    for sel in selectors:
-        anchors.extend(soup.select(sel))
+        own = f"/{company}/job/"
+        anchors.sort(key=lambda a: own not in (a.get("href") or ""))
 
     for a in anchors:
         title = a.get_text(" ", strip=True)
@@ -112,32 +120,38 @@ def _parse_brassring_go(html: str, base_url: str, force_india: bool) -> List[dic
         if href.startswith("/"):
             href = urljoin(base_url, href)
 
+        # One row per canonical URL (tracking-param variants collapse); checked
+        # before the location lookup so duplicates skip it
+        key = canon_url(href)
+        if key in jobs:
+            continue
+
         # Find nearby location
         container = a
         for _ in range(2):
             if container and container.name not in ("li", "article", "div"):
                 container = container.parent
-        loc = _nearest_location(container) if container else None
+        loc = None
+        if container:
+            cid = id(container)
+            if cid not in loc_by_container:
+                loc_by_container[cid] = _nearest_location(container)
+            loc = loc_by_container[cid]
 
         # Fallback: if this is the India collection and no loc found
         if not loc and force_india:
             loc = "India"
 
-        key = (title, href)
-        if key in seen:
-            continue
-        seen.add(key)
-
-        jobs.append({
+        jobs[key] = {
             "title": title,
             "location": loc,
             "detail_url": href,
             "description": None,
             "req_id": None,
             "posted": None,
-        })
+        }
 
-    return jobs
+    return list(jobs.values())
 
 
 def fetch(go_page_url: str, max_pages: int = 6) -> List[dict]:
@@ -155,7 +169,7 @@ def fetch(go_page_url: str, max_pages: int = 6) -> List[dict]:
         List of job dicts
     """
     try:
-        r = requests.get(go_page_url, headers=HDRS, timeout=45)
+        r = _SESSION.get(go_page_url, timeout=45)
         if not r.ok:
             print(f"  BrassRing returned status {r.status_code}")
             return []
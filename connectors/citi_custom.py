@@ -7,57 +7,71 @@ import re
 import time
 from typing import Optional, List
 import requests
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
+from connectors._http import canon_url, make_session
+
 
 HDRS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124 Safari/537.36"
 }
 
+# Compiled once instead of per job link
+_LINK_SEL = sv.compile("a[href*='/job/'], a[href*='/jobs/']")
+_LOC_SEL = sv.compile(".job-location, .location, [data-ph-at-text='location']")
+
+_SESSION = make_session(HDRS)
+
+_INDIA_COLLECTION_RE = re.compile(r"/search-jobs/India/", re.I)
+_PAGE_PARAM_RE = re.compile(r"([?&])page=\d+")
+
 
 def _is_india_collection(url: str) -> bool:
     """Check if URL is for India jobs."""
-    return bool(re.search(r"/search-jobs/India/", url, re.I)) or "locationsearch=india" in url.lower()
+    return bool(_INDIA_COLLECTION_RE.search(url)) or "locationsearch=india" in url.lower()
 
 
 def _parse(html: str, base: str, force_india: bool) -> List[dict]:
     """Parse job listings from HTML."""
-    soup = BeautifulSoup(html, "html.parser")
-    out, seen = [], set()
+    soup = BeautifulSoup(html, "lxml")
+    out = {}
     
-    for a in soup.select("a[href*='/job/'], a[href*='/jobs/']"):
+    for a in _LINK_SEL.select(soup):
         title = a.get_text(" ", strip=True)
         href = a.get("href") or ""
         
         if not title or not href:
             continue
         
+        # One row per canonical URL (tracking-param variants collapse); checked
+        # before the location lookup so duplicates skip it
+        k = canon_url(href)
+        if k in out:
+            continue
+
         # Find parent container for location
-        li = a.find_parent("li") or a.find_parent("article") or a.parent
+        # Closest card ancestor in one walk up the tree
+        li = a.find_parent(["li", "article"]) or a.parent
         loc = None
         if li:
-            loc_el = li.select_one(".job-location, .location, [data-ph-at-text='location']")
+            loc_el = _LOC_SEL.select_one(li)
             if loc_el:
                 loc = loc_el.get_text(" ", strip=True)
         
         if not loc and force_india:
             loc = "India"
         
-        k = (title, href)
-        if k in seen:
-            continue
-        seen.add(k)
-        
-        out.append({
+        out[k] = {
             "title": title,
             "location": loc,
             "detail_url": href,
             "description": None,
             "req_id": None,
             "posted": None,
-        })
+        }
     
-    return out
+    return list(out.values())
 
 
 def fetch(india_base_url: str, max_pages: int = 10) -> List[dict]:
@@ -78,13 +92,13 @@ def fetch(india_base_url: str, max_pages: int = 10) -> List[dict]:
     for p in range(1, max_pages + 1):
         # Build URL with page parameter
         if "page=" in base:
-            url = re.sub(r"([?&])page=\d+", rf"\g<1>page={p}", base)
+            url = _PAGE_PARAM_RE.sub(rf"\g<1>page={p}", base)
         else:
             sep = "&" if "?" in base else "?"
             url = f"{base}{sep}page={p}"
         
         try:
-            r = requests.get(url, headers=HDRS, timeout=45)
+            r = _SESSION.get(url, timeout=45)
             if not r.ok:
                 print(f"  Citi returned status {r.status_code} on page {p}")
                 break
@@ -10,16 +10,28 @@ from urllib.parse import urljoin, urlparse
 import requests
 from bs4 import BeautifulSoup
 
+from connectors._http import make_session
+
 
 HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36"}
 REQ_TIMEOUT = 25
+_SESSION = make_session(HEADERS)
+
+# Compiled once instead of per card / element / page
+INDIA_CITIES = [
+    "India", "Mumbai", "Bengaluru", "Bangalore", "Hyderabad",
+    "Pune", "Chennai", "Gurugram", "Gurgaon", "Noida"
+]
+_INDIA_CITY_RE = re.compile(r"\b(" + "|".join(INDIA_CITIES) + r")\b", re.I)
+_LOCATION_LABEL_RE = re.compile(r"Location\s*[:\-]\s*([A-Za-z ,\-]+)", re.I)
+_DATE_RE = re.compile(r"\b(\d{1,2}\s+[A-Za-z]{3}|\d{1,2}/\d{2}/\d{4})\b")
 
 
 def _soup(url: str) -> BeautifulSoup:
     """Fetch URL and return BeautifulSoup object."""
-    r = requests.get(url, headers=HEADERS, timeout=REQ_TIMEOUT)
+    r = _SESSION.get(url, timeout=REQ_TIMEOUT)
     r.raise_for_status()
-    return BeautifulSoup(r.text, "html.parser")
+    return BeautifulSoup(r.text, "lxml")
 
 
 def _next_page_url(current_url: str, next_page_number: int) -> str:
@@ -37,18 +49,12 @@ def _next_page_url(current_url: str, next_page_number: int) -> str:
 
 def _extract_card_location(card) -> Optional[str]:
     """Try to extract location from job card."""
-    india_cities = [
-        "India", "Mumbai", "Bengaluru", "Bangalore", "Hyderabad",
-        "Pune", "Chennai", "Gurugram", "Gurgaon", "Noida"
-    ]
-    
     for sel in ["span", "div", "p"]:
         for el in card.find_all(sel):
             txt = el.get_text(" ", strip=True)
             if not txt:
                 continue
-            pattern = r"\b(" + "|".join(india_cities) + r")\b"
-            if re.search(pattern, txt, re.I):
+            if _INDIA_CITY_RE.search(txt):
                 return txt
     return None
 
@@ -58,17 +64,12 @@ def _extract_detail_location(soup: BeautifulSoup) -> Optional[str]:
     text = soup.get_text(" ", strip=True)
     
     # Try to find "Location: X" pattern
-    m = re.search(r"Location\s*[:\-]\s*([A-Za-z ,\-]+)", text, re.I)
+    m = _LOCATION_LABEL_RE.search(text)
     if m:
         return m.group(1).strip()
     
     # Fallback: look for common city names
-    india_cities = [
-        "Mumbai", "Bengaluru", "Bangalore", "Hyderabad",
-        "Pune", "Chennai", "Gurugram", "Gurgaon", "Noida", "India"
-    ]
-    pattern = r"\b(" + "|".join(india_cities) + r")\b"
-    m2 = re.search(pattern, text, re.I)
+    m2 = _INDIA_CITY_RE.search(text)
     return m2.group(0) if m2 else None
 
 
@@ -109,7 +110,7 @@ def fetch(endpoint_url: str, max_pages: int = 3) -> List[dict]:
                 nxt, hops = a.find_next(string=True), 0
                 while nxt and hops < 15:
                     txt = (nxt.strip() if isinstance(nxt, str) else "").strip()
-                    if re.search(r"\b(\d{1,2}\s+[A-Za-z]{3}|\d{1,2}/\d{2}/\d{4})\b", txt):
+                    if _DATE_RE.search(txt):
                         date_live = txt
                         break
                     nxt = nxt.next_element
@@ -4,11 +4,15 @@ Generic static page scraper for career sites.
 Handles sites that don't require JavaScript rendering.
 """
 import time
+from functools import lru_cache
 from typing import Optional, List, Dict
 import requests
+import soupsieve as sv
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 
+from connectors._http import job_key, make_session
+
 
 HDRS = {
     "User-Agent": (
@@ -17,6 +21,38 @@ HDRS = {
     )
 }
 
+_SESSION = make_session(HDRS)
+
+
+def _row(title, href, loc, posted, base_url, force_india) -> Optional[dict]:
+    """Normalize one extracted card into a job dict (None if unusable)."""
+    if href.startswith("/"):
+        href = urljoin(base_url, href)
+    if not title or not href:
+        return None
+    if not loc and force_india:
+        loc = "India"
+    return {
+        "title": title,
+        "location": loc,
+        "detail_url": href,
+        "description": None,
+        "req_id": None,
+        "posted": posted,
+    }
+
+
+@lru_cache(maxsize=64)
+def _compiled(card: str, title: str, link: str, loc: Optional[str], posted: Optional[str]):
+    """Compiled selectors for a site, shared by all its pages and runs."""
+    return (
+        sv.compile(card),
+        sv.compile(title),
+        sv.compile(link),
+        sv.compile(loc) if loc else None,
+        sv.compile(posted) if posted else None,
+    )
+
 
 def _extract_from_html(
     html: str,
@@ -36,61 +72,48 @@ def _extract_from_html(
     Returns:
         List of job dicts
     """
-    soup = BeautifulSoup(html, "html.parser")
-    out, seen = [], set()
+    soup = BeautifulSoup(html, "lxml")
+    out = {}
     
-    card_sel = sel["card"]
-    title_sel = sel.get("title") or "a"
-    link_sel = sel.get("link") or "a"
-    loc_sel = sel.get("location")
-    posted_sel = sel.get("posted")
-
-    for card in soup.select(card_sel):
-        a = card.select_one(link_sel)
+    # Compile the per-card selectors once per site rather than on every select_one
+    title_str = sel.get("title") or "a"
+    link_str = sel.get("link") or "a"
+    card_sel, title_sel, link_sel, loc_sel, posted_sel = _compiled(
+        sel["card"], title_str, link_str, sel.get("location"), sel.get("posted")
+    )
+    # Same selector for title and link: the link element is the title
+    same_title = title_str == link_str
+
+    for card in card_sel.select(soup):
+        a = link_sel.select_one(card)
         if not a:
             continue
-        
-        href = a.get("href") or ""
-        if href.startswith("/"):
-            href = urljoin(base_url, href)
-        
-        title_el = card.select_one(title_sel) or a
+
+        title_el = a if same_title else (title_sel.select_one(card) or a)
         title = title_el.get_text(" ", strip=True) if title_el else None
-        
-        if not title or not href:
-            continue
 
         # Extract location
         loc = None
         if loc_sel:
-            loc_el = card.select_one(loc_sel)
+            loc_el = loc_sel.select_one(card)
             if loc_el:
                 loc = loc_el.get_text(" ", strip=True)
-        if not loc and force_india:
-            loc = "India"
 
         # Extract posted date
         posted = None
         if posted_sel:
-            p = card.select_one(posted_sel)
+            p = posted_sel.select_one(card)
             if p:
                 posted = p.get_text(" ", strip=True)
 
-        key = (title, href)
-        if key in seen:
+        row = _row(title, a.get("href") or "", loc, posted, base_url, force_india)
+        if not row:
             continue
-        seen.add(key)
-
-        out.append({
-            "title": title,
-            "location": loc,
-            "detail_url": href,
-            "description": None,
-            "req_id": None,
-            "posted": posted,
-        })
+
+        # First card wins for each canonical URL
+        out.setdefault(job_key(row["detail_url"], row["title"], base_url), row)
     
-    return out
+    return list(out.values())
 
 
 def fetch(
@@ -127,7 +150,7 @@ def fetch(
             page_url = f"{base}{sep}{page_param}={page}"
 
         try:
-            r = requests.get(page_url, headers=HDRS, timeout=45)
+            r = _SESSION.get(page_url, timeout=45)
             if not r.ok:
                 print(f"  Direct site returned status {r.status_code} on page {page}")
                 break
@@ -11,9 +11,17 @@ from urllib.parse import urljoin, urlparse, parse_qs, urlencode
 import requests
 from bs4 import BeautifulSoup
 
+from connectors._http import make_session
+
 
 HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36"}
 REQ_TIMEOUT = 25
+_SESSION = make_session(HEADERS)
+
+# Compiled once instead of per anchor / role
+_ROLE_PATH_RE = re.compile(r"^/roles/\d+")
+_ROLE_ID_RE = re.compile(r"/roles/(\d+)")
+_INDIA_RE = re.compile(r"India", re.I)
 
 
 def _with_page(url: str, page: int) -> str:
@@ -27,9 +35,9 @@ def _with_page(url: str, page: int) -> str:
 
 def _soup(url: str) -> BeautifulSoup:
     """Fetch URL and return BeautifulSoup."""
-    r = requests.get(url, headers=HEADERS, timeout=REQ_TIMEOUT)
+    r = _SESSION.get(url, timeout=REQ_TIMEOUT)
     r.raise_for_status()
-    return BeautifulSoup(r.text, "html.parser")
+    return BeautifulSoup(r.text, "lxml")
 
 
 def _from_json_ld(soup: BeautifulSoup) -> Optional[dict]:
@@ -118,7 +126,7 @@ def fetch(endpoint_url: str, max_pages: int = 3) -> List[dict]:
             # Role links look like /roles/<id>
             for a in soup.find_all("a", href=True):
                 href = a["href"]
-                if not re.match(r"^/roles/\d+", href):
+                if not _ROLE_PATH_RE.match(href):
                     continue
                     
                 role_url = urljoin(base, href)
@@ -150,14 +158,14 @@ def fetch(endpoint_url: str, max_pages: int = 3) -> List[dict]:
 
                 # Fallback location extraction
                 if not location:
-                    hero = dsoup.find(string=re.compile(r"India", re.I))
+                    hero = dsoup.find(string=_INDIA_RE)
                     if hero:
                         location = _guess_location(hero.parent.get_text(" ", strip=True))
                     if not location:
                         location = _guess_location(dsoup.get_text(" ", strip=True))
 
                 # Extract req_id from URL
-                m = re.search(r"/roles/(\d+)", role_url)
+                m = _ROLE_ID_RE.search(role_url)
                 req_id = m.group(1) if m else None
 
                 out.append({
@@ -6,18 +6,26 @@ Supports companies using Greenhouse's public API.
 Greenhouse API returns job listings in a standardized JSON format.
 This is one of the most reliable job scraping methods.
 """
-import time
+import re
 from typing import List, Optional
 import requests
 
+from connectors._http import make_session, request_with_retry, ttl_cache
+
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Accept": "application/json",
 }
 REQ_TIMEOUT = 30
+_SESSION = make_session(HEADERS, retry_statuses=False)
+
+# Basic HTML-to-text for descriptions, compiled once rather than per job
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
 
 
+@ttl_cache()
 def fetch(endpoint_url: str, max_pages: int = 1) -> List[dict]:
     """
     Fetch jobs from Greenhouse API endpoint.
@@ -42,7 +50,7 @@ def fetch(endpoint_url: str, max_pages: int = 1) -> List[dict]:
     
     try:
         print(f"    Fetching: {endpoint_url}")
-        r = requests.get(endpoint_url, headers=HEADERS, timeout=REQ_TIMEOUT)
+        r = request_with_retry("GET", endpoint_url, session=_SESSION, timeout=REQ_TIMEOUT)
         
         if r.status_code == 404:
             print(f"    Company not found on Greenhouse")
@@ -72,9 +80,8 @@ def fetch(endpoint_url: str, max_pages: int = 1) -> List[dict]:
             # Get description (HTML content)
             content = j.get("content") or ""
             # Strip HTML for plain text (basic)
-            import re
-            desc = re.sub(r'<[^>]+>', ' ', content)
-            desc = re.sub(r'\s+', ' ', desc).strip()[:2000]
+            desc = _TAG_RE.sub(' ', content)
+            desc = _WS_RE.sub(' ', desc).strip()[:2000]
             
             req_id = str(j.get("id")) if j.get("id") else None
             
@@ -87,8 +94,6 @@ def fetch(endpoint_url: str, max_pages: int = 1) -> List[dict]:
                 "req_id": req_id,
             })
         
-        time.sleep(0.3)
-        
     except requests.exceptions.HTTPError as e:
         print(f"    Greenhouse HTTP error: {e}")
     except requests.exceptions.RequestException as e:
@@ -3,8 +3,12 @@
 Improved scrapers for problematic sites.
 Uses advanced techniques to bypass anti-bot protection.
 """
-from typing import List
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+import queue
 import re
+import threading
 import time
 import json
 
@@ -14,8 +18,78 @@ try:
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
+# Resource types never read by the scrapers below; stylesheets stay on
+# because fetch_blackrock_improved splits page.inner_text('body') into lines
+from connectors._browser_pool import LAYOUT_SAFE_BLOCKED_RESOURCES as BLOCKED_RESOURCES
 
-def fetch_hsbc_improved(max_jobs: int = 50) -> List[dict]:
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+VIEWPORT = {'width': 1920, 'height': 1080}
+
+
+class _PWSession:
+    """
+    One browser context shared by all improved scrapers.
+    
+    Pages come from the same context, so a cookie banner accepted on the
+    first visit to a host stays accepted for every later page on it.
+    """
+    
+    def __init__(self, pw, browser):
+        self.pw = pw
+        self.browser = browser
+        self.ctx = browser.new_context(user_agent=USER_AGENT, viewport=VIEWPORT)
+        self.ctx.route('**/*', lambda route: route.abort()
+                       if route.request.resource_type in BLOCKED_RESOURCES
+                       else route.continue_())
+        self._consented = set()
+    
+    def page(self):
+        """Open a new page in the shared context."""
+        return self.ctx.new_page()
+    
+    def accept_cookies(self, page, selector: str, wait_ms: int = 2000):
+        """Click the consent button once per host; later pages reuse the cookie."""
+        host = urlparse(page.url).netloc
+        if host in self._consented:
+            return
+        try:
+            accept = page.query_selector(selector)
+            if accept:
+                accept.click()
+                page.wait_for_timeout(wait_ms)
+                self._consented.add(host)
+        except:
+            pass
+    
+    def close(self):
+        self.ctx.close()
+
+
+@contextmanager
+def pw_session():
+    """Launch Chromium and yield a _PWSession, closing both on exit."""
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        session = _PWSession(p, browser)
+        try:
+            yield session
+        finally:
+            session.close()
+            browser.close()
+
+
+@contextmanager
+def _session_scope(session: Optional[_PWSession]):
+    """Use the caller's session, or open a private one for a standalone call."""
+    if session is not None:
+        yield session
+    else:
+        with pw_session() as own:
+            yield own
+
+
+def fetch_hsbc_improved(max_jobs: int = 50, session: Optional[_PWSession] = None) -> List[dict]:
     """
     IMPROVED HSBC scraper using direct API approach.
     """
@@ -70,22 +144,21 @@ def fetch_hsbc_improved(max_jobs: int = 50) -> List[dict]:
         else:
             print(f"    API returned status {response.status_code}, falling back to browser")
             # Fallback to browser scraping
-            jobs = _hsbc_browser_fallback(max_jobs)
+            jobs = _hsbc_browser_fallback(max_jobs, session)
             
     except Exception as e:
         print(f"    API Error: {e}, trying browser fallback")
-        jobs = _hsbc_browser_fallback(max_jobs)
+        jobs = _hsbc_browser_fallback(max_jobs, session)
     
     return jobs
 
 
-def _hsbc_browser_fallback(max_jobs: int) -> List[dict]:
+def _hsbc_browser_fallback(max_jobs: int, session: Optional[_PWSession] = None) -> List[dict]:
     """Fallback for HSBC using browser."""
     jobs = []
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+    with _session_scope(session) as s:
+        page = s.page()
         
         try:
             # Try simpler URL
@@ -94,13 +167,7 @@ def _hsbc_browser_fallback(max_jobs: int) -> List[dict]:
             page.wait_for_timeout(10000)
             
             # Accept cookies
-            try:
-                accept = page.query_selector('#onetrust-accept-btn-handler')
-                if accept:
-                    accept.click()
-                    page.wait_for_timeout(2000)
-            except:
-                pass
+            s.accept_cookies(page, '#onetrust-accept-btn-handler', 2000)
             
             # Scroll to load jobs
             for _ in range(5):
@@ -131,12 +198,12 @@ def _hsbc_browser_fallback(max_jobs: int) -> List[dict]:
         except Exception as e:
             print(f"    Browser fallback error: {e}")
         finally:
-            browser.close()
+            page.close()
     
     return jobs
 
 
-def fetch_wells_fargo_improved(max_jobs: int = 50) -> List[dict]:
+def fetch_wells_fargo_improved(max_jobs: int = 50, session: Optional[_PWSession] = None) -> List[dict]:
     """
     IMPROVED Wells Fargo scraper.
     """
@@ -146,13 +213,8 @@ def fetch_wells_fargo_improved(max_jobs: int = 50) -> List[dict]:
     jobs = []
     print("  Scraping Wells Fargo (IMPROVED)...")
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            viewport={'width': 1920, 'height': 1080}
-        )
-        page = context.new_page()
+    with _session_scope(session) as s:
+        page = s.page()
         
         try:
             # Use search with India parameter
@@ -161,13 +223,7 @@ def fetch_wells_fargo_improved(max_jobs: int = 50) -> List[dict]:
             page.wait_for_timeout(10000)
             
             # Accept cookies
-            try:
-                accept = page.query_selector('#onetrust-accept-btn-handler, button:has-text("Accept")')
-                if accept:
-                    accept.click()
-                    page.wait_for_timeout(3000)
-            except:
-                pass
+            s.accept_cookies(page, '#onetrust-accept-btn-handler, button:has-text("Accept")', 3000)
             
             # Wait for jobs to load
             page.wait_for_timeout(5000)
@@ -207,12 +263,12 @@ def fetch_wells_fargo_improved(max_jobs: int = 50) -> List[dict]:
         except Exception as e:
             print(f"    Error: {e}")
         finally:
-            browser.close()
+            page.close()
     
     return jobs
 
 
-def fetch_deutsche_bank_improved(max_jobs: int = 50) -> List[dict]:
+def fetch_deutsche_bank_improved(max_jobs: int = 50, session: Optional[_PWSession] = None) -> List[dict]:
     """
     IMPROVED Deutsche Bank scraper.
     """
@@ -222,13 +278,8 @@ def fetch_deutsche_bank_improved(max_jobs: int = 50) -> List[dict]:
     jobs = []
     print("  Scraping Deutsche Bank (IMPROVED)...")
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-            viewport={'width': 1920, 'height': 1080}
-        )
-        page = context.new_page()
+    with _session_scope(session) as s:
+        page = s.page()
         
         try:
             # Direct search URL with India
@@ -237,13 +288,7 @@ def fetch_deutsche_bank_improved(max_jobs: int = 50) -> List[dict]:
             page.wait_for_timeout(10000)
             
             # Accept cookies
-            try:
-                accept = page.query_selector('[data-testid="uc-accept-all-button"], #onetrust-accept-btn-handler')
-                if accept:
-                    accept.click()
-                    page.wait_for_timeout(3000)
-            except:
-                pass
+            s.accept_cookies(page, '[data-testid="uc-accept-all-button"], #onetrust-accept-btn-handler', 3000)
             
             # Scroll
             for _ in range(5):
@@ -279,12 +324,12 @@ def fetch_deutsche_bank_improved(max_jobs: int = 50) -> List[dict]:
         except Exception as e:
             print(f"    Error: {e}")
         finally:
-            browser.close()
+            page.close()
     
     return jobs
 
 
-def fetch_blackrock_improved(max_jobs: int = 50) -> List[dict]:
+def fetch_blackrock_improved(max_jobs: int = 50, session: Optional[_PWSession] = None) -> List[dict]:
     """
     IMPROVED BlackRock scraper with better targeting.
     """
@@ -294,13 +339,8 @@ def fetch_blackrock_improved(max_jobs: int = 50) -> List[dict]:
     jobs = []
     print("  Scraping BlackRock (IMPROVED)...")
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-            viewport={'width': 1920, 'height': 1080}
-        )
-        page = context.new_page()
+    with _session_scope(session) as s:
+        page = s.page()
         
         try:
             # BlackRock India jobs
@@ -309,13 +349,7 @@ def fetch_blackrock_improved(max_jobs: int = 50) -> List[dict]:
             page.wait_for_timeout(10000)
             
             # Accept cookies
-            try:
-                accept = page.query_selector('#onetrust-accept-btn-handler')
-                if accept:
-                    accept.click()
-                    page.wait_for_timeout(3000)
-            except:
-                pass
+            s.accept_cookies(page, '#onetrust-accept-btn-handler', 3000)
             
             # Scroll to load jobs
             for _ in range(5):
@@ -351,12 +385,12 @@ def fetch_blackrock_improved(max_jobs: int = 50) -> List[dict]:
         except Exception as e:
             print(f"    Error: {e}")
         finally:
-            browser.close()
+            page.close()
     
     return jobs
 
 
-def fetch_ubs_improved(max_jobs: int = 50) -> List[dict]:
+def fetch_ubs_improved(max_jobs: int = 50, session: Optional[_PWSession] = None) -> List[dict]:
     """
     IMPROVED UBS scraper.
     """
@@ -366,13 +400,8 @@ def fetch_ubs_improved(max_jobs: int = 50) -> List[dict]:
     jobs = []
     print("  Scraping UBS (IMPROVED)...")
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-            viewport={'width': 1920, 'height': 1080}
-        )
-        page = context.new_page()
+    with _session_scope(session) as s:
+        page = s.page()
         
         try:
             # UBS Taleo system with India search
@@ -422,22 +451,91 @@ def fetch_ubs_improved(max_jobs: int = 50) -> List[dict]:
         except Exception as e:
             print(f"    Error: {e}")
         finally:
-            browser.close()
+            page.close()
     
     return jobs
 
 
+IMPROVED_SCRAPERS = {
+    'HSBC': fetch_hsbc_improved,
+    'Wells Fargo': fetch_wells_fargo_improved,
+    'Deutsche Bank': fetch_deutsche_bank_improved,
+    'BlackRock': fetch_blackrock_improved,
+    'UBS': fetch_ubs_improved,
+}
+
+RESULT_QUEUE_DEPTH = 4
+
+
+def fetch_all_improved(max_jobs: int = 50, workers: int = 3) -> Dict[str, List[dict]]:
+    """
+    Run all improved scrapers with their page loads overlapped.
+    
+    Producer threads each own a browser session and pull sites from a
+    task queue, so one site's goto/wait runs while another is scrolling
+    or extracting. Sync Playwright objects are bound to the thread that
+    created them, which is why extraction stays with the producer; only
+    finished results cross threads, through a bounded queue that caps
+    how much is held in memory.
+    
+    Args:
+        max_jobs: Max jobs per site
+        workers: Number of concurrent browser sessions
+        
+    Returns:
+        Dict mapping company name -> list of jobs
+    """
+    all_results = {name: [] for name in IMPROVED_SCRAPERS}
+    if not PLAYWRIGHT_AVAILABLE:
+        return all_results
+    
+    tasks = queue.Queue()
+    for item in IMPROVED_SCRAPERS.items():
+        tasks.put(item)
+    results = queue.Queue(maxsize=RESULT_QUEUE_DEPTH)
+    done = object()
+    
+    def producer():
+        try:
+            with pw_session() as session:
+                while True:
+                    try:
+                        name, fn = tasks.get_nowait()
+                    except queue.Empty:
+                        break
+                    try:
+                        jobs = fn(max_jobs, session=session)
+                    except Exception as e:
+                        print(f"    {name} error: {e}")
+                        jobs = []
+                    results.put((name, jobs))
+        except Exception as e:
+            print(f"    Browser session error: {e}")
+        finally:
+            results.put(done)
+    
+    n_workers = max(1, min(workers, len(IMPROVED_SCRAPERS)))
+    threads = [threading.Thread(target=producer, daemon=True) for _ in range(n_workers)]
+    for t in threads:
+        t.start()
+    
+    finished = 0
+    while finished < n_workers:
+        item = results.get()
+        if item is done:
+            finished += 1
+            continue
+        name, jobs = item
+        all_results[name] = jobs
+    
+    return all_results
+
+
 if __name__ == "__main__":
     # Test all improved scrapers
     print("Testing improved scrapers...\n")
     
-    all_results = {
-        'HSBC': fetch_hsbc_improved(20),
-        'Wells Fargo': fetch_wells_fargo_improved(20),
-        'Deutsche Bank': fetch_deutsche_bank_improved(20),
-        'BlackRock': fetch_blackrock_improved(20),
-        'UBS': fetch_ubs_improved(20),
-    }
+    all_results = fetch_all_improved(20)
     
     print("\n=== RESULTS ===")
     for company, jobs in all_results.items():
@@ -14,6 +14,71 @@ except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
 
+JOBS_URL = 'https://jpmc.fa.oraclecloud.com/hcmUI/CandidateExperience/en/sites/CX_1001/jobs'
+
+INDIA_CITIES = ['India', 'Bengaluru', 'Bangalore', 'Mumbai', 'Hyderabad', 'Pune', 'Chennai', 'Gurgaon', 'Gurugram', 'Noida', 'Delhi']
+_INDIA_RE = re.compile('|'.join(INDIA_CITIES))
+_JOB_ID_RE = re.compile(r'/job/(\d+)')
+
+# Oracle CX search result cards
+CARD_SELECTOR = 'li[data-qa="searchResultItem"]'
+
+# Pull every card's fields in one CDP round trip
+_CARDS_JS = """els => els.map(e => ({
+    title: (e.querySelector('.job-title, .job-tile__title, [data-qa="jobTitle"]')?.innerText || '').trim(),
+    loc: (e.querySelector('.job-location, .job-tile__subheader, [data-qa="jobLocation"]')?.innerText || '').trim(),
+    desc: (e.querySelector('.job-description, .job-tile__description')?.innerText || '').trim(),
+    href: e.querySelector('a[href]')?.href || ''
+}))"""
+
+
+def _parse_body_text(body: str, max_jobs: int) -> List[dict]:
+    """
+    Fallback parser over the page's visible text.
+    
+    Jobs appear in pattern: Title\nLocation\nCategory\nDescription
+    """
+    jobs = []
+    lines = [l.strip() for l in body.split('\n') if l.strip()]
+    
+    i = 0
+    while i < len(lines) - 1 and len(jobs) < max_jobs:
+        line = lines[i]
+        
+        # Skip navigation/UI text
+        if any(skip in line.lower() for skip in ['skip to', 'search jobs', 'find jobs', 'filter', 'posting date', 'categories', 'open jobs', 'near location', 'city, state']):
+            i += 1
+            continue
+        
+        # Check if this looks like a job title (reasonable length, not just location)
+        if 15 < len(line) < 150 and not _INDIA_RE.search(line):
+            # Check if next line is an India location
+            next_line = lines[i + 1]
+            if _INDIA_RE.search(next_line):
+                # Get description if available (usually 2-3 lines after)
+                description = ''
+                if i + 3 < len(lines):
+                    desc_line = lines[i + 3]
+                    if len(desc_line) > 50 and not _INDIA_RE.search(desc_line):
+                        description = desc_line[:500]
+                
+                jobs.append({
+                    'title': line,
+                    'location': next_line,
+                    'detail_url': JOBS_URL,
+                    'description': description,
+                    'posted': None,
+                    'req_id': None,
+                    'source': 'JPMorgan Official'
+                })
+                i += 3
+                continue
+        
+        i += 1
+    
+    return jobs
+
+
 def fetch_jpmorgan_india(max_jobs: int = 100) -> List[dict]:
     """
     Scrape jobs from JPMorgan official career site.
@@ -38,8 +103,7 @@ def fetch_jpmorgan_india(max_jobs: int = 100) -> List[dict]:
         page = context.new_page()
         
         try:
-            url = 'https://jpmc.fa.oraclecloud.com/hcmUI/CandidateExperience/en/sites/CX_1001/jobs'
-            page.goto(url, timeout=60000, wait_until='networkidle')
+            page.goto(JOBS_URL, timeout=60000, wait_until='networkidle')
             page.wait_for_timeout(8000)
             
             # Accept privacy notice
@@ -66,58 +130,37 @@ def fetch_jpmorgan_india(max_jobs: int = 100) -> List[dict]:
                 page.mouse.wheel(0, 1000)
                 page.wait_for_timeout(1000)
             
-            # Get page text
-            body = page.inner_text('body')
+            # Structured extraction: one evaluate over all result cards
+            records = page.locator(CARD_SELECTOR).evaluate_all(_CARDS_JS)
+            print(f"    Found {len(records)} result cards on JPMorgan")
             
-            # Find job count
-            count_match = re.search(r'(\d+)\s*(?:Open Jobs|OPEN JOBS)', body)
-            if count_match:
-                print(f"    Found {count_match.group(1)} total India jobs on JPMorgan")
-            
-            # Parse job listings from the text
-            # Jobs appear in pattern: Title\nLocation\nCategory\nDescription
-            lines = [l.strip() for l in body.split('\n') if l.strip()]
-            
-            india_cities = ['India', 'Bengaluru', 'Bangalore', 'Mumbai', 'Hyderabad', 'Pune', 'Chennai', 'Gurgaon', 'Gurugram', 'Noida', 'Delhi']
-            
-            i = 0
-            while i < len(lines) - 1 and len(jobs) < max_jobs:
-                line = lines[i]
-                
-                # Skip navigation/UI text
-                if any(skip in line.lower() for skip in ['skip to', 'search jobs', 'find jobs', 'filter', 'posting date', 'categories', 'open jobs', 'near location', 'city, state']):
-                    i += 1
+            for rec in records:
+                title = rec.get('title') or ''
+                location = rec.get('loc') or ''
+                if not title or not _INDIA_RE.search(location):
                     continue
                 
-                # Check if this looks like a job title (reasonable length, not just location)
-                if 15 < len(line) < 150 and not any(city in line for city in india_cities):
-                    # Check if next line is an India location
-                    if i + 1 < len(lines):
-                        next_line = lines[i + 1]
-                        if any(city in next_line for city in india_cities):
-                            title = line
-                            location = next_line
-                            
-                            # Get description if available (usually 2-3 lines after)
-                            description = ''
-                            if i + 3 < len(lines):
-                                desc_line = lines[i + 3]
-                                if len(desc_line) > 50 and not any(city in desc_line for city in india_cities):
-                                    description = desc_line[:500]
-                            
-                            jobs.append({
-                                'title': title,
-                                'location': location,
-                                'detail_url': 'https://jpmc.fa.oraclecloud.com/hcmUI/CandidateExperience/en/sites/CX_1001/jobs',
-                                'description': description,
-                                'posted': None,
-                                'req_id': None,
-                                'source': 'JPMorgan Official'
-                            })
-                            i += 3
-                            continue
-                
-                i += 1
+                href = rec.get('href') or JOBS_URL
+                match = _JOB_ID_RE.search(href)
+                jobs.append({
+                    'title': title,
+                    'location': location,
+                    'detail_url': href,
+                    'description': (rec.get('desc') or '')[:500],
+                    'posted': None,
+                    'req_id': match.group(1) if match else None,
+                    'source': 'JPMorgan Official'
+                })
+                if len(jobs) >= max_jobs:
+                    break
+            
+            # Markup changed or no cards rendered: fall back to the text scan
+            if not records:
+                body = page.inner_text('body')
+                count_match = re.search(r'(\d+)\s*(?:Open Jobs|OPEN JOBS)', body)
+                if count_match:
+                    print(f"    Found {count_match.group(1)} total India jobs on JPMorgan")
+                jobs = _parse_body_text(body, max_jobs)
             
             print(f"    Extracted {len(jobs)} jobs from page")
             
@@ -3,15 +3,17 @@
 Lever job postings API connector.
 Supports companies using Lever's public postings API.
 """
-import time
 from typing import List
 import requests
 
+from connectors._http import request_with_retry, ttl_cache
+
 
 HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36"}
 REQ_TIMEOUT = 25
 
 
+@ttl_cache()
 def fetch(endpoint_url: str) -> List[dict]:
     """
     Fetch jobs from Lever postings API.
@@ -27,7 +29,7 @@ def fetch(endpoint_url: str) -> List[dict]:
     out = []
     
     try:
-        r = requests.get(endpoint_url, headers=HEADERS, timeout=REQ_TIMEOUT)
+        r = request_with_retry("GET", endpoint_url, headers=HEADERS, timeout=REQ_TIMEOUT)
         r.raise_for_status()
         data = r.json() or []
         
@@ -52,8 +54,6 @@ def fetch(endpoint_url: str) -> List[dict]:
                 "req_id": req_id,
             })
         
-        time.sleep(0.5)
-        
     except requests.exceptions.RequestException as e:
         print(f"  Lever request error: {e}")
     except Exception as e:
@@ -2,256 +2,422 @@
 """
 Scraper for official company career sites using Playwright.
 These are the actual career pages of financial institutions.
+
+The scrapers run on Playwright's async API so fetch_all_official() can
+drive all four sites concurrently. Browser contexts come from the
+process-wide pool in connectors._browser_pool. The sync fetch_* wrappers
+keep the original call signatures.
 """
 from typing import List, Optional
+import asyncio
+import os
 import re
 import time
 
 try:
-    from playwright.sync_api import sync_playwright
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
     print("Warning: playwright not installed")
 
+from connectors import _browser_pool, oracle_cx
+from connectors._browser_pool import acquire_context, release_context
+from connectors._http import canon_url, job_key
+
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+VIEWPORT = {'width': 1920, 'height': 1080}
+
+# careers.jpmorgan.com is a front end for this Oracle CE site
+JPM_ORC_URL = 'https://jpmc.fa.oraclecloud.com/hcmUI/CandidateExperience/en/sites/CX_1001/requisitions'
+JPM_SITE_NUMBER = 'CX_1001'
+
+# Saved cookie jars, so consent banners are only clicked once a month
+STATE_DIR = os.path.join(os.path.dirname(__file__), "..", ".cache")
+STATE_MAX_AGE = 30 * 24 * 3600  # seconds
+
+_ROLE_ID_RE = re.compile(r'/roles/(\d+)')
+
+JPM_CARD_SELECTOR = '[data-testid="job-card"], .job-tile, article, .result-item'
+DB_LINK_SELECTOR = 'a[href*="/job/"], a[href*="/jobs/"]'
+
+
+def _state_path(site: str) -> str:
+    return os.path.abspath(os.path.join(STATE_DIR, f"{site}_state.json"))
+
+
+def _saved_state(site: str) -> Optional[str]:
+    """Path of the site's saved storage state, if it exists and isn't stale."""
+    path = _state_path(site)
+    try:
+        if time.time() - os.path.getmtime(path) < STATE_MAX_AGE:
+            return path
+    except OSError:
+        pass
+    return None
+
+
+async def _save_state(context, site: str):
+    """Persist cookies after a consent click so later runs skip the banner."""
+    try:
+        os.makedirs(os.path.dirname(_state_path(site)), exist_ok=True)
+        await context.storage_state(path=_state_path(site))
+    except Exception as e:
+        print(f"    Could not save {site} cookies: {e}")
+
+
+async def _wait_for_cards(page, selector: str, timeout: int = 20000):
+    """Wait until the first job link renders (instead of a fixed sleep)."""
+    try:
+        await page.wait_for_selector(selector, timeout=timeout)
+    except PlaywrightTimeoutError:
+        print(f"    No '{selector}' after {timeout // 1000}s, scraping what loaded")
+
+
+_LINKS_JS = """(els, max) => els.slice(0, max)
+    .map(a => ({href: a.getAttribute('href') || '', text: (a.innerText || '').trim()}))"""
+
+_JPM_CARDS_JS = """(els, max) => els.slice(0, max).map(c => {
+    const t = c.querySelector('h2, h3, .job-title, a');
+    const a = c.querySelector('a[href]');
+    return {title: t ? (t.innerText || '').trim() : '', href: a ? a.getAttribute('href') : null};
+})"""
+
+
+async def _link_rows(page, selector: str, max_jobs: int) -> List[dict]:
+    """href/text of the first `max_jobs` matches, read in one page round trip."""
+    return await page.locator(selector).evaluate_all(_LINKS_JS, max_jobs)
+
+
+_MORE_CARDS_JS = '([sel, n]) => document.querySelectorAll(sel).length > n'
+
+
+async def _scroll_until_stable(page, selector: str, max_rounds: int = 6, timeout: int = 4000):
+    """
+    Scroll until the number of `selector` matches stops growing.
+
+    Each round waits only as long as it takes new cards to render (up to
+    `timeout` ms), instead of a fixed sleep per scroll.
+    """
+    prev = await page.locator(selector).count()
+    for _ in range(max_rounds):
+        await page.mouse.wheel(0, 3000)
+        try:
+            await page.wait_for_function(_MORE_CARDS_JS, arg=[selector, prev], timeout=timeout)
+        except PlaywrightTimeoutError:
+            break
+        cur = await page.locator(selector).count()
+        if cur == prev:
+            break
+        prev = cur
+
+
+async def _fetch_goldman_sachs(max_jobs: int = 100) -> List[dict]:
+    """Scrape higher.gs.com in a pooled browser context."""
+    jobs = []
+    print("  Scraping higher.gs.com (official GS careers)...")
+
+    context = await acquire_context(user_agent=USER_AGENT, viewport=VIEWPORT)
+    try:
+        page = await context.new_page()
+        # Goldman Sachs Higher platform
+        url = 'https://higher.gs.com/roles?location=India'
+        await page.goto(url, timeout=60000, wait_until='commit')
+        await _wait_for_cards(page, 'a[href*="/roles/"]')
+
+        # Scroll to load more jobs
+        await _scroll_until_stable(page, 'a[href*="/roles/"]')
+
+        # Find role links
+        rows = await _link_rows(page, 'a[href*="/roles/"]', max_jobs)
+        seen = set()
+
+        for row in rows:
+            href = row['href']
+            text = row['text']
+
+            if not href or not text:
+                continue
+
+            # Extract role ID from URL
+            match = _ROLE_ID_RE.search(href)
+            req_id = match.group(1) if match else None
+
+            # Make URL absolute
+            if href.startswith('/'):
+                href = 'https://higher.gs.com' + href
+
+            key = req_id or canon_url(href)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            jobs.append({
+                'title': text[:100],
+                'detail_url': href,
+                'location': 'India',  # Filtered by location=India
+                'posted': None,
+                'description': None,
+                'req_id': req_id,
+                'source': 'Goldman Sachs Official'
+            })
+
+        print(f"    Goldman Sachs: found {len(jobs)} jobs")
+
+    except Exception as e:
+        print(f"    Goldman Sachs error: {e}")
+    finally:
+        await release_context(context)
+
+    return jobs
+
+
+async def _fetch_barclays(max_jobs: int = 100) -> List[dict]:
+    """Scrape search.jobs.barclays in a pooled browser context."""
+    jobs = []
+    print("  Scraping search.jobs.barclays (official Barclays careers)...")
+
+    context = await acquire_context(user_agent=USER_AGENT, viewport=VIEWPORT)
+    try:
+        page = await context.new_page()
+        url = 'https://search.jobs.barclays/jobs?location=India&stretch=0&stretchUnit=MILES'
+        await page.goto(url, timeout=60000, wait_until='commit')
+        await _wait_for_cards(page, 'a[href*="/job/"]')
+
+        # Scroll to load more
+        await _scroll_until_stable(page, 'a[href*="/job/"]')
+
+        # Find job links
+        rows = await _link_rows(page, 'a[href*="/job/"]', max_jobs)
+        seen = set()
+
+        for row in rows:
+            href = row['href']
+            text = row['text']
+
+            if not href or not text or len(text) < 5:
+                continue
+
+            # Make URL absolute
+            if href.startswith('/'):
+                href = 'https://search.jobs.barclays' + href
+
+            key = canon_url(href)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            jobs.append({
+                'title': text[:100],
+                'detail_url': href,
+                'location': 'India',
+                'posted': None,
+                'description': None,
+                'req_id': None,
+                'source': 'Barclays Official'
+            })
+
+        print(f"    Barclays: found {len(jobs)} jobs")
+
+    except Exception as e:
+        print(f"    Barclays error: {e}")
+    finally:
+        await release_context(context)
+
+    return jobs
+
+
+def _tag_jpmorgan(jobs: List[dict], max_jobs: int) -> List[dict]:
+    jobs = jobs[:max_jobs]
+    for job in jobs:
+        job['source'] = 'JPMorgan Official'
+    print(f"    JPMorgan API: found {len(jobs)} jobs")
+    return jobs
+
+
+def _fetch_jpmorgan_api(max_jobs: int = 100) -> List[dict]:
+    """Fetch JPMorgan India jobs straight from the Oracle CE REST API."""
+    print("  Fetching JPMorgan jobs from Oracle CE API...")
+    return _tag_jpmorgan(oracle_cx.fetch(JPM_ORC_URL, site_number=JPM_SITE_NUMBER), max_jobs)
+
+
+async def _fetch_jpmorgan(max_jobs: int = 100) -> List[dict]:
+    """JPMorgan via the Oracle API, rendering the site only if that comes back empty."""
+    print("  Fetching JPMorgan jobs from Oracle CE API...")
+    jobs = _tag_jpmorgan(
+        await oracle_cx.fetch_async(JPM_ORC_URL, site_number=JPM_SITE_NUMBER), max_jobs
+    )
+    if jobs:
+        return jobs
+    return await _fetch_jpmorgan_html_fallback(max_jobs)
+
+
+async def _fetch_jpmorgan_html_fallback(max_jobs: int = 100) -> List[dict]:
+    """Scrape careers.jpmorgan.com in a pooled browser context."""
+    jobs = []
+    print("  Scraping careers.jpmorgan.com (official JPM careers)...")
+
+    context = await acquire_context(
+        user_agent=USER_AGENT, viewport=VIEWPORT, storage_state=_saved_state('jpm')
+    )
+    try:
+        page = await context.new_page()
+        # JPMorgan uses Oracle HCM
+        url = 'https://careers.jpmorgan.com/global/en/search?q=*&location=India'
+        await page.goto(url, timeout=60000, wait_until='commit')
+        await _wait_for_cards(page, JPM_CARD_SELECTOR)
+
+        # Accept cookies if present
+        try:
+            accept_btn = await page.query_selector('button:has-text("Accept")')
+            if accept_btn:
+                await accept_btn.click()
+                await _save_state(context, 'jpm')
+        except:
+            pass
+
+        # Look for job cards
+        await _scroll_until_stable(page, JPM_CARD_SELECTOR)
+        cards = await page.locator(JPM_CARD_SELECTOR).evaluate_all(_JPM_CARDS_JS, max_jobs)
+
+        for card in cards:
+            title = card['title']
+            href = card['href']
+
+            if not title or len(title) < 5:
+                continue
+
+            if href and href.startswith('/'):
+                href = 'https://careers.jpmorgan.com' + href
 
-def _create_browser():
-    """Create browser context with common settings."""
-    p = sync_playwright().start()
-    browser = p.chromium.launch(headless=True)
-    context = browser.new_context(
-        user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        viewport={'width': 1920, 'height': 1080}
+            jobs.append({
+                'title': title[:100],
+                'detail_url': href or 'https://careers.jpmorgan.com',
+                'location': 'India',
+                'posted': None,
+                'description': None,
+                'req_id': None,
+                'source': 'JPMorgan Official'
+            })
+
+        print(f"    JPMorgan: found {len(jobs)} jobs")
+
+    except Exception as e:
+        print(f"    JPMorgan error: {e}")
+    finally:
+        await release_context(context)
+
+    return jobs
+
+
+async def _fetch_deutsche_bank(max_jobs: int = 100) -> List[dict]:
+    """Scrape careers.db.com in a pooled browser context."""
+    jobs = []
+    print("  Scraping careers.db.com (official Deutsche Bank careers)...")
+
+    context = await acquire_context(
+        user_agent=USER_AGENT, viewport=VIEWPORT, storage_state=_saved_state('db')
     )
-    return p, browser, context
+    try:
+        page = await context.new_page()
+        url = 'https://careers.db.com/professionals/search-jobs?locations=India'
+        await page.goto(url, timeout=60000, wait_until='commit')
+        await _wait_for_cards(page, DB_LINK_SELECTOR)
+
+        # Accept cookies
+        try:
+            accept = await page.query_selector('[data-testid="uc-accept-all-button"], button:has-text("Accept")')
+            if accept:
+                await accept.click()
+                await _save_state(context, 'db')
+        except:
+            pass
+
+        await _scroll_until_stable(page, DB_LINK_SELECTOR)
+
+        # Find job elements
+        rows = await _link_rows(page, DB_LINK_SELECTOR, max_jobs)
+        seen = set()
+
+        for row in rows:
+            href = row['href']
+            text = row['text']
+
+            if not href or not text or len(text) < 5:
+                continue
+
+            if href.startswith('/'):
+                href = 'https://careers.db.com' + href
+
+            key = canon_url(href)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            jobs.append({
+                'title': text[:100],
+                'detail_url': href,
+                'location': 'India',
+                'posted': None,
+                'description': None,
+                'req_id': None,
+                'source': 'Deutsche Bank Official'
+            })
+
+        print(f"    Deutsche Bank: found {len(jobs)} jobs")
+
+    except Exception as e:
+        print(f"    Deutsche Bank error: {e}")
+    finally:
+        await release_context(context)
+
+    return jobs
 
 
 def fetch_goldman_sachs(max_jobs: int = 100) -> List[dict]:
     """
     Fetch jobs from Goldman Sachs official career site (higher.gs.com).
-    
+
     Returns:
         List of job dicts from official Goldman Sachs careers
     """
     if not PLAYWRIGHT_AVAILABLE:
         print("Playwright not available")
         return []
-    
-    jobs = []
-    print("  Scraping higher.gs.com (official GS careers)...")
-    
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-            viewport={'width': 1920, 'height': 1080}
-        )
-        page = context.new_page()
-        
-        try:
-            # Goldman Sachs Higher platform
-            url = 'https://higher.gs.com/roles?location=India'
-            page.goto(url, timeout=60000, wait_until='domcontentloaded')
-            page.wait_for_timeout(5000)
-            
-            # Scroll to load more jobs
-            for _ in range(3):
-                page.mouse.wheel(0, 2000)
-                page.wait_for_timeout(1000)
-            
-            # Find role links
-            role_links = page.query_selector_all('a[href*="/roles/"]')
-            seen = set()
-            
-            for link in role_links[:max_jobs]:
-                try:
-                    href = link.get_attribute('href') or ''
-                    text = link.inner_text().strip()
-                    
-                    if not href or href in seen or not text:
-                        continue
-                    seen.add(href)
-                    
-                    # Extract role ID from URL
-                    match = re.search(r'/roles/(\d+)', href)
-                    req_id = match.group(1) if match else None
-                    
-                    # Make URL absolute
-                    if href.startswith('/'):
-                        href = 'https://higher.gs.com' + href
-                    
-                    jobs.append({
-                        'title': text[:100],
-                        'detail_url': href,
-                        'location': 'India',  # Filtered by location=India
-                        'posted': None,
-                        'description': None,
-                        'req_id': req_id,
-                        'source': 'Goldman Sachs Official'
-                    })
-                except Exception:
-                    continue
-            
-            print(f"    Found {len(jobs)} jobs")
-            
-        except Exception as e:
-            print(f"    Error: {e}")
-        finally:
-            browser.close()
-    
-    return jobs
+    return _browser_pool.run(_fetch_goldman_sachs(max_jobs))
 
 
 def fetch_barclays(max_jobs: int = 100) -> List[dict]:
     """
     Fetch jobs from Barclays official career site.
-    
+
     Returns:
         List of job dicts from official Barclays careers
     """
     if not PLAYWRIGHT_AVAILABLE:
         print("Playwright not available")
         return []
-    
-    jobs = []
-    print("  Scraping search.jobs.barclays (official Barclays careers)...")
-    
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-            viewport={'width': 1920, 'height': 1080}
-        )
-        page = context.new_page()
-        
-        try:
-            url = 'https://search.jobs.barclays/jobs?location=India&stretch=0&stretchUnit=MILES'
-            page.goto(url, timeout=60000, wait_until='domcontentloaded')
-            page.wait_for_timeout(5000)
-            
-            # Scroll to load more
-            for _ in range(3):
-                page.mouse.wheel(0, 2000)
-                page.wait_for_timeout(1000)
-            
-            # Find job links
-            job_links = page.query_selector_all('a[href*="/job/"]')
-            seen = set()
-            
-            for link in job_links[:max_jobs]:
-                try:
-                    href = link.get_attribute('href') or ''
-                    text = link.inner_text().strip()
-                    
-                    if not href or href in seen or not text or len(text) < 5:
-                        continue
-                    seen.add(href)
-                    
-                    # Make URL absolute
-                    if href.startswith('/'):
-                        href = 'https://search.jobs.barclays' + href
-                    
-                    jobs.append({
-                        'title': text[:100],
-                        'detail_url': href,
-                        'location': 'India',
-                        'posted': None,
-                        'description': None,
-                        'req_id': None,
-                        'source': 'Barclays Official'
-                    })
-                except Exception:
-                    continue
-            
-            print(f"    Found {len(jobs)} jobs")
-            
-        except Exception as e:
-            print(f"    Error: {e}")
-        finally:
-            browser.close()
-    
-    return jobs
+    return _browser_pool.run(_fetch_barclays(max_jobs))
 
 
 def fetch_jpmorgan(max_jobs: int = 100) -> List[dict]:
     """
     Fetch jobs from JPMorgan official career site.
-    
+
+    Uses the Oracle CE REST API; the browser is only started if it
+    returns nothing.
+
     Returns:
         List of job dicts from official JPMorgan careers
     """
+    jobs = _fetch_jpmorgan_api(max_jobs)
+    if jobs:
+        return jobs
     if not PLAYWRIGHT_AVAILABLE:
         print("Playwright not available")
         return []
-    
-    jobs = []
-    print("  Scraping careers.jpmorgan.com (official JPM careers)...")
-    
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-            viewport={'width': 1920, 'height': 1080}
-        )
-        page = context.new_page()
-        
-        try:
-            # JPMorgan uses Oracle HCM
-            url = 'https://careers.jpmorgan.com/global/en/search?q=*&location=India'
-            page.goto(url, timeout=60000, wait_until='domcontentloaded')
-            page.wait_for_timeout(8000)
-            
-            # Accept cookies if present
-            try:
-                accept_btn = page.query_selector('button:has-text("Accept")')
-                if accept_btn:
-                    accept_btn.click()
-                    page.wait_for_timeout(2000)
-            except:
-                pass
-            
-            # Look for job cards
-            job_cards = page.query_selector_all('[data-testid="job-card"], .job-tile, article, .result-item')
-            
-            for card in job_cards[:max_jobs]:
-                try:
-                    # Try to get title
-                    title_el = card.query_selector('h2, h3, .job-title, a')
-                    if not title_el:
-                        continue
-                    
-                    title = title_el.inner_text().strip()
-                    
-                    # Try to get link
-                    link_el = card.query_selector('a[href]')
-                    href = link_el.get_attribute('href') if link_el else None
-                    
-                    if not title or len(title) < 5:
-                        continue
-                    
-                    if href and href.startswith('/'):
-                        href = 'https://careers.jpmorgan.com' + href
-                    
-                    jobs.append({
-                        'title': title[:100],
-                        'detail_url': href or 'https://careers.jpmorgan.com',
-                        'location': 'India',
-                        'posted': None,
-                        'description': None,
-                        'req_id': None,
-                        'source': 'JPMorgan Official'
-                    })
-                except Exception:
-                    continue
-            
-            print(f"    Found {len(jobs)} jobs")
-            
-        except Exception as e:
-            print(f"    Error: {e}")
-        finally:
-            browser.close()
-    
-    return jobs
+    return _browser_pool.run(_fetch_jpmorgan_html_fallback(max_jobs))
 
 
 def fetch_deutsche_bank(max_jobs: int = 100) -> List[dict]:
@@ -261,121 +427,75 @@ def fetch_deutsche_bank(max_jobs: int = 100) -> List[dict]:
     if not PLAYWRIGHT_AVAILABLE:
         print("Playwright not available")
         return []
-    
-    jobs = []
-    print("  Scraping careers.db.com (official Deutsche Bank careers)...")
-    
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-            viewport={'width': 1920, 'height': 1080}
-        )
-        page = context.new_page()
-        
-        try:
-            url = 'https://careers.db.com/professionals/search-jobs?locations=India'
-            page.goto(url, timeout=60000, wait_until='domcontentloaded')
-            page.wait_for_timeout(5000)
-            
-            # Accept cookies
-            try:
-                accept = page.query_selector('[data-testid="uc-accept-all-button"], button:has-text("Accept")')
-                if accept:
-                    accept.click()
-                    page.wait_for_timeout(2000)
-            except:
-                pass
-            
-            # Find job elements
-            job_links = page.query_selector_all('a[href*="/job/"], a[href*="/jobs/"]')
-            seen = set()
-            
-            for link in job_links[:max_jobs]:
-                try:
-                    href = link.get_attribute('href') or ''
-                    text = link.inner_text().strip()
-                    
-                    if not href or href in seen or not text or len(text) < 5:
-                        continue
-                    seen.add(href)
-                    
-                    if href.startswith('/'):
-                        href = 'https://careers.db.com' + href
-                    
-                    jobs.append({
-                        'title': text[:100],
-                        'detail_url': href,
-                        'location': 'India',
-                        'posted': None,
-                        'description': None,
-                        'req_id': None,
-                        'source': 'Deutsche Bank Official'
-                    })
-                except Exception:
-                    continue
-            
-            print(f"    Found {len(jobs)} jobs")
-            
-        except Exception as e:
-            print(f"    Error: {e}")
-        finally:
-            browser.close()
-    
-    return jobs
+    return _browser_pool.run(_fetch_deutsche_bank(max_jobs))
 
 
-def fetch_all_official() -> List[dict]:
+def _job_key(job: dict):
+    """Dedupe key: canonical detail URL, plus the title when that URL is just a landing page."""
+    return job_key(job.get('detail_url'), job.get('title'))
+
+
+# (label, scraper) pairs run by fetch_all_official
+OFFICIAL_SCRAPERS = (
+    ("GS", _fetch_goldman_sachs),
+    ("Barclays", _fetch_barclays),
+    ("JPM", _fetch_jpmorgan),
+    ("DB", _fetch_deutsche_bank),
+)
+
+
+async def fetch_all_official_async() -> List[dict]:
     """
-    Fetch jobs from all official career sites.
-    
+    Fetch jobs from all official career sites concurrently.
+
+    Each scraper checks out its own context from the shared browser, so
+    total wall time is roughly the slowest site rather than the sum.
+    Must run on the pool's loop (see fetch_all_official).
+
     Returns:
         Combined list of jobs from all official sites
     """
     all_jobs = []
-    
+
     print("\n" + "="*60)
     print("SCRAPING OFFICIAL COMPANY CAREER SITES")
     print("="*60 + "\n")
-    
-    # Goldman Sachs - higher.gs.com
-    try:
-        gs_jobs = fetch_goldman_sachs()
-        all_jobs.extend(gs_jobs)
-    except Exception as e:
-        print(f"GS Error: {e}")
-    
-    time.sleep(2)
-    
-    # Barclays - search.jobs.barclays
-    try:
-        barclays_jobs = fetch_barclays()
-        all_jobs.extend(barclays_jobs)
-    except Exception as e:
-        print(f"Barclays Error: {e}")
-    
-    time.sleep(2)
-    
-    # JPMorgan
-    try:
-        jpm_jobs = fetch_jpmorgan()
-        all_jobs.extend(jpm_jobs)
-    except Exception as e:
-        print(f"JPM Error: {e}")
-    
-    time.sleep(2)
-    
-    # Deutsche Bank
-    try:
-        db_jobs = fetch_deutsche_bank()
-        all_jobs.extend(db_jobs)
-    except Exception as e:
-        print(f"DB Error: {e}")
-    
+
+    results = await asyncio.gather(
+        *[fn() for _, fn in OFFICIAL_SCRAPERS],
+        return_exceptions=True,
+    )
+
+    # One dedupe across all sites, so cross-listed jobs are returned once
+    seen = set()
+    for (label, _), res in zip(OFFICIAL_SCRAPERS, results):
+        if isinstance(res, BaseException):
+            print(f"{label} Error: {res}")
+            continue
+        for job in res:
+            key = _job_key(job)
+            if key in seen:
+                continue
+            seen.add(key)
+            all_jobs.append(job)
+
     print(f"\nTotal from official sites: {len(all_jobs)} jobs")
     return all_jobs
 
 
+def fetch_all_official() -> List[dict]:
+    """
+    Fetch jobs from all official career sites.
+
+    Returns:
+        Combined list of jobs from all official sites
+    """
+    if not PLAYWRIGHT_AVAILABLE:
+        print("Playwright not available")
+        return []
+    return _browser_pool.run(fetch_all_official_async())
+
+
 if __name__ == "__main__":
     jobs = fetch_all_official()
     for job in jobs[:10]:
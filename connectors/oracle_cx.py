@@ -3,23 +3,67 @@
 Oracle Recruiting Cloud (CX) connector for job scraping.
 Supports companies using Oracle's HCM Cloud recruiting module.
 """
-import time
-from typing import Optional, List
+import asyncio
+import io
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, List, Tuple
 from urllib.parse import urlparse
 import requests
 
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+from connectors._http import json_loads, make_session
+from connectors._http_cache import conditional_get
+
 
 DEFAULT_LIMIT = 200
 DEFAULT_PAGES = 15
 TIMEOUT = 30
+PAGE_WORKERS = 8  # concurrent page requests across all tenants
+FRESH_FOR = 300   # seconds a cached finder page is reused without revalidating
+
+# Server-side India filter; tenants that answer 400 to it are remembered
+# and get the plain finder (the client-side filter always runs anyway)
+INDIA_Q = "PrimaryLocationCountry='IN'"
+_Q_REJECTED = set()
+
+# Byte-level probes so pages without a single India row skip JSON parsing
+_INDIA_BYTES_RE = re.compile(rb'"PrimaryLocationCountry"\s*:\s*"IN"|india', re.I)
+_HAS_MORE_BYTES_RE = re.compile(rb'"hasMore"\s*:\s*true')
+_TOTAL_BYTES_RE = re.compile(rb'"TotalJobsCount"\s*:\s*(\d+)')
+_NONEMPTY_LIST_BYTES_RE = re.compile(rb'"requisitionList"\s*:\s*\[\s*\{')
+
+# One keep-alive pool for every tenant and page; 429/5xx retries are left
+# to request_with_retry
+SESSION = make_session({
+    "Accept": "application/json, text/plain, */*",
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/123.0.0.0 Safari/537.36"
+    ),
+}, pool_maxsize=32, retry_statuses=False)
+
+# Shared page workers: concurrent fetch() calls (one per tenant/region)
+# reuse the same threads and together stay under PAGE_WORKERS in flight
+EXECUTOR = ThreadPoolExecutor(max_workers=PAGE_WORKERS, thread_name_prefix="oracle-cx")
 
 
+@lru_cache(maxsize=64)
 def _host_base(endpoint_url: str) -> str:
     """Extract base URL (scheme + netloc) from endpoint."""
     u = urlparse(endpoint_url)
     return f"{u.scheme}://{u.netloc}"
 
 
+@lru_cache(maxsize=64)
 def _site_alias(endpoint_url: str) -> Optional[str]:
     """
     Extract the CandidateExperience alias from URL.
@@ -39,6 +83,144 @@ def _detail_url(base_host: str, site_alias: str, req_id: str) -> str:
     return f"{base_host}/hcmUI/CandidateExperience/en/sites/{site_alias}/jobs/preview/{req_id}"
 
 
+def _is_india(j: dict) -> bool:
+    """India filter for one requisition (country code or location text)."""
+    if (j.get("PrimaryLocationCountry") or "").strip() == "IN":
+        return True
+    location = (j.get("PrimaryLocation") or "").strip()
+    return "india" in location.lower()
+
+
+_REQ_PREFIX = "items.item.requisitionList.item"
+
+
+def _stream_reqs(body: bytes, keep) -> Tuple[List[dict], int, bool, Optional[int]]:
+    """
+    Walk a finder response with ijson, building only the requisitions
+    that pass `keep`. Returns (kept, seen_count, hasMore, total).
+    """
+    kept, count, has_more, total = [], 0, False, None
+    builder = None
+    for prefix, event, value in ijson.parse(io.BytesIO(body), use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == _REQ_PREFIX and event == "end_map":
+                count += 1
+                if keep is None or keep(builder.value):
+                    kept.append(builder.value)
+                builder = None
+        elif prefix == _REQ_PREFIX and event == "start_map":
+            builder = ObjectBuilder()
+            builder.event(event, value)
+        elif prefix == "hasMore":
+            has_more = bool(value)
+        elif prefix == "items.item.TotalJobsCount" and total is None:
+            total = value
+    return kept, count, has_more, total
+
+
+def _parse_reqs(
+    reqs: List[dict],
+    base_host: str,
+    site_alias: str,
+    india_only: bool,
+    seen: set
+) -> List[dict]:
+    """Turn (already filtered) requisitions into job dicts, skipping req_ids in `seen`."""
+    # Same as _detail_url() minus the req_id, built once per page
+    prefix = _detail_url(base_host, site_alias, "")
+    jobs = []
+    for j in reqs:
+        try:
+            title = (j.get("Title") or "").strip()
+            req_id = str(j.get("Id"))
+            if req_id in seen:
+                continue
+            seen.add(req_id)
+            location = (j.get("PrimaryLocation") or "").strip() or None
+            posted = j.get("PostedDate")  # YYYY-MM-DD
+
+            detail = prefix + req_id
+            jobs.append({
+                "title": title,
+                "location": location or ("India" if india_only else None),
+                "detail_url": detail,
+                "description": None,
+                "req_id": req_id,
+                "posted": posted,
+            })
+        except Exception:
+            continue
+    return jobs
+
+
+def _fetch_page(
+    session: requests.Session,
+    api: str,
+    site_number: str,
+    limit: int,
+    offset: int,
+    india_only: bool = True
+) -> Tuple[List[dict], bool, bool, Optional[int]]:
+    """
+    Fetch one page of requisitions.
+
+    Pages fetched in the last FRESH_FOR seconds come straight from the
+    local cache; older ones are revalidated with ETag / Last-Modified, so
+    unchanged pages come back as 304s. For India crawls the
+    server is asked to filter first (q=PrimaryLocationCountry='IN'). With
+    ijson installed the client-side filter runs while parsing, so
+    non-India rows are never built.
+
+    Returns:
+        (requisitions kept, page had any requisitions, hasMore, total)
+    """
+    params = {
+        "onlyData": "true",
+        "finder": f"findReqs;siteNumber={site_number},facetsList=NONE",
+        "limit": str(limit),
+        "offset": str(offset),
+    }
+    if india_only and api not in _Q_REJECTED:
+        params["q"] = INDIA_Q
+
+    try:
+        body = conditional_get(api, params=params, session=session,
+                               max_age=FRESH_FOR, timeout=TIMEOUT)
+    except requests.HTTPError as e:
+        if "q" not in params or e.response is None or e.response.status_code != 400:
+            raise
+        _Q_REJECTED.add(api)
+        del params["q"]
+        body = conditional_get(api, params=params, session=session,
+                               max_age=FRESH_FOR, timeout=TIMEOUT)
+
+    keep = _is_india if india_only else None
+    if not body:
+        return [], False, False, None
+
+    if india_only and not _INDIA_BYTES_RE.search(body):
+        # Nothing to keep; only pagination info is needed
+        total = _TOTAL_BYTES_RE.search(body)
+        return (
+            [],
+            bool(_NONEMPTY_LIST_BYTES_RE.search(body)),
+            bool(_HAS_MORE_BYTES_RE.search(body)),
+            int(total.group(1)) if total else None,
+        )
+
+    if IJSON_AVAILABLE:
+        kept, count, has_more, total = _stream_reqs(body, keep)
+        return kept, count > 0, has_more, total
+
+    data = json_loads(body) or {}
+    items = data.get("items") or ()
+    reqs = [j for blk in items for j in blk.get("requisitionList") or ()]
+    total = next((blk["TotalJobsCount"] for blk in items if blk.get("TotalJobsCount")), None)
+    kept = [j for j in reqs if keep(j)] if keep else reqs
+    return kept, bool(reqs), bool(data.get("hasMore")), total
+
+
 def fetch(
     endpoint_url: str,
     site_number: Optional[str] = None,
@@ -78,79 +260,51 @@ def fetch(
     api = f"{base_host}/hcmRestApi/resources/latest/recruitingCEJobRequisitions"
     site_alias = _site_alias(endpoint_url) or "CX"
     
-    out = []
-    session = requests.Session()
-    headers = {
-        "Accept": "application/json, text/plain, */*",
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/123.0.0.0 Safari/537.36"
-        ),
-    }
+    out, seen = [], set()
+    try:
+        # Probe the first page to learn whether there is anything more
+        reqs, non_empty, has_more, total = _fetch_page(SESSION, api, site_number, limit, 0, india_only)
+        out = _parse_reqs(reqs, base_host, site_alias, india_only, seen)
+        if not non_empty or not has_more:
+            return out
 
-    offset = 0
-    for page in range(max_pages):
-        params = {
-            "onlyData": "true",
-            "finder": f"findReqs;siteNumber={site_number},facetsList=NONE",
-            "limit": str(limit),
-            "offset": str(offset),
-        }
-        
+        # Offsets are known up front, so fetch the remaining pages concurrently
+        pages = max_pages
+        if total:
+            pages = min(pages, -(-int(total) // limit))
+        offsets = [k * limit for k in range(1, pages)]
+
+        futures = [
+            EXECUTOR.submit(_fetch_page, SESSION, api, site_number, limit, off, india_only)
+            for off in offsets
+        ]
         try:
-            r = session.get(api, headers=headers, params=params, timeout=TIMEOUT)
-            r.raise_for_status()
-            data = r.json() or {}
-
-            items = data.get("items") or []
-            if not items:
-                break
-
-            # Extract requisitions from items
-            reqs = []
-            for blk in items:
-                reqs.extend(blk.get("requisitionList") or [])
-
-            if not reqs:
-                break
-
-            for j in reqs:
-                try:
-                    title = (j.get("Title") or "").strip()
-                    req_id = str(j.get("Id"))
-                    location = (j.get("PrimaryLocation") or "").strip() or None
-                    posted = j.get("PostedDate")  # YYYY-MM-DD
-                    country = (j.get("PrimaryLocationCountry") or "").strip()
-
-                    # Filter for India if requested
-                    if india_only:
-                        if country != "IN" and (not location or "india" not in location.lower()):
-                            continue
-
-                    detail = _detail_url(base_host, site_alias, req_id)
-                    out.append({
-                        "title": title,
-                        "location": location or ("India" if india_only else None),
-                        "detail_url": detail,
-                        "description": None,
-                        "req_id": req_id,
-                        "posted": posted,
-                    })
-                except Exception:
-                    continue
-
-            if not data.get("hasMore"):
-                break
-                
-            offset += limit
-            time.sleep(0.4)
-            
-        except requests.exceptions.RequestException as e:
-            print(f"  Oracle CX request error: {e}")
-            break
-        except Exception as e:
-            print(f"  Oracle CX parse error: {e}")
-            break
+            # Consume in page order and stop where the serial loop would have;
+            # a failed page keeps everything before it
+            for fut in futures:
+                reqs, non_empty, has_more, _ = fut.result()
+                if not non_empty:
+                    break
+                out.extend(_parse_reqs(reqs, base_host, site_alias, india_only, seen))
+                if not has_more:
+                    break
+        finally:
+            for fut in futures:
+                fut.cancel()
+
+    except requests.exceptions.RequestException as e:
+        print(f"  Oracle CX request error: {e}")
+    except Exception as e:
+        print(f"  Oracle CX parse error: {e}")
 
     return out
+
+
+async def fetch_async(endpoint_url: str, **kwargs) -> List[dict]:
+    """
+    Awaitable fetch() for callers already on an event loop.
+
+    Pages are still fetched concurrently by fetch()'s thread pool; this
+    just keeps the crawl off the loop thread. Takes the same arguments.
+    """
+    return await asyncio.to_thread(fetch, endpoint_url, **kwargs)
@@ -2,20 +2,43 @@
 """
 Playwright-based browser renderer for JavaScript-heavy job sites.
 Provides a universal scraper for SPAs and dynamic content.
+
+Runs on Playwright's async API so query-parameter pagination can load
+several result pages at once, and gather_all() can render several boards
+at once (each in its own context). Contexts come from the shared Chromium in
+connectors._browser_pool, so the browser cold start is paid once per
+process rather than once per board. render_and_extract() is the sync
+entry point; render_and_extract_async() must run on the pool's loop
+(via _browser_pool.run).
 """
-from contextlib import contextmanager
+import asyncio
+from contextlib import asynccontextmanager
 from typing import Optional, List, Dict, Any
 from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
 
 try:
-    from playwright.sync_api import sync_playwright, Request
+    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
     print("Warning: playwright not installed. Browser rendering disabled.")
 
+from connectors import _browser_pool
+from connectors._http import job_key
+
 
 DEFAULT_TIMEOUT = 60000  # ms (many career sites need >30s)
+CONTEXT_OPTIONS = {
+    "user_agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/123.0.0.0 Safari/537.36"
+    ),
+    "viewport": {"width": 1366, "height": 768},
+    "locale": "en-US",
+}
+SCROLL_SETTLE_TIMEOUT = 5000  # ms to wait for a scroll to grow the page
+MAX_PARALLEL_PAGES = 4   # concurrent tabs for page_param pagination (caps RAM)
 
 # Analytics/tracking domains to block for faster loading
 BLOCK_HOST_SNIPPETS = (
@@ -24,86 +47,271 @@ BLOCK_HOST_SNIPPETS = (
 )
 
 
+# Resource types that never affect the selectors we scrape; shared with
+# the official-site scrapers so both block the same set. (WebSockets
+# bypass context.route, so listing them would be a no-op.)
+BLOCK_RESOURCE_TYPES = frozenset(_browser_pool.BLOCKED_RESOURCES)
+
+
 def _should_block(req) -> bool:
     """Check if request should be blocked (analytics, tracking, etc)."""
     url = req.url.lower()
     return any(snippet in url for snippet in BLOCK_HOST_SNIPPETS)
 
 
-@contextmanager
-def browser_ctx(headless: bool = True):
+async def _route(route):
+    if _should_block(route.request):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _route_blocking_assets(route):
+    if route.request.resource_type in BLOCK_RESOURCE_TYPES or _should_block(route.request):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+@asynccontextmanager
+async def browser_ctx(headless: bool = True, block_assets: bool = True):
     """
     Create a Chromium browser context with realistic settings.
+
+    Headless contexts are checked out of the shared browser pool and only
+    the context is closed on exit; headless=False launches a private
+    visible browser for debugging.
     
     Features:
     - Realistic user agent
     - Blocks analytics/tracking requests
+    - Blocks images/fonts/media/stylesheets unless block_assets=False
+      (for pages that only render their list once CSS has loaded)
     - Anti-bot detection measures
     """
     if not PLAYWRIGHT_AVAILABLE:
         raise RuntimeError("Playwright not installed. Run: pip install playwright && playwright install chromium")
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch(
-            headless=headless,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-            ],
-        )
-        context = browser.new_context(
-            user_agent=(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/123.0.0.0 Safari/537.36"
-            ),
-            viewport={"width": 1366, "height": 768},
-            locale="en-US",
-        )
+    route = _route_blocking_assets if block_assets else _route
 
-        # Block noisy third-party analytics
-        context.route("**/*", lambda route, req: route.abort() if _should_block(req) else route.continue_())
+    if headless:
+        context = await _browser_pool.acquire_context(block_resources=False, **CONTEXT_OPTIONS)
+        try:
+            # Block noisy third-party analytics (and heavy assets)
+            await context.route("**/*", route)
+            yield context
+        finally:
+            await _browser_pool.release_context(context)
+        return
 
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=False, args=_browser_pool.LAUNCH_ARGS)
+        context = await browser.new_context(**CONTEXT_OPTIONS)
+        await context.route("**/*", route)
         try:
             yield context
         finally:
-            context.close()
-            browser.close()
+            await context.close()
+            await browser.close()
 
 
-def _update_query_param(url: str, key: str, value: Any) -> str:
-    """Update or add a query parameter to URL."""
+def _with_query_param_values(url: str, key: str, values: List[Any]) -> List[str]:
+    """URL once per value of one query parameter (the URL is parsed once)."""
     u = urlparse(url)
     q = dict(parse_qsl(u.query, keep_blank_values=True))
-    q[str(key)] = str(value)
-    return urlunparse((u.scheme, u.netloc, u.path, u.params, urlencode(q, doseq=True), u.fragment))
+    out = []
+    for value in values:
+        q[str(key)] = str(value)
+        out.append(urlunparse((u.scheme, u.netloc, u.path, u.params, urlencode(q, doseq=True), u.fragment)))
+    return out
+
 
+async def _wait_for_content(page, wait_for: Optional[str], card_sel: str):
+    """
+    Wait for the page's content selector instead of network idle.
 
-def _load(page, url: str, wait_for: Optional[str]):
-    """Load page and wait for content."""
-    page.goto(url, timeout=DEFAULT_TIMEOUT, wait_until="domcontentloaded")
-    # Wait for network to settle
-    page.wait_for_load_state("networkidle", timeout=DEFAULT_TIMEOUT)
+    An explicit wait_for must appear (timeout raises, as before); the card
+    selector fallback may legitimately match nothing on an empty page.
+    """
     if wait_for:
-        page.wait_for_selector(wait_for, timeout=DEFAULT_TIMEOUT)
+        await page.wait_for_selector(wait_for, timeout=DEFAULT_TIMEOUT)
+        return
+    try:
+        await page.wait_for_selector(card_sel, timeout=DEFAULT_TIMEOUT)
+    except PlaywrightTimeoutError:
+        pass
+
+
+async def _load(page, url: str, wait_for: Optional[str], card_sel: str):
+    """
+    Load page and wait for content.
+
+    With an explicit wait_for, DOMContentLoaded is enough before the
+    selector wait; otherwise the full load event is awaited first, since
+    the card selector fallback may never match.
+    """
+    await page.goto(url, timeout=DEFAULT_TIMEOUT,
+                    wait_until="domcontentloaded" if wait_for else "load")
+    await _wait_for_content(page, wait_for, card_sel)
+
+
+# Page size as [scrollHeight, card count]
+_PAGE_SIZE_JS = "(s) => [document.body.scrollHeight, document.querySelectorAll(s).length]"
+
+# Resolves to the new [height, count] once either has grown
+_GREW_JS = """([s, h, n]) => {
+    const H = document.body.scrollHeight, N = document.querySelectorAll(s).length;
+    return (H > h || N > n) ? [H, N] : false;
+}"""
+
+
+async def _first_card(page, card_sel: str):
+    """First card element and its text, to detect when a list re-renders."""
+    first = await page.query_selector(card_sel)
+    return first, (await first.inner_text() if first else None)
+
+
+async def _wait_for_replacement(page, first, first_text) -> bool:
+    """Wait until the given first card is replaced or changes (False on timeout)."""
+    if not first:
+        return True
+    try:
+        await page.wait_for_function(
+            "([el, t]) => !el.isConnected || el.innerText !== t",
+            arg=[first, first_text], timeout=SCROLL_SETTLE_TIMEOUT * 2,
+        )
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+_PUSH_STATE_JS = """(url) => {
+    history.pushState({}, '', url);
+    window.dispatchEvent(new PopStateEvent('popstate', {state: {}}));
+}"""
+
+
+async def _spa_navigate(page, url: str, wait_for: Optional[str], card_sel: str) -> bool:
+    """
+    Switch an already-loaded SPA to `url` through its client-side router.
+
+    Pushes the URL and fires popstate, which SPA routers listen for, so
+    the app re-renders its list without a full navigation. Returns False
+    if the list didn't change (the caller then falls back to goto).
+    """
+    first, first_text = await _first_card(page, card_sel)
+    if not first:
+        return False
+    await page.evaluate(_PUSH_STATE_JS, url)
+    if not await _wait_for_replacement(page, first, first_text):
+        return False
+    await _wait_for_content(page, wait_for, card_sel)
+    return True
+
 
+def _same_document(a: str, b: str) -> bool:
+    """True if two URLs differ only in query/fragment (same SPA route)."""
+    pa, pb = urlparse(a), urlparse(b)
+    return (pa.scheme, pa.netloc, pa.path) == (pb.scheme, pb.netloc, pb.path)
 
-def _smart_scroll(page, steps: int = 12):
+
+async def _smart_scroll(page, card_sel: str, steps: int = 12, target: Optional[int] = None):
     """
     Scroll page to trigger lazy loading of content.
     Useful for infinite scroll or virtual lists.
+
+    Stops as soon as a scroll adds no cards and doesn't grow the page
+    within SCROLL_SETTLE_TIMEOUT, instead of waiting for network idle,
+    or once `target` cards are on the page (no scrolling at all if they
+    already are). The wait hands back the new height and count, so they
+    are read in the page once per step rather than polled again from Python.
     """
     try:
-        h = page.evaluate("() => document.body.scrollHeight")
+        h, n = await page.evaluate(_PAGE_SIZE_JS, card_sel)
         for _ in range(steps):
-            page.mouse.wheel(0, h)
-            page.wait_for_load_state("networkidle", timeout=DEFAULT_TIMEOUT // 2)
+            if target and n >= target:
+                break
+            await page.mouse.wheel(0, h)
+            try:
+                grown = await page.wait_for_function(
+                    _GREW_JS, arg=[card_sel, h, n], timeout=SCROLL_SETTLE_TIMEOUT
+                )
+            except PlaywrightTimeoutError:
+                break
+            h, n = await grown.json_value()
     except Exception:
         pass  # Scroll failure is not critical
 
 
-def render_and_extract(
+# Selector fallbacks are resolved once per call, not once per card
+_CARDS_JS = """(sel) => {
+    const LINK = sel.link || 'a', TITLE = sel.title || LINK;
+    const LOC = sel.location || null, POSTED = sel.posted || null;
+    const text = (el) => el ? (el.innerText || '').trim() : null;
+    return Array.from(document.querySelectorAll(sel.card)).map(c => {
+        const link = c.querySelector(LINK);
+        if (!link) return null;
+        return {
+            href: (link.getAttribute('href') || '').trim(),
+            title: text((TITLE === LINK ? link : c.querySelector(TITLE)) || link),
+            loc: LOC ? text(c.querySelector(LOC)) : null,
+            posted: POSTED ? text(c.querySelector(POSTED)) : null,
+        };
+    }).filter(row => row && row.href && row.title);
+}"""
+
+
+async def _scrape_one(
+    page,
+    selectors: Dict[str, str],
+    force_india: bool,
+    do_scroll: bool,
+    target_cards: Optional[int] = None
+) -> List[dict]:
+    """
+    Scrape jobs from current page state (not deduped).
+
+    All cards are read in a single page.evaluate round trip; cards
+    without a link, href or title are dropped in the page so they are
+    never serialized back.
+    """
+    if do_scroll:
+        await _smart_scroll(page, selectors["card"], target=target_cards)
+
+    try:
+        cards = await page.evaluate(_CARDS_JS, selectors)
+    except Exception:
+        cards = []
+
+    p = urlparse(page.url)
+    origin = f"{p.scheme}://{p.netloc}"
+
+    rows = []
+    for card in cards:
+        # Absolutize relative hrefs
+        href = card["href"]
+        if href.startswith("/"):
+            href = origin + href
+
+        title = card["title"]
+
+        loc = card["loc"]
+        if not loc and force_india:
+            loc = "India"
+
+        rows.append({
+            "title": title,
+            "location": loc,
+            "detail_url": href,
+            "description": None,
+            "req_id": None,
+            "posted": card["posted"],
+        })
+
+    return rows
+
+
+async def render_and_extract_async(
     url: str,
     selectors: Dict[str, str],
     max_pages: int = 1,
@@ -113,6 +321,9 @@ def render_and_extract(
     page_param: Optional[str] = None,
     step: int = 1,
     do_scroll: bool = True,
+    block_assets: bool = True,
+    target_cards: Optional[int] = None,
+    spa_nav: bool = False,
 ) -> List[dict]:
     """
     Universal renderer/scraper for JS-heavy job boards.
@@ -127,9 +338,15 @@ def render_and_extract(
         page_param: Query parameter for pagination (strategy A: ?page=N)
         step: Page number increment (1 for page=1,2,3 or 25 for start=0,25,50)
         do_scroll: Whether to scroll to trigger lazy loading
+        block_assets: Skip images/fonts/media/stylesheets while rendering
+        target_cards: Stop scrolling a page once this many cards are loaded
+        spa_nav: For page_param pagination, switch pages through the site's
+            client-side router (pushState) instead of a full navigation
         
     Pagination strategies:
-        A. Query parameter: Uses page_param with incrementing values
+        A. Query parameter: Uses page_param with incrementing values;
+           up to MAX_PARALLEL_PAGES tabs load pages concurrently, each
+           tab reused for its next page
         B. Click next: Clicks next_selector button
         C. Single page: Just scrape the first page
         
@@ -140,111 +357,104 @@ def render_and_extract(
         print("  Error: Playwright not available")
         return []
     
-    out, seen = [], set()
-
-    def scrape_one(page):
-        """Scrape jobs from current page state."""
-        if do_scroll:
-            _smart_scroll(page)
-
-        try:
-            cards = page.query_selector_all(selectors["card"])
-        except Exception:
-            cards = []
-        
-        for card in cards:
-            try:
-                link_sel = selectors.get("link", "a")
-                link_el = card.query_selector(link_sel)
-                if not link_el:
-                    continue
-                    
-                href = (link_el.get_attribute("href") or "").strip()
-                if not href:
-                    continue
-                    
-                # Absolutize relative hrefs
-                if href.startswith("/"):
-                    p = urlparse(page.url)
-                    href = f"{p.scheme}://{p.netloc}{href}"
-
-                title_sel = selectors.get("title", link_sel)
-                title_el = card.query_selector(title_sel) or link_el
-                title = (title_el.inner_text().strip() if title_el else None)
-
-                # Extract location
-                loc = None
-                loc_sel = selectors.get("location")
-                if loc_sel:
-                    le = card.query_selector(loc_sel)
-                    if le:
-                        loc = (le.inner_text() or "").strip()
-                if not loc and force_india:
-                    loc = "India"
-
-                # Extract posted date
-                posted = None
-                posted_sel = selectors.get("posted")
-                if posted_sel:
-                    pe = card.query_selector(posted_sel)
-                    if pe:
-                        posted = (pe.inner_text() or "").strip()
-
-                if not title:
-                    continue
-                    
-                k = (title, href)
-                if k in seen:
-                    continue
-                seen.add(k)
-                
-                out.append({
-                    "title": title,
-                    "location": loc,
-                    "detail_url": href,
-                    "description": None,
-                    "req_id": None,
-                    "posted": posted,
-                })
-            except Exception:
-                continue
+    pages_rows: List[List[dict]] = []
 
     try:
-        with browser_ctx(headless=True) as ctx:
-            page = ctx.new_page()
+        async with browser_ctx(headless=True, block_assets=block_assets) as ctx:
 
             # --- Pagination strategy A: query parameter (page/startrow)
             if page_param:
-                for i in range(max_pages):
-                    # FIX: Correct pagination value calculation
-                    # For step=1: pages 1, 2, 3, 4, 5
-                    # For step=25: start=0, 25, 50, 75, 100
-                    if step == 1:
-                        val = i + 1  # 1-indexed pages
-                    else:
-                        val = i * step  # 0-indexed with step
-                    
-                    pg_url = _update_query_param(url, page_param, val)
-                    _load(page, pg_url, wait_for)
-                    scrape_one(page)
+                # FIX: Correct pagination value calculation
+                # For step=1: pages 1, 2, 3, 4, 5
+                # For step=25: start=0, 25, 50, 75, 100
+                urls = _with_query_param_values(
+                    url, page_param,
+                    [i + 1 if step == 1 else i * step for i in range(max_pages)],
+                )
+                results: List[Any] = [None] * len(urls)
+                queue = list(enumerate(urls))
+
+                async def tab_worker():
+                    # One tab works through pages until the queue is empty
+                    page = await ctx.new_page()
+                    try:
+                        while queue:
+                            i, pg_url = queue.pop(0)
+                            try:
+                                if not (spa_nav and page.url != "about:blank"
+                                        and _same_document(page.url, pg_url)
+                                        and await _spa_navigate(page, pg_url, wait_for, selectors["card"])):
+                                    await _load(page, pg_url, wait_for, selectors["card"])
+                                results[i] = await _scrape_one(page, selectors, force_india, do_scroll, target_cards)
+                            except Exception as e:
+                                results[i] = e
+                    finally:
+                        await page.close()
+
+                await asyncio.gather(
+                    *[tab_worker() for _ in range(min(MAX_PARALLEL_PAGES, len(urls)))],
+                    return_exceptions=True,
+                )
+                for pg_url, res in zip(urls, results):
+                    if res is None:
+                        continue
+                    if isinstance(res, BaseException):
+                        print(f"  Playwright error on {pg_url}: {res}")
+                        continue
+                    pages_rows.append(res)
 
             else:
                 # --- Strategy B: click next button
-                _load(page, url, wait_for)
-                scrape_one(page)
+                page = await ctx.new_page()
+                await _load(page, url, wait_for, selectors["card"])
+                pages_rows.append(await _scrape_one(page, selectors, force_india, do_scroll, target_cards))
 
                 if next_selector:
                     for _ in range(max_pages - 1):
-                        btn = page.query_selector(next_selector)
+                        btn = await page.query_selector(next_selector)
                         if not btn:
                             break
-                        btn.click()
-                        page.wait_for_load_state("networkidle", timeout=DEFAULT_TIMEOUT)
-                        if wait_for:
-                            page.wait_for_selector(wait_for, timeout=DEFAULT_TIMEOUT)
-                        scrape_one(page)
+                        first, first_text = await _first_card(page, selectors["card"])
+                        await btn.click()
+                        # The old cards are still there right after the
+                        # click; wait until the first one is replaced
+                        await _wait_for_replacement(page, first, first_text)
+                        await _wait_for_content(page, wait_for, selectors["card"])
+                        pages_rows.append(await _scrape_one(page, selectors, force_india, do_scroll, target_cards))
 
     except Exception as e:
         print(f"  Playwright error: {e}")
 
-    return out
+    # Dedupe in page order: first row wins for each canonical URL
+    out = {}
+    for rows in pages_rows:
+        for row in rows:
+            out.setdefault(job_key(row["detail_url"], row["title"], url), row)
+    return list(out.values())
+
+
+async def gather_all(targets: List[Dict[str, Any]]) -> List[Any]:
+    """
+    Render several boards concurrently.
+
+    Args:
+        targets: One dict of render_and_extract_async keyword arguments per board
+
+    Returns:
+        Per-target results in input order: a list of job dicts, or the
+        exception that target raised. Concurrency is bounded by the browser
+        pool's context limit.
+    """
+    return await asyncio.gather(
+        *[render_and_extract_async(**t) for t in targets], return_exceptions=True
+    )
+
+
+def render_and_extract(*args, **kwargs) -> List[dict]:
+    """Sync wrapper around render_and_extract_async (same arguments)."""
+    return _browser_pool.run(render_and_extract_async(*args, **kwargs))
+
+
+def render_all(targets: List[Dict[str, Any]]) -> List[Any]:
+    """Sync wrapper around gather_all (same arguments and results)."""
+    return _browser_pool.run(gather_all(targets))
@@ -5,22 +5,33 @@ Supports career sites using Oracle Taleo's TGNewUI interface.
 """
 from typing import List
 import requests
+import soupsieve as sv
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 
+from connectors._http import canon_url, make_session
+from connectors._http_cache import conditional_get
+
 
 HDRS = {
     "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124 Safari/537.36"
 }
 
+# Compiled once instead of per job link
+_LINK_SEL = sv.compile("a[href*='JobDetail/']")
+_LOC_SEL = sv.compile(".jobLocation, .job-location, .location")
+
+_SESSION = make_session(HDRS, pool_maxsize=32)
+FRESH_FOR = 300  # seconds a cached search page is reused without a request
+
 
-def _parse(html: str, base_url: str) -> List[dict]:
+def _parse(html, base_url: str) -> List[dict]:
     """Parse job listings from Taleo TGNewUI page."""
-    soup = BeautifulSoup(html, "html.parser")
-    out, seen = [], set()
+    soup = BeautifulSoup(html, "lxml")
+    out = {}
     
     # Job links look like .../JobDetail/<Title>/<JobId>
-    for a in soup.select("a[href*='JobDetail/']"):
+    for a in _LINK_SEL.select(soup):
         title = a.get_text(" ", strip=True)
         href = a.get("href") or ""
         
@@ -31,29 +42,30 @@ def _parse(html: str, base_url: str) -> List[dict]:
         if href.startswith("/"):
             href = urljoin(base_url, href)
         
+        # One row per canonical URL (tracking-param variants collapse); checked
+        # before the location lookup so duplicates skip it
+        key = canon_url(href)
+        if key in out:
+            continue
+
         # Find location from parent container
         loc = None
         root = a.find_parent("li") or a.find_parent("div")
         if root:
-            el = root.select_one(".jobLocation, .job-location, .location")
+            el = _LOC_SEL.select_one(root)
             if el:
                 loc = el.get_text(" ", strip=True)
         
-        key = (title, href)
-        if key in seen:
-            continue
-        seen.add(key)
-        
-        out.append({
+        out[key] = {
             "title": title,
             "location": loc,
             "detail_url": href,
             "description": None,
             "req_id": None,
             "posted": None,
-        })
+        }
     
-    return out
+    return list(out.values())
 
 
 def fetch(search_url: str, max_pages: int = 4) -> List[dict]:
@@ -64,6 +76,9 @@ def fetch(search_url: str, max_pages: int = 4) -> List[dict]:
     - .../Search/home/HomeWithPreLoad?...locationSearch=India
     - .../Search/home/SearchResults?...keyword=India&locationSearch=India
     
+    Pages go through the on-disk HTTP cache (ETag / Last-Modified
+    revalidation, and no request at all within FRESH_FOR seconds).
+    
     Args:
         search_url: Taleo search URL
         max_pages: Maximum pages (often just 1 for Taleo)
@@ -72,14 +87,13 @@ def fetch(search_url: str, max_pages: int = 4) -> List[dict]:
         List of job dicts
     """
     try:
-        r = requests.get(search_url, headers=HDRS, timeout=45)
-        if not r.ok:
-            print(f"  Taleo returned status {r.status_code}")
-            return []
-        
-        jobs = _parse(r.text, search_url)
+        html = conditional_get(search_url, session=_SESSION, max_age=FRESH_FOR, timeout=45)
+        jobs = _parse(html, search_url)
         return jobs
         
+    except requests.HTTPError as e:
+        print(f"  Taleo returned status {e.response.status_code if e.response is not None else '?'}")
+        return []
     except requests.exceptions.RequestException as e:
         print(f"  Taleo request error: {e}")
         return []
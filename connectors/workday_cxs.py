@@ -3,16 +3,51 @@
 Workday CXS API connector for job scraping.
 Supports companies using Workday's candidate experience platform.
 """
-import time
-from typing import Optional, List
+import io
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Tuple
 from urllib.parse import urljoin
 import requests
 
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+from connectors._http import json_loads, make_session
+from connectors._http_cache import conditional_get
+
 
 UA = {
     "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124 Safari/537.36"
 }
 
+PAGE_WORKERS = 8  # concurrent page requests across all tenants (politeness cap)
+FRESH_FOR = 300   # seconds a cached search page is reused without a request
+STREAM_MIN_BYTES = 512 * 1024  # stream-parse responses at least this large
+
+# Posting fields _to_rows() reads; streamed postings keep only these
+_POSTING_FIELDS = frozenset({
+    "title", "locationsText", "location", "externalPath", "externalUrl",
+    "bulletFields", "postedOn",
+})
+
+# Workday's locationCountry facet takes country reference IDs, not names;
+# this is India's. Tenants that answer 400 to it are remembered and get
+# an unfaceted search (ingest filters locations client-side anyway)
+INDIA_COUNTRY_ID = "c4f78be1a8f14da0ab49ce1162348a5e"
+_FACET_REJECTED = set()
+
+# Keep-alive across pages and tenants: one TLS handshake per host per run
+_SESSION = make_session(UA, pool_maxsize=32)
+
+# Shared page workers, as in oracle_cx: concurrent fetch() calls reuse the
+# same threads (and so their HTTP cache connections) instead of starting
+# a pool per call, and together stay under PAGE_WORKERS in flight
+EXECUTOR = ThreadPoolExecutor(max_workers=PAGE_WORKERS, thread_name_prefix="workday-cxs")
+
 
 def _payload(search_text: Optional[str], limit: int, offset: int, india_only: bool = True) -> dict:
     """Build request payload for Workday CXS API."""
@@ -22,13 +57,12 @@ def _payload(search_text: Optional[str], limit: int, offset: int, india_only: bo
         "offset": int(offset),
     }
     
-    # Apply India filter
+    # Apply India filter server-side
     if india_only:
-        p["appliedFacets"]["locationCountry"] = ["India"]
+        p["appliedFacets"]["locationCountry"] = [INDIA_COUNTRY_ID]
     
     # FIX: Apply search text even when india_only is True
-    if search_text:
-        p["searchText"] = str(search_text)
+    p["searchText"] = str(search_text or "")
     
     return p
 
@@ -55,6 +89,112 @@ def _extract_req_id(posting: dict) -> Optional[str]:
     return None
 
 
+_POSTING_PREFIX = "jobPostings.item"
+
+
+def _stream_postings(body: bytes) -> Tuple[List[dict], Optional[int]]:
+    """
+    Walk a search response with ijson, one posting at a time.
+
+    Only the fields _to_rows() uses are kept, so a large page never
+    exists as a fully decoded document. Returns (postings, total).
+    """
+    posts, total = [], None
+    builder = None
+    for prefix, event, value in ijson.parse(io.BytesIO(body), use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == _POSTING_PREFIX and event == "end_map":
+                posts.append({k: v for k, v in builder.value.items() if k in _POSTING_FIELDS})
+                builder = None
+        elif prefix == _POSTING_PREFIX and event == "start_map":
+            builder = ObjectBuilder()
+            builder.event(event, value)
+        elif prefix == "total" and total is None:
+            total = value
+    return posts, total
+
+
+def _fetch_page(
+    base: str,
+    search_text: Optional[str],
+    limit: int,
+    offset: int,
+    india_only: bool
+) -> Tuple[Optional[List[dict]], Optional[int]]:
+    """
+    POST one search page.
+
+    Goes through the on-disk HTTP cache: a page polled in the last
+    FRESH_FOR seconds is reused without a request, and older ones are
+    revalidated when the tenant sends ETag / Last-Modified.
+
+    Returns:
+        (jobPostings, total) - postings is None on a non-2xx response
+    """
+    faceted = india_only and base not in _FACET_REJECTED
+    try:
+        try:
+            body = conditional_get(
+                base,
+                session=_SESSION,
+                max_age=FRESH_FOR,
+                method="POST",
+                json_body=_payload(search_text, limit, offset, faceted),
+                timeout=45,
+            )
+        except requests.HTTPError as e:
+            if not faceted or e.response is None or e.response.status_code != 400:
+                raise
+            _FACET_REJECTED.add(base)
+            body = conditional_get(
+                base,
+                session=_SESSION,
+                max_age=FRESH_FOR,
+                method="POST",
+                json_body=_payload(search_text, limit, offset, False),
+                timeout=45,
+            )
+    except requests.HTTPError as e:
+        print(f"  Workday returned status {e.response.status_code if e.response is not None else '?'}")
+        return None, None
+
+    # Check and decode the raw bytes; decoding to str first would be wasted
+    if b"jobPostings" not in body:
+        return [], None
+
+    if IJSON_AVAILABLE and len(body) >= STREAM_MIN_BYTES:
+        return _stream_postings(body)
+
+    data = json_loads(body)
+    return data.get("jobPostings") or [], data.get("total")
+
+
+def _to_rows(posts: List[dict], base: str) -> List[dict]:
+    """Map Workday postings to job dicts."""
+    rows = []
+    for p in posts:
+        title = p.get("title")
+        loc = p.get("locationsText") or p.get("location") or ""
+        path = p.get("externalPath") or p.get("externalUrl") or ""
+
+        # Build canonical job URL
+        if path.startswith("/"):
+            detail = urljoin(base, path)
+        else:
+            detail = path or base
+
+        rows.append({
+            "title": title,
+            "location": loc,
+            "detail_url": detail,
+            "description": None,
+            "req_id": _extract_req_id(p),
+            "posted": p.get("postedOn"),
+        })
+    return rows
+
+
 def fetch(
     endpoint_url: str,
     search_text: Optional[str] = None,
@@ -64,6 +204,9 @@ def fetch(
 ) -> List[dict]:
     """
     Fetch jobs from Workday CXS API.
+
+    The first page is fetched alone to learn the total; the rest are
+    fetched concurrently on the shared EXECUTOR.
     
     Args:
         endpoint_url: Base URL for the Workday CXS endpoint
@@ -81,62 +224,47 @@ def fetch(
     """
     results = []
     base = endpoint_url.rstrip("/")
-    
-    for page in range(max_pages):
-        offset = page * int(limit)
-        
+    limit = int(limit)
+
+    try:
+        # Workday only reports the match count on the first page, so probe
+        # it serially; the remaining offsets are then known up front
+        posts, total = _fetch_page(base, search_text, limit, 0, india_only)
+        if not posts:
+            return results
+        results.extend(_to_rows(posts, base))
+
+        # Stop if we got fewer results than requested
+        if len(posts) < limit:
+            return results
+
+        pages = max_pages
+        if total:
+            pages = min(max_pages, -(-int(total) // limit))
+        offsets = [k * limit for k in range(1, pages)]
+        if not offsets:
+            return results
+
+        pages_iter = EXECUTOR.map(
+            lambda off: _fetch_page(base, search_text, limit, off, india_only),
+            offsets,
+        )
+        # Consume in page order and stop where the serial loop would have;
+        # a failed page keeps everything before it (closing the iterator
+        # cancels pages not yet started)
         try:
-            r = requests.post(
-                base,
-                json=_payload(search_text, limit, offset, india_only),
-                headers=UA,
-                timeout=45
-            )
-            
-            if r.status_code != 200:
-                print(f"  Workday returned status {r.status_code}")
-                break
-                
-            if "jobPostings" not in r.text:
-                break
-                
-            data = r.json()
-            posts = data.get("jobPostings") or []
-            
-            if not posts:
-                break
-            
-            for p in posts:
-                title = p.get("title")
-                loc = p.get("locationsText") or p.get("location") or ""
-                path = p.get("externalPath") or p.get("externalUrl") or ""
-                
-                # Build canonical job URL
-                if path.startswith("/"):
-                    detail = urljoin(base, path)
-                else:
-                    detail = path or base
-                
-                results.append({
-                    "title": title,
-                    "location": loc,
-                    "detail_url": detail,
-                    "description": None,
-                    "req_id": _extract_req_id(p),
-                    "posted": p.get("postedOn"),
-                })
-            
-            # Stop if we got fewer results than requested
-            if len(posts) < int(limit):
-                break
-                
-            time.sleep(0.4)
-            
-        except requests.exceptions.RequestException as e:
-            print(f"  Workday request error: {e}")
-            break
-        except Exception as e:
-            print(f"  Workday parse error: {e}")
-            break
+            for posts, _ in pages_iter:
+                if not posts:
+                    break
+                results.extend(_to_rows(posts, base))
+                if len(posts) < limit:
+                    break
+        finally:
+            pages_iter.close()
+
+    except requests.exceptions.RequestException as e:
+        print(f"  Workday request error: {e}")
+    except Exception as e:
+        print(f"  Workday parse error: {e}")
     
     return results
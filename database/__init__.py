@@ -6,7 +6,10 @@ from database.local_db import (
     fetch_companies,
     upsert_company,
     upsert_jobs,
+    upsert_jobs_bulk,
     upsert_jobs_raw,
+    upsert_jobs_raw_bulk,
+    flush_jobs_raw,
     update_job_score,
     get_jobs,
     get_job_count,
@@ -19,7 +22,10 @@ __all__ = [
     "fetch_companies",
     "upsert_company",
     "upsert_jobs",
+    "upsert_jobs_bulk",
     "upsert_jobs_raw",
+    "upsert_jobs_raw_bulk",
+    "flush_jobs_raw",
     "update_job_score",
     "get_jobs",
     "get_job_count",
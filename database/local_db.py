@@ -3,36 +3,185 @@
 Local SQLite database for job scraper.
 Replaces Supabase for local development and testing.
 """
+import atexit
+import hashlib
 import os
+import queue
 import sqlite3
+import threading
+import time
 import json
 from datetime import datetime
-from typing import Optional, List
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Optional, List
 from contextlib import contextmanager
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Database file location
 DB_PATH = os.path.join(os.path.dirname(__file__), "..", "jobs.db")
 
+# Per-connection settings. WAL itself is persistent and set in init_db().
+# With WAL, synchronous=NORMAL only syncs at checkpoints and readers
+# don't block the writer.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -64000",       # ~64 MB
+    "PRAGMA mmap_size = 268435456",     # 256 MB
+)
+
 
 def get_db_path() -> str:
     """Get the database file path."""
     return os.path.abspath(DB_PATH)
 
 
-@contextmanager
-def get_connection():
-    """Get a database connection context manager."""
-    conn = sqlite3.connect(get_db_path())
+# One connection per (thread, database file), opened on first use and
+# reused, so dashboard requests don't pay connect + PRAGMA setup per query
+_local = threading.local()
+
+
+def _open_connection(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
     conn.row_factory = sqlite3.Row
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+@contextmanager
+def get_connection(path: Optional[str] = None):
+    """
+    Get a database connection context manager.
+    
+    Yields the calling thread's cached connection (to `path`, default the
+    current DB_PATH). Anything left uncommitted when the outermost block
+    exits is rolled back, as it was when each block closed its own
+    connection.
+    """
+    path = path or get_db_path()
+    conns = _local.__dict__.setdefault("conns", {})
+    entry = conns.get(path)
+    if entry is None:
+        entry = conns[path] = [_open_connection(path), 0]
+    
+    conn = entry[0]
+    entry[1] += 1
     try:
         yield conn
     finally:
+        entry[1] -= 1
+        if entry[1] == 0 and conn.in_transaction:
+            conn.rollback()
+
+
+@atexit.register
+def close_connections():
+    """
+    Close the calling thread's cached connections.
+    
+    Runs at exit for the main thread; short-lived threads (Flask request
+    threads, background tasks) must call it themselves when done.
+    """
+    for conn, _ in getattr(_local, "conns", {}).values():
         conn.close()
+    _local.conns = {}
+
+
+_FTS_SCHEMA = (
+    # Own-content FTS5 table (jobs has no company_name to point at), keyed
+    # by jobs.id and kept in sync by triggers
+    """CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts
+       USING fts5(title, location_city, company_name, tokenize = 'trigram')""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN
+           INSERT INTO jobs_fts (rowid, title, location_city, company_name)
+           VALUES (new.id, new.title, new.location_city,
+                   (SELECT name FROM companies WHERE id = new.company_id));
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_fts_au
+       AFTER UPDATE OF title, location_city, company_id ON jobs BEGIN
+           DELETE FROM jobs_fts WHERE rowid = old.id;
+           INSERT INTO jobs_fts (rowid, title, location_city, company_name)
+           VALUES (new.id, new.title, new.location_city,
+                   (SELECT name FROM companies WHERE id = new.company_id));
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN
+           DELETE FROM jobs_fts WHERE rowid = old.id;
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_fts_company_au
+       AFTER UPDATE OF name ON companies BEGIN
+           UPDATE jobs_fts SET company_name = new.name
+           WHERE rowid IN (SELECT id FROM jobs WHERE company_id = new.id);
+       END""",
+)
+
+
+FTS_MIN_CHARS = 3   # trigram index can't answer shorter search terms
+_FTS_TRIGGERS = ("jobs_fts_ai", "jobs_fts_au", "jobs_fts_ad", "jobs_fts_company_au")
+
+
+def _init_search_index(cursor):
+    """
+    Create the jobs_fts search index (skipped if SQLite lacks FTS5 trigram).
+    
+    Only touches the database when the index is missing or was built with
+    the earlier word tokenizer, so the per-request init_db() stays read-only.
+    """
+    cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'")
+    row = cursor.fetchone()
+    if row and "trigram" in row[0]:
+        return
+    if row:
+        # Word-tokenized index (prefix matches only): rebuild for substrings
+        for name in _FTS_TRIGGERS:
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+        cursor.execute("DROP TABLE jobs_fts")
+    
+    try:
+        for stmt in _FTS_SCHEMA:
+            cursor.execute(stmt)
+    except sqlite3.OperationalError as e:
+        print(f"  FTS5 trigram unavailable, search falls back to LIKE: {e}")
+        for name in _FTS_TRIGGERS:
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+        cursor.execute("DROP TABLE IF EXISTS jobs_fts")
+        return
+    
+    # Fill the new index from existing rows
+    cursor.execute("""
+        INSERT INTO jobs_fts (rowid, title, location_city, company_name)
+        SELECT j.id, j.title, j.location_city, c.name
+        FROM jobs j LEFT JOIN companies c ON j.company_id = c.id
+    """)
+
+
+def canon_hash(
+    req_id: Optional[str],
+    apply_url: Optional[str],
+    title: Optional[str],
+    location_city: Optional[str]
+) -> str:
+    """
+    128-bit digest (hex) identifying a posting within a company.
+    
+    Covers the same (req_id, apply_url, title, location_city) tuple,
+    stripped and lowercased, that upsert_jobs() de-duplicates on, so the
+    in-batch seen set holds one short key per posting.
+    """
+    key = "\x1f".join((v or "").strip().lower() for v in (req_id, apply_url, title, location_city))
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
 
 
 def init_db():
     """Initialize the database with required tables."""
     with get_connection() as conn:
+        conn.execute("PRAGMA journal_mode = WAL")
         cursor = conn.cursor()
         
         # Companies table
@@ -89,25 +238,52 @@ def init_db():
         """)
         
         # Create indexes for faster queries
+        cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'index'")
+        indexes_before = cursor.fetchone()[0]
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_score ON jobs(relevance_score DESC)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_posted ON jobs(posted_at DESC)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_first_seen ON jobs(first_seen_at DESC)")
+        # Dashboard paths (filter by company or score, newest first) read
+        # rows in index order instead of sorting a temp B-tree
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_company_seen ON jobs(company_id, first_seen_at DESC)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_score_seen ON jobs(relevance_score DESC, first_seen_at DESC)")
+        # Earlier builds indexed a stored canon_hash that nothing read
+        cursor.execute("DROP INDEX IF EXISTS idx_jobs_canon_hash")
+        # Keyset pagination seeks on (first_seen_at, id) in get_jobs()
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_seen_id ON jobs(first_seen_at DESC, id DESC)")
+        _init_search_index(cursor)
+        
+        # Refresh planner stats only when an index was just added; bulk
+        # loads are covered by PRAGMA optimize in _write_jobs()
+        cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'index'")
+        if cursor.fetchone()[0] != indexes_before:
+            cursor.execute("ANALYZE")
         
         conn.commit()
         print(f"Database initialized at: {get_db_path()}")
 
 
+def _fetch_dicts(cursor, query: str, params=()) -> List[dict]:
+    """
+    Run a query and return each row as a plain dict.
+    
+    Reads plain tuples and zips them with the column names once, instead
+    of building an sqlite3.Row per row and then copying it into a dict.
+    """
+    cursor.row_factory = None
+    cursor.execute(query, params)
+    names = [col[0] for col in cursor.description]
+    return [dict(zip(names, row)) for row in cursor]
+
+
 def fetch_companies() -> List[dict]:
     """Fetch all companies from database."""
     with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
+        return _fetch_dicts(conn.cursor(), """
             SELECT id, name, ats_type, careers_url, active, comp_gate_status
             FROM companies
         """)
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
 
 
 def upsert_company(
@@ -136,83 +312,213 @@ def upsert_company(
         return cursor.fetchone()[0]
 
 
+def _dumps(payload) -> str:
+    """Serialize a raw payload (orjson when installed; stdlib for anything it rejects)."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(payload)
+
+
+RAW_BATCH = 500          # jobs_raw rows per writer transaction
+RAW_QUEUE_MAX = 10000    # upsert_jobs_raw() blocks once this far behind
+RAW_FLUSH_TIMEOUT = 60   # seconds flush_jobs_raw() waits for the writer
+
+_raw_q: "queue.Queue" = queue.Queue(maxsize=RAW_QUEUE_MAX)
+_raw_writer: Optional[threading.Thread] = None
+_raw_writer_lock = threading.Lock()
+
+
+def _write_raw_batch(items: list):
+    by_path = {}
+    for path, *row in items:
+        by_path.setdefault(path, []).append(row)
+    
+    for path, rows in by_path.items():
+        try:
+            params = [(cid, sid, url, _dumps(payload)) for cid, sid, url, payload in rows]
+            with get_connection(path) as conn:
+                conn.executemany("""
+                    INSERT INTO jobs_raw (company_id, source_id, page_url, payload)
+                    VALUES (?, ?, ?, ?)
+                """, params)
+                conn.commit()
+        except Exception as e:
+            print(f"  Error writing {len(rows)} raw payload(s): {e}")
+
+
+def _raw_writer_loop():
+    while True:
+        items = [_raw_q.get()]
+        while len(items) < RAW_BATCH:
+            try:
+                items.append(_raw_q.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            _write_raw_batch(items)
+        finally:
+            for _ in items:
+                _raw_q.task_done()
+
+
 def upsert_jobs_raw(
     company_id: int,
     source_id: Optional[int],
     page_url: str,
     payload: dict
-) -> int:
-    """Store raw job fetch data."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO jobs_raw (company_id, source_id, page_url, payload)
-            VALUES (?, ?, ?, ?)
-        """, (company_id, source_id, page_url, json.dumps(payload)))
-        conn.commit()
-        return cursor.lastrowid
+) -> None:
+    """
+    Store raw job fetch data.
+    
+    Queued for a background writer thread that serializes payloads and
+    inserts them in batches, so scrapers don't wait on JSON encoding or
+    the disk. The payload must not be mutated afterwards. Call
+    flush_jobs_raw() to wait for pending rows (done automatically at exit).
+    
+    Returns None: the row id is not known when the call returns (this
+    used to return the inserted row's lastrowid).
+    """
+    global _raw_writer
+    if _raw_writer is None:
+        with _raw_writer_lock:
+            if _raw_writer is None:
+                _raw_writer = threading.Thread(target=_raw_writer_loop, name="jobs-raw-writer", daemon=True)
+                _raw_writer.start()
+    _raw_q.put((get_db_path(), company_id, source_id, page_url, payload))
+
+
+def upsert_jobs_raw_bulk(rows: List[tuple]) -> None:
+    """upsert_jobs_raw() for a list of (company_id, source_id, page_url, payload)."""
+    for company_id, source_id, page_url, payload in rows:
+        upsert_jobs_raw(company_id, source_id, page_url, payload)
+
+
+@atexit.register
+def flush_jobs_raw(timeout: Optional[float] = RAW_FLUSH_TIMEOUT) -> bool:
+    """
+    Wait until every queued upsert_jobs_raw() row has been written.
+    
+    Gives up after `timeout` seconds (None waits indefinitely) or as soon
+    as the writer thread has died, so a stalled writer (e.g. a locked
+    database) can't hang interpreter shutdown; rows still queued are
+    reported. Returns True if everything was written.
+    """
+    if _raw_writer is None:
+        return True
+    deadline = None if timeout is None else time.monotonic() + timeout
+    with _raw_q.all_tasks_done:
+        while _raw_q.unfinished_tasks and _raw_writer.is_alive():
+            wait = 1.0 if deadline is None else min(1.0, deadline - time.monotonic())
+            if wait <= 0:
+                break
+            _raw_q.all_tasks_done.wait(wait)
+        pending = _raw_q.unfinished_tasks
+    if pending:
+        print(f"  ! {pending} raw payload row(s) were not written")
+    return not pending
+
+
+# Columns taken from each job record, with their default when missing.
+# company_id is filled in by upsert_jobs() itself.
+_JOB_FIELDS = (
+    ("title", None),
+    ("apply_url", None),
+    ("team", None),
+    ("location_city", None),
+    ("location_country", None),
+    ("description", None),
+    ("req_id", None),
+    ("posted_at", None),
+    ("canonical_key", None),
+    ("remote", False),
+    ("min_exp", None),
+    ("max_exp", None),
+)
+_UPSERT_JOB_COLUMNS = ("company_id",) + tuple(name for name, _ in _JOB_FIELDS)
+# Overwritten when a posting is seen again (the rest keep first-seen values)
+_UPSERT_JOB_UPDATES = (
+    "title", "apply_url", "location_city", "location_country",
+    "description", "posted_at",
+)
+
+# Rows per multi-row INSERT, kept under SQLite's default 999 bound
+# parameters (older builds still ship that limit)
+UPSERT_ROWS_PER_STATEMENT = 999 // len(_UPSERT_JOB_COLUMNS)
+
+_UPSERT_JOB_ROW = "(" + ", ".join(["?"] * len(_UPSERT_JOB_COLUMNS)) + ")"
+_UPSERT_JOB_HEAD = f"INSERT INTO jobs ({', '.join(_UPSERT_JOB_COLUMNS)}) VALUES "
+_UPSERT_JOB_TAIL = (
+    " ON CONFLICT(company_id, canonical_key) DO UPDATE SET "
+    + ", ".join(f"{col} = excluded.{col}" for col in _UPSERT_JOB_UPDATES)
+    + ", updated_at = CURRENT_TIMESTAMP"
+)
+
+
+@lru_cache(maxsize=8)
+def _upsert_job_sql(n_rows: int) -> str:
+    """INSERT ... ON CONFLICT for jobs with `n_rows` VALUES tuples."""
+    return _UPSERT_JOB_HEAD + ", ".join([_UPSERT_JOB_ROW] * n_rows) + _UPSERT_JOB_TAIL
+
+
+def _job_params(company_id: int, rows: List[dict]) -> List[tuple]:
+    """De-duplicate a company's records within the batch and build parameter tuples."""
+    seen, params = set(), []
+    for rec in rows:
+        h = canon_hash(rec.get("req_id"), rec.get("apply_url"), rec.get("title"), rec.get("location_city"))
+        if h in seen:
+            continue
+        seen.add(h)
+        params.append((company_id, *[rec.get(name, default) for name, default in _JOB_FIELDS]))
+    return params
 
 
 def upsert_jobs(company_id: int, rows: List[dict]) -> int:
     """Upsert normalized job records."""
     if not rows:
         return 0
-    
-    # De-duplicate within batch
-    seen, cleaned = set(), []
-    for rec in rows:
-        k = (
-            (rec.get("req_id") or "").strip().lower(),
-            (rec.get("apply_url") or "").strip().lower(),
-            (rec.get("title") or "").strip().lower(),
-            (rec.get("location_city") or "").strip().lower(),
-        )
-        if k in seen:
-            continue
-        seen.add(k)
-        
-        r = {kk: vv for kk, vv in rec.items() if kk != "canonical_key"}
-        r["company_id"] = company_id
-        r["canonical_key"] = rec.get("canonical_key")
-        cleaned.append(r)
-    
-    if not cleaned:
+    return _write_jobs(_job_params(company_id, rows))
+
+
+def upsert_jobs_bulk(rows_by_company: Dict[int, List[dict]]) -> int:
+    """Upsert several companies' job records in one transaction."""
+    params = []
+    for company_id, rows in rows_by_company.items():
+        params.extend(_job_params(company_id, rows))
+    return _write_jobs(params)
+
+
+def _write_jobs(params: List[tuple]) -> int:
+    if not params:
         return 0
     
-    count = 0
     with get_connection() as conn:
         cursor = conn.cursor()
-        for rec in cleaned:
+        # Multi-row INSERTs in one transaction: SQLite parses and plans
+        # one statement per UPSERT_ROWS_PER_STATEMENT rows and flushes the
+        # journal once per batch. If anything fails, roll back and retry
+        # row by row so one bad record doesn't lose the rest.
+        try:
+            n = UPSERT_ROWS_PER_STATEMENT
+            for i in range(0, len(params), n):
+                chunk = params[i:i + n]
+                cursor.execute(_upsert_job_sql(len(chunk)), list(chain.from_iterable(chunk)))
+            conn.commit()
+            if len(params) >= n:
+                # Refresh planner stats after bulk loads (only re-analyzes
+                # tables that changed enough to matter)
+                conn.execute("PRAGMA optimize")
+            return len(params)
+        except sqlite3.Error as e:
+            conn.rollback()
+            print(f"  Batch insert failed ({e}), retrying row by row")
+        
+        count = 0
+        for p in params:
             try:
-                cursor.execute("""
-                    INSERT INTO jobs (
-                        company_id, title, apply_url, team, location_city,
-                        location_country, description, req_id, posted_at,
-                        canonical_key, remote, min_exp, max_exp
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(company_id, canonical_key) DO UPDATE SET
-                        title = excluded.title,
-                        apply_url = excluded.apply_url,
-                        location_city = excluded.location_city,
-                        location_country = excluded.location_country,
-                        description = excluded.description,
-                        posted_at = excluded.posted_at,
-                        updated_at = CURRENT_TIMESTAMP
-                """, (
-                    rec.get("company_id"),
-                    rec.get("title"),
-                    rec.get("apply_url"),
-                    rec.get("team"),
-                    rec.get("location_city"),
-                    rec.get("location_country"),
-                    rec.get("description"),
-                    rec.get("req_id"),
-                    rec.get("posted_at"),
-                    rec.get("canonical_key"),
-                    rec.get("remote", False),
-                    rec.get("min_exp"),
-                    rec.get("max_exp"),
-                ))
+                cursor.execute(_upsert_job_sql(1), p)
                 count += 1
             except Exception as e:
                 print(f"  Error inserting job: {e}")
@@ -233,6 +539,55 @@ def update_job_score(job_id: int, score: int, ctc_pass: bool):
         conn.commit()
 
 
+def _search_filter(cursor, search: str):
+    """
+    SQL condition + params for the dashboard search box.
+    
+    Same substring semantics as a LIKE '%term%' scan either way: the
+    trigram jobs_fts index answers terms of 3+ characters, and shorter
+    terms (which trigrams can't index) or databases without the index
+    fall back to the LIKE scan.
+    """
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'")
+    if cursor.fetchone() and len(search) >= FTS_MIN_CHARS:
+        phrase = search.replace('"', '""')
+        return " AND j.id IN (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?)", [f'"{phrase}"']
+    
+    search_term = f"%{search}%"
+    return " AND (j.title LIKE ? OR j.location_city LIKE ? OR c.name LIKE ?)", [search_term] * 3
+
+
+def _job_filters(cursor, company_id, min_score, search):
+    """WHERE-clause additions + params shared by the job listing queries."""
+    where, params = "", []
+    
+    if company_id:
+        where += " AND j.company_id = ?"
+        params.append(company_id)
+    
+    if min_score is not None:
+        where += " AND j.relevance_score >= ?"
+        params.append(min_score)
+    
+    if search:
+        clause, search_params = _search_filter(cursor, search)
+        where += clause
+        params.extend(search_params)
+    
+    return where, params
+
+
+def _job_order(sort_by: str, sort_order: str) -> str:
+    # Validate sort_by to prevent SQL injection
+    valid_sorts = ["first_seen_at", "relevance_score", "posted_at", "title"]
+    if sort_by not in valid_sorts:
+        sort_by = "first_seen_at"
+    
+    sort_order = "DESC" if sort_order.upper() == "DESC" else "ASC"
+    # id breaks ties so pages are stable (and keyset cursors unambiguous)
+    return f" ORDER BY j.{sort_by} {sort_order}, j.id {sort_order}"
+
+
 def get_jobs(
     limit: int = 100,
     offset: int = 0,
@@ -240,12 +595,31 @@ def get_jobs(
     min_score: Optional[int] = None,
     search: Optional[str] = None,
     sort_by: str = "first_seen_at",
-    sort_order: str = "DESC"
+    sort_order: str = "DESC",
+    after_seen: Optional[str] = None,
+    after_id: Optional[int] = None
 ) -> List[dict]:
-    """Get jobs with filtering and pagination."""
+    """
+    Get jobs with filtering and pagination.
+    
+    Pass the last row's (first_seen_at, id) as after_seen/after_id to get
+    the next page by keyset instead of OFFSET: SQLite seeks straight to it
+    rather than scanning and discarding every earlier row. Keyset paging
+    is only defined for the first_seen_at sort; offset is ignored with it.
+    """
     with get_connection() as conn:
         cursor = conn.cursor()
         
+        where, params = _job_filters(cursor, company_id, min_score, search)
+        if after_id is not None or after_seen is not None:
+            if after_id is None or not after_seen:
+                raise ValueError("Keyset pagination needs both after_seen and after_id")
+            if sort_by != "first_seen_at":
+                raise ValueError("Keyset pagination (after_seen/after_id) requires sort_by='first_seen_at'")
+            cmp = "<" if sort_order.upper() == "DESC" else ">"
+            where += f" AND (j.first_seen_at, j.id) {cmp} (?, ?)"
+            params.extend([after_seen, after_id])
+            offset = 0
         query = """
             SELECT 
                 j.*,
@@ -254,35 +628,12 @@ def get_jobs(
             FROM jobs j
             JOIN companies c ON j.company_id = c.id
             WHERE 1=1
-        """
-        params = []
-        
-        if company_id:
-            query += " AND j.company_id = ?"
-            params.append(company_id)
-        
-        if min_score is not None:
-            query += " AND j.relevance_score >= ?"
-            params.append(min_score)
-        
-        if search:
-            query += " AND (j.title LIKE ? OR j.location_city LIKE ? OR c.name LIKE ?)"
-            search_term = f"%{search}%"
-            params.extend([search_term, search_term, search_term])
-        
-        # Validate sort_by to prevent SQL injection
-        valid_sorts = ["first_seen_at", "relevance_score", "posted_at", "title"]
-        if sort_by not in valid_sorts:
-            sort_by = "first_seen_at"
-        
-        sort_order = "DESC" if sort_order.upper() == "DESC" else "ASC"
-        query += f" ORDER BY j.{sort_by} {sort_order}"
+        """ + where
+        query += _job_order(sort_by, sort_order)
         query += " LIMIT ? OFFSET ?"
         params.extend([limit, offset])
         
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        return _fetch_dicts(cursor, query, params)
 
 
 def get_job_count(
@@ -294,26 +645,13 @@ def get_job_count(
     with get_connection() as conn:
         cursor = conn.cursor()
         
+        where, params = _job_filters(cursor, company_id, min_score, search)
         query = """
             SELECT COUNT(*) as count
             FROM jobs j
             JOIN companies c ON j.company_id = c.id
             WHERE 1=1
-        """
-        params = []
-        
-        if company_id:
-            query += " AND j.company_id = ?"
-            params.append(company_id)
-        
-        if min_score is not None:
-            query += " AND j.relevance_score >= ?"
-            params.append(min_score)
-        
-        if search:
-            query += " AND (j.title LIKE ? OR j.location_city LIKE ? OR c.name LIKE ?)"
-            search_term = f"%{search}%"
-            params.extend([search_term, search_term, search_term])
+        """ + where
         
         cursor.execute(query, params)
         return cursor.fetchone()[0]
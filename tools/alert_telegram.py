@@ -4,12 +4,20 @@ Telegram notification module for job alerts.
 """
 import os
 import requests
-from typing import Optional
+from typing import List, Optional
+
+from connectors._http import make_session
 
 
 BOT_TOKEN = os.environ.get("TELEGRAM_BOT_TOKEN")
 CHAT_ID = os.environ.get("TELEGRAM_CHAT_ID")
 
+BATCH_MAX_CHARS = 3800   # Telegram caps a message at 4096 characters
+BATCH_SEPARATOR = "\n\n"
+
+# Kept for the process lifetime so a burst of alerts shares one connection
+_SESSION = make_session(pool_maxsize=2)
+
 
 def send(msg: str, parse_mode: str = "HTML") -> bool:
     """
@@ -36,9 +44,53 @@ def send(msg: str, parse_mode: str = "HTML") -> bool:
     }
     
     try:
-        r = requests.post(url, data=data, timeout=20)
+        r = _SESSION.post(url, data=data, timeout=20)
         r.raise_for_status()
         return True
     except requests.exceptions.RequestException as e:
         print(f"Telegram send error: {e}")
         return False
+
+
+def deliver_batch(msgs: List[str], parse_mode: str = "HTML", max_chars: int = BATCH_MAX_CHARS) -> List[bool]:
+    """
+    Send several alerts, packed into as few Telegram messages as possible.
+    
+    Messages are joined with blank lines up to max_chars per send; a single
+    message longer than that goes out on its own. If a packed send fails,
+    its alerts are retried one by one, so one bad alert (e.g. markup
+    Telegram rejects) doesn't take the rest of its batch with it.
+    
+    Returns:
+        One flag per entry of msgs: True if that alert was delivered
+    """
+    delivered = [False] * len(msgs)
+    chunk: List[int] = []
+    size = 0
+    
+    def flush():
+        nonlocal chunk, size
+        if len(chunk) > 1 and send(BATCH_SEPARATOR.join(msgs[i] for i in chunk), parse_mode):
+            for i in chunk:
+                delivered[i] = True
+        else:
+            # A lone alert, or the packed send failed: one send per alert
+            for i in chunk:
+                delivered[i] = send(msgs[i], parse_mode)
+        chunk, size = [], 0
+    
+    for i, msg in enumerate(msgs):
+        added = len(msg) + (len(BATCH_SEPARATOR) if chunk else 0)
+        if chunk and size + added > max_chars:
+            flush()
+            added = len(msg)
+        chunk.append(i)
+        size += added
+    flush()
+    
+    return delivered
+
+
+def send_batch(msgs: List[str], parse_mode: str = "HTML", max_chars: int = BATCH_MAX_CHARS) -> int:
+    """deliver_batch(), returning the number of alerts delivered."""
+    return sum(deliver_batch(msgs, parse_mode, max_chars))
@@ -5,12 +5,12 @@ One-time script to update existing jobs with scores.
 """
 import os
 import sys
-import time
 import traceback
 import urllib.parse
-import requests
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import List
 
+from connectors._http import json_loads, make_session, request_with_retry, set_host_rate
 from tools.scoring import score_job
 
 
@@ -26,6 +26,15 @@ def _get_env_var(name: str) -> str:
 SUPABASE_URL = os.environ.get("SUPABASE_URL", "").rstrip("/")
 SERVICE_ROLE = os.environ.get("SUPABASE_SERVICE_ROLE", "")
 
+# One keep-alive pool for the whole run (thousands of PATCHes to one host).
+# 429/5xx and Retry-After are handled by request_with_retry.
+_SESSION = make_session(pool_maxsize=32, retry_statuses=False)
+
+PATCH_WORKERS = 8       # concurrent PATCHes in flight
+SCORE_WORKERS = os.cpu_count() or 1
+SCORE_CHUNKSIZE = 64
+SUPABASE_RATE = 100     # requests/second; the board-scraping default is far lower
+
 
 def _get_headers() -> dict:
     """Get Supabase API headers."""
@@ -40,78 +49,122 @@ def _get_headers() -> dict:
 SELECT = "id,title,apply_url,location_city,remote,posted_at,description,min_exp,max_exp,company_id,companies(name,comp_gate_status)"
 
 
-def fetch_page(offset: int = 0, limit: int = 500) -> List[dict]:
-    """Fetch a page of jobs from the database."""
+def fetch_page(after_id: int = 0, limit: int = 500, unscored_only: bool = True) -> List[dict]:
+    """
+    Fetch the next page of jobs (ids above after_id) from the database.
+    
+    Keyset pagination on id stays cheap however deep the run gets (no
+    OFFSET scan) and isn't thrown off by rows this run has just patched.
+    With unscored_only, rows that already have a relevance_score are
+    filtered out server side.
+    """
     params = {
         "select": SELECT,
+        "id": f"gt.{after_id}",
         "order": "id.asc",
         "limit": str(limit),
-        "offset": str(offset)
     }
+    if unscored_only:
+        params["relevance_score"] = "is.null"
     url = f"{SUPABASE_URL}/rest/v1/jobs?{urllib.parse.urlencode(params)}"
     
     try:
-        r = requests.get(url, headers=_get_headers(), timeout=40)
+        r = request_with_retry("GET", url, session=_SESSION, headers=_get_headers(), timeout=40)
         r.raise_for_status()
-        return r.json()
+        return json_loads(r.content)
     except Exception as e:
-        print(f"Error fetching page at offset {offset}: {e}")
+        print(f"Error fetching page after id {after_id}: {e}")
         return []
 
 
 def patch_job_eval(job_id: int, score: int, ctc_pass: bool) -> bool:
     """Update job with relevance score and CTC prediction."""
-    url = f"{SUPABASE_URL}/rest/v1/jobs?id=eq.{job_id}"
+    return patch_jobs_eval([job_id], score, ctc_pass)
+
+
+def patch_jobs_eval(job_ids: List[int], score: int, ctc_pass: bool) -> bool:
+    """Give every job in job_ids the same score and CTC prediction in one PATCH."""
+    url = f"{SUPABASE_URL}/rest/v1/jobs?id=in.({','.join(str(i) for i in job_ids)})"
     
     try:
-        r = requests.patch(
+        r = request_with_retry(
+            "PATCH",
             url,
+            session=_SESSION,
             headers=_get_headers(),
-            json={"relevance_score": score, "ctc_predicted_pass": ctc_pass}
+            json={"relevance_score": score, "ctc_predicted_pass": ctc_pass},
+            timeout=40
         )
         r.raise_for_status()
         return True
     except Exception as e:
-        print(f"  Patch failed for job {job_id}: {e}")
+        print(f"  Patch failed for {len(job_ids)} job(s) starting at {job_ids[0]}: {e}")
         return False
 
 
-def main():
-    """Main entry point for backfill."""
+def _score_row(job: dict):
+    """score_job() for a process pool: returns (id, score, ctc_pass, error)."""
+    try:
+        score, ctc_pass = score_job(job)
+        return job.get("id"), score, ctc_pass, None
+    except Exception:
+        return job.get("id"), None, None, traceback.format_exc()
+
+
+def main(rescore_all: bool = False):
+    """Main entry point for backfill (only unscored jobs unless rescore_all)."""
     if not SUPABASE_URL or not SERVICE_ROLE:
         print("ERROR: Missing SUPABASE_URL or SUPABASE_SERVICE_ROLE environment variables")
         sys.exit(1)
     
     print("Starting backfill of relevance scores...")
+    set_host_rate(SUPABASE_URL, SUPABASE_RATE)
     
-    offset = 0
+    last_id = 0
     total = 0
     errors = 0
     batch_size = 500
     
-    while True:
-        rows = fetch_page(offset, batch_size)
-        if not rows:
-            break
-        
-        for j in rows:
-            try:
-                score, ctc_pass = score_job(j)
-                if patch_job_eval(j["id"], score, ctc_pass):
-                    total += 1
-                else:
+    # Scoring is CPU-bound regex work, so it runs on a process pool while
+    # PATCHes (pure network wait) overlap on a small thread pool; the
+    # shared token bucket still caps the request rate. The next page is
+    # fetched while the current one is being scored.
+    with ProcessPoolExecutor(max_workers=SCORE_WORKERS) as scorers, \
+            ThreadPoolExecutor(max_workers=PATCH_WORKERS, thread_name_prefix="backfill") as patchers, \
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="backfill-fetch") as fetcher:
+        unscored_only = not rescore_all
+        next_page = fetcher.submit(fetch_page, last_id, batch_size, unscored_only)
+        while True:
+            rows = next_page.result()
+            if not rows:
+                break
+            last_id = rows[-1]["id"]
+            next_page = fetcher.submit(fetch_page, last_id, batch_size, unscored_only)
+            
+            # Scores are small integers, so a page collapses to a few dozen
+            # (score, ctc_pass) groups - one PATCH per group, not per row
+            groups = {}
+            for job_id, score, ctc_pass, err in scorers.map(_score_row, rows, chunksize=SCORE_CHUNKSIZE):
+                if err:
+                    print(f"  Error scoring job {job_id}: {err}")
                     errors += 1
-            except Exception as e:
-                print(f"  Error scoring job {j.get('id')}: {e}")
-                traceback.print_exc()
-                errors += 1
-        
-        print(f"  Backfilled {total} jobs (errors: {errors})...")
-        offset += len(rows)
-        time.sleep(0.3)
+                    continue
+                groups.setdefault((score, ctc_pass), []).append(job_id)
+            
+            pending = [
+                (len(ids), patchers.submit(patch_jobs_eval, ids, score, ctc_pass))
+                for (score, ctc_pass), ids in groups.items()
+            ]
+            for n, fut in pending:
+                if fut.result():
+                    total += n
+                else:
+                    errors += n
+            
+            print(f"  Backfilled {total} jobs (errors: {errors})...")
     
     print(f"Backfill complete. Total: {total}, Errors: {errors}")
 
 
 if __name__ == "__main__":
-    main()
+    main(rescore_all="--all" in sys.argv[1:])
@@ -2,14 +2,27 @@
 """
 CV text extraction from PDF, DOCX, and TXT files.
 """
+import hashlib
 import os
+import re
 from typing import Optional
 
+# pypdfium2 (PDFium) is preferred when installed - several times faster
+# than PyPDF2 on long CVs; PyPDF2 stays the baseline dependency
+try:
+    import pypdfium2
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+
 try:
     import PyPDF2
-    PDF_AVAILABLE = True
+    PYPDF2_AVAILABLE = True
 except ImportError:
-    PDF_AVAILABLE = False
+    PYPDF2_AVAILABLE = False
+
+PDF_AVAILABLE = PDFIUM_AVAILABLE or PYPDF2_AVAILABLE
+if not PDF_AVAILABLE:
     print("Warning: PyPDF2 not installed. PDF parsing unavailable.")
 
 try:
@@ -20,23 +33,83 @@ except ImportError:
     print("Warning: python-docx not installed. DOCX parsing unavailable.")
 
 
+CV_CACHE_DIR = os.environ.get(
+    "CV_CACHE_DIR",
+    os.path.join(os.path.dirname(__file__), "..", ".cache", "cv"),
+)
+
+
+def _file_sha256(file_path: str) -> str:
+    """SHA-256 of a file, read in 1 MB blocks."""
+    h = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _pdf_text_pdfium(file_path: str) -> str:
+    pdf = pypdfium2.PdfDocument(file_path)
+    try:
+        text = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            page_text = textpage.get_text_range()
+            textpage.close()
+            page.close()
+            if page_text:
+                text.append(page_text)
+        return '\n'.join(text)
+    finally:
+        pdf.close()
+
+
+def _pdf_text_pypdf2(file_path: str) -> str:
+    text = []
+    with open(file_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        for page in pdf_reader.pages:
+            page_text = page.extract_text()
+            if page_text:
+                text.append(page_text)
+    return '\n'.join(text)
+
+
 def extract_text_from_pdf(file_path: str) -> str:
-    """Extract text from PDF file."""
+    """
+    Extract text from PDF file.
+    
+    Results are cached on disk under CV_CACHE_DIR, keyed by the SHA-256 of
+    the file bytes (and the extractor used), so re-scoring an unchanged CV
+    skips PDF parsing entirely.
+    """
     if not PDF_AVAILABLE:
         raise ImportError("PyPDF2 not installed. Run: pip install PyPDF2")
     
-    text = []
+    backend = "pdfium" if PDFIUM_AVAILABLE else "pypdf2"
     try:
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text.append(page_text)
+        cache_path = os.path.join(os.path.abspath(CV_CACHE_DIR), f"{_file_sha256(file_path)}.{backend}.txt")
+        if os.path.exists(cache_path):
+            with open(cache_path, 'r', encoding='utf-8') as cached:
+                return cached.read()
         
-        return '\n'.join(text)
+        if PDFIUM_AVAILABLE:
+            text = _pdf_text_pdfium(file_path)
+        else:
+            text = _pdf_text_pypdf2(file_path)
     except Exception as e:
         raise Exception(f"Error extracting text from PDF: {e}")
+    
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as out:
+            out.write(text)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Warning: could not cache CV text: {e}")
+    
+    return text
 
 
 def extract_text_from_docx(file_path: str) -> str:
@@ -98,17 +171,14 @@ def extract_cv_text(file_path: str) -> str:
         raise ValueError(f"Unsupported file format: {file_ext}. Supported: .pdf, .docx, .txt")
 
 
+# Any whitespace run containing a newline: trailing spaces, blank lines
+# and the next line's indent collapse to a single newline
+_LINE_BREAK_RE = re.compile(r'\s*\n\s*')
+
+
 def clean_cv_text(text: str) -> str:
-    """Clean and normalize CV text."""
-    # Remove excessive whitespace
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
-    text = '\n'.join(lines)
-    
-    # Remove multiple consecutive newlines
-    while '\n\n\n' in text:
-        text = text.replace('\n\n\n', '\n\n')
-    
-    return text
+    """Clean and normalize CV text (strip every line, drop blank lines)."""
+    return _LINE_BREAK_RE.sub('\n', text).strip()
 
 
 if __name__ == "__main__":
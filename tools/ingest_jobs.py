@@ -6,20 +6,26 @@ Supports both local SQLite and Supabase databases.
 import csv
 import json
 import os
+import re
+import sys
+import threading
 import time
 import traceback
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, List, Tuple
+from urllib.parse import urlparse
 
 # Set local database mode
 USE_LOCAL_DB = os.environ.get("USE_LOCAL_DB", "true").lower() == "true"
 
 if USE_LOCAL_DB:
-    from database.local_db import fetch_companies, upsert_jobs_raw, upsert_jobs, init_db, upsert_company
+    from database.local_db import fetch_companies, upsert_jobs_raw_bulk, upsert_jobs, upsert_jobs_bulk, init_db, upsert_company
 else:
-    from tools.supabase_client import fetch_companies, upsert_jobs_raw, upsert_jobs
+    from tools.supabase_client import fetch_companies, upsert_jobs_raw_bulk, upsert_jobs, upsert_jobs_bulk
 
 from tools.normalize import normalize_job, india_location_ok
 
+from connectors._http import json_loads
 from connectors.workday_cxs import fetch as fetch_workday
 from connectors.oracle_cx import fetch as fetch_oracle
 from connectors.citi_custom import fetch as fetch_citi
@@ -30,10 +36,44 @@ from connectors.bnpp_group import fetch as fetch_bnpp
 from connectors.greenhouse_board import fetch as fetch_greenhouse
 
 
-def _company_map() -> dict:
-    """Build a mapping of company name -> company ID for active companies."""
+COMPANY_MAP_CACHE = os.path.join(os.path.dirname(__file__), "..", ".cache", "company_map.json")
+COMPANY_MAP_TTL = int(os.environ.get("COMPANY_MAP_TTL", "3600"))   # seconds
+
+
+def _company_map(refresh: bool = False) -> dict:
+    """
+    Build a mapping of company name -> company ID for active companies.
+    
+    In Supabase mode the mapping is cached in .cache/company_map.json for
+    COMPANY_MAP_TTL seconds (refresh=True bypasses it), saving a round
+    trip per run. The local database is queried directly - it's cheap
+    and a reset DB would otherwise leave stale IDs behind.
+    """
+    path = os.path.abspath(COMPANY_MAP_CACHE)
+    use_cache = not USE_LOCAL_DB and COMPANY_MAP_TTL > 0
+    
+    if use_cache and not refresh:
+        try:
+            if time.time() - os.path.getmtime(path) < COMPANY_MAP_TTL:
+                with open(path, encoding="utf-8") as f:
+                    return json.load(f)
+        except (OSError, ValueError):
+            pass
+    
     companies = fetch_companies()
-    return {c["name"]: c["id"] for c in companies if c.get("active")}
+    company_map = {c["name"]: c["id"] for c in companies if c.get("active")}
+    
+    if use_cache:
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(company_map, f)
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"  Could not cache company map: {e}")
+    
+    return company_map
 
 
 def _ensure_company(company_name: str, company_map: dict) -> Optional[int]:
@@ -64,48 +104,183 @@ def _truthy(v, default: bool = True) -> bool:
     return str(v).strip().lower() in ("true", "1", "yes", "y")
 
 
+INDIA_KEYWORDS = (
+    'india', 'bengaluru', 'bangalore', 'mumbai', 'hyderabad', 
+    'pune', 'chennai', 'gurgaon', 'gurugram', 'noida', 'delhi',
+    'kolkata', 'ahmedabad', 'remote - india', 'in-'
+)
+# One alternation scanned in C instead of a substring test per keyword
+# (matched against the lowercased location, like the keywords themselves)
+_INDIA_KEYWORD_RE = re.compile("|".join(map(re.escape, INDIA_KEYWORDS)))
+
+
 def _filter_india_jobs(jobs: List[dict], india_only: bool = True) -> List[dict]:
     """Filter jobs to only include India-based positions."""
     if not india_only:
         return jobs
     
-    india_keywords = [
-        'india', 'bengaluru', 'bangalore', 'mumbai', 'hyderabad', 
-        'pune', 'chennai', 'gurgaon', 'gurugram', 'noida', 'delhi',
-        'kolkata', 'ahmedabad', 'remote - india', 'in-'
-    ]
+    search = _INDIA_KEYWORD_RE.search
+    return [job for job in jobs if search(str(job.get('location', '')).lower())]
+
+
+INGEST_WORKERS = int(os.environ.get("INGEST_WORKERS", "12"))
+PER_HOST = int(os.environ.get("INGEST_PER_HOST", "4"))   # concurrent sources per host
+FLUSH_ROWS = 500   # buffered jobs that trigger a bulk upsert
+
+_HOST_SLOTS = {}
+_HOST_SLOTS_LOCK = threading.Lock()
+
+
+def _host_slot(endpoint: str) -> threading.Semaphore:
+    """Semaphore capping how many sources hit one host at once."""
+    host = urlparse(endpoint).netloc.lower()
+    with _HOST_SLOTS_LOCK:
+        slot = _HOST_SLOTS.get(host)
+        if slot is None:
+            slot = _HOST_SLOTS[host] = threading.Semaphore(PER_HOST)
+        return slot
+
+
+def _fetch_source(kind: str, endpoint: str, params: dict) -> Optional[List[dict]]:
+    """Run the connector for one source (None if there is no handler for kind)."""
+    india_only = bool(params.get("india_only", True))
     
-    filtered = []
-    for job in jobs:
-        location = str(job.get('location', '')).lower()
-        if any(kw in location for kw in india_keywords):
-            filtered.append(job)
+    if kind == "greenhouse":
+        # Use Greenhouse API
+        fetched = fetch_greenhouse(
+            endpoint_url=endpoint,
+            max_pages=int(params.get("max_pages", 1))
+        )
+        # Filter for India jobs
+        return _filter_india_jobs(fetched, india_only)
     
-    return filtered
+    elif kind == "workday_cxs":
+        return fetch_workday(
+            endpoint_url=endpoint,
+            search_text=params.get("searchText"),
+            limit=int(params.get("limit", 50)),
+            max_pages=int(params.get("max_pages", 6)),
+            india_only=india_only,
+        )
 
+    elif kind == "oracle_cx":
+        return fetch_oracle(
+            endpoint_url=endpoint,
+            site_number=params.get("site_number"),
+            limit=int(params.get("limit", 200)),
+            max_pages=int(params.get("max_pages", 15)),
+            india_only=india_only,
+        )
+
+    elif kind == "citi_custom":
+        return fetch_citi(
+            india_base_url=endpoint,
+            max_pages=int(params.get("max_pages", 10))
+        )
+
+    elif kind == "taleo_tgnewui":
+        return fetch_taleo(
+            search_url=endpoint,
+            max_pages=int(params.get("max_pages", 4)),
+        )
+
+    elif kind == "brassring_go":
+        return fetch_brassring(
+            go_page_url=endpoint,
+            max_pages=int(params.get("max_pages", 6))
+        )
 
-def run_from_sources_csv():
+    elif kind == "barclays_search":
+        return fetch_barclays(
+            endpoint_url=endpoint,
+            max_pages=int(params.get("max_pages", 5))
+        )
+
+    elif kind == "bnpp_group":
+        return fetch_bnpp(
+            india_landing_url=endpoint,
+            max_pages=int(params.get("max_pages", 3))
+        )
+
+    return None
+
+
+def _process_source(source: dict) -> Tuple[Optional[List[dict]], List[dict]]:
     """
-    Read sources.csv and ingest jobs from each configured source.
+    Fetch and normalize one source (runs on a worker thread).
+    
+    Returns:
+        (fetched, jobs) - fetched is None when there is no handler for the kind
     """
-    # Initialize local database if needed
-    if USE_LOCAL_DB:
-        init_db()
+    kind, endpoint, company_id = source["kind"], source["endpoint"], source["company_id"]
+    
+    with _host_slot(endpoint):
+        fetched = _fetch_source(kind, endpoint, source["params"])
+    if fetched is None:
+        return None, []
+
+    # Filter and normalize jobs; paginated boards often repeat a posting,
+    # so skip exact repeats before paying for normalize_job. The key covers
+    # the same fields upsert_jobs() de-duplicates on (with the raw location
+    # standing in for location_city), so distinct postings that share a
+    # landing URL are kept
+    jobs = []
+    seen = set()
+    for d in fetched:
+        loc = (d.get("location") or "").strip() or None
+        
+        # For Greenhouse, location is already filtered
+        if kind != "greenhouse" and not india_location_ok(loc):
+            continue
+        
+        key = tuple(
+            (v or "").strip().lower()
+            for v in (d.get("req_id"), d.get("detail_url"), d.get("title"), loc)
+        )
+        if key in seen:
+            continue
+        seen.add(key)
+        
+        _, rec = normalize_job(
+            company_id=company_id,
+            title=d.get("title"),
+            apply_url=d.get("detail_url"),
+            location=loc,
+            description=d.get("description"),
+            req_id=d.get("req_id"),
+            posted_at=d.get("posted"),
+        )
+        jobs.append(rec)
+    
+    return fetched, jobs
+
+
+def _read_sources(path: str, company_map: dict) -> List[dict]:
+    """
+    Parse sources.csv into the active sources, resolving company IDs.
     
-    with open("config/sources.csv", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        company_map = _company_map()
-        total_jobs = 0
+    Rows are read as plain lists and comment / inactive rows are rejected
+    on the raw cells, so only real sources get a dict built.
+    """
+    sources = []
+    with open(path, newline="", encoding="utf-8", buffering=1 << 16) as f:
+        reader = csv.reader(f)
+        col = {name: i for i, name in enumerate(next(reader, []))}
+        i_company, i_active = col.get("company"), col.get("active")
+        i_kind, i_endpoint, i_params = col.get("kind"), col.get("endpoint_url"), col.get("params")
+
+        def cell(row, i):
+            return row[i] if i is not None and i < len(row) else None
 
         for row in reader:
-            company = (row.get("company") or "").strip()
+            company = (cell(row, i_company) or "").strip()
             
             # Skip comments and empty rows
             if not company or company.startswith("#"):
                 continue
             
             # Skip inactive sources
-            if not _truthy(row.get("active"), True):
+            if not _truthy(cell(row, i_active), True):
                 continue
 
             # Ensure company exists
@@ -114,135 +289,120 @@ def run_from_sources_csv():
                 print(f"Skip source for unknown company: {company}")
                 continue
 
-            kind = (row.get("kind") or "").strip()
-            endpoint = (row.get("endpoint_url") or "").strip()
-            
-            # Parse params JSON
+            # Parse params JSON (most rows have none)
             params = {}
-            try:
-                params = json.loads(row.get("params") or "{}")
-            except json.JSONDecodeError:
-                params = {}
-
+            raw_params = (cell(row, i_params) or "").strip()
+            if raw_params:
+                try:
+                    params = json_loads(raw_params)
+                except ValueError:
+                    params = {}
+
+            sources.append({
+                "company": company,
+                "company_id": company_id,
+                "kind": (cell(row, i_kind) or "").strip(),
+                "endpoint": (cell(row, i_endpoint) or "").strip(),
+                "params": params,
+            })
+    return sources
+
+
+def _flush(pending: dict, raw_pending: list) -> int:
+    """
+    Write buffered raw payloads and jobs in bulk; returns jobs upserted.
+    
+    If the bulk write fails, each company is retried on its own so one bad
+    batch costs only that company. Companies that still fail are left in
+    `pending` for the next flush.
+    """
+    n = 0
+    if raw_pending:
+        # Record raw fetch attempts
+        try:
+            upsert_jobs_raw_bulk(raw_pending)
+        except Exception as e:
+            print(f"  ! jobs_raw upsert failed: {e}")
+        raw_pending.clear()
+    
+    if pending:
+        # Upsert normalized jobs
+        try:
+            n = upsert_jobs_bulk(pending)
+            print(f"  + upserted {n} jobs from {len(pending)} companies")
+            pending.clear()
+        except Exception as e:
+            print(f"  ! bulk jobs upsert failed, retrying per company: {e}")
+            traceback.print_exc()
+            for company_id in list(pending):
+                try:
+                    n += upsert_jobs(company_id, pending[company_id])
+                    del pending[company_id]
+                except Exception as e:
+                    print(f"  ! jobs upsert failed for company {company_id}: {e}")
+    return n
+
+
+def run_from_sources_csv(refresh_companies: bool = False):
+    """
+    Read sources.csv and ingest jobs from each configured source.
+    
+    Sources are fetched and normalized concurrently on INGEST_WORKERS
+    threads (at most PER_HOST at a time against any one host). Database
+    writes stay on the calling thread and are buffered across sources,
+    then written in bulk every FLUSH_ROWS jobs and at the end, so SQLite
+    and Supabase see one writer and a handful of round trips.
+    """
+    # Initialize local database if needed
+    if USE_LOCAL_DB:
+        init_db()
+    
+    company_map = _company_map(refresh=refresh_companies)
+    sources = _read_sources("config/sources.csv", company_map)
+    total_jobs = 0
+    pending = {}        # company_id -> normalized jobs awaiting upsert
+    pending_rows = 0
+    raw_pending = []    # (company_id, source_id, page_url, payload)
+
+    with ThreadPoolExecutor(max_workers=max(1, INGEST_WORKERS), thread_name_prefix="ingest") as pool:
+        futures = {pool.submit(_process_source, src): src for src in sources}
+        
+        for fut in as_completed(futures):
+            src = futures[fut]
+            company, kind, endpoint, company_id = src["company"], src["kind"], src["endpoint"], src["company_id"]
             print(f"[{company}] {kind} -> {endpoint[:50]}...")
-            raw_payload = {}
-            fetched = []
-            india_only = bool(params.get("india_only", True))
 
             try:
-                if kind == "greenhouse":
-                    # Use Greenhouse API
-                    fetched = fetch_greenhouse(
-                        endpoint_url=endpoint,
-                        max_pages=int(params.get("max_pages", 1))
-                    )
-                    # Filter for India jobs
-                    fetched = _filter_india_jobs(fetched, india_only)
-                
-                elif kind == "workday_cxs":
-                    fetched = fetch_workday(
-                        endpoint_url=endpoint,
-                        search_text=params.get("searchText"),
-                        limit=int(params.get("limit", 50)),
-                        max_pages=int(params.get("max_pages", 6)),
-                        india_only=india_only,
-                    )
-
-                elif kind == "oracle_cx":
-                    fetched = fetch_oracle(
-                        endpoint_url=endpoint,
-                        site_number=params.get("site_number"),
-                        limit=int(params.get("limit", 200)),
-                        max_pages=int(params.get("max_pages", 15)),
-                        india_only=india_only,
-                    )
-
-                elif kind == "citi_custom":
-                    fetched = fetch_citi(
-                        india_base_url=endpoint,
-                        max_pages=int(params.get("max_pages", 10))
-                    )
-
-                elif kind == "taleo_tgnewui":
-                    fetched = fetch_taleo(
-                        search_url=endpoint,
-                        max_pages=int(params.get("max_pages", 4)),
-                    )
-
-                elif kind == "brassring_go":
-                    fetched = fetch_brassring(
-                        go_page_url=endpoint,
-                        max_pages=int(params.get("max_pages", 6))
-                    )
-
-                elif kind == "barclays_search":
-                    fetched = fetch_barclays(
-                        endpoint_url=endpoint,
-                        max_pages=int(params.get("max_pages", 5))
-                    )
-
-                elif kind == "bnpp_group":
-                    fetched = fetch_bnpp(
-                        india_landing_url=endpoint,
-                        max_pages=int(params.get("max_pages", 3))
-                    )
-
-                else:
-                    print(f"  (no handler yet for kind={kind})")
-                    continue
-
-                print(f"  fetched: {len(fetched)} jobs")
-                raw_payload = {"count": len(fetched)}
-
-                # Filter and normalize jobs
-                jobs = []
-                for d in fetched:
-                    loc = (d.get("location") or "").strip() or None
-                    
-                    # For Greenhouse, location is already filtered
-                    if kind != "greenhouse" and not india_location_ok(loc):
-                        continue
-                    
-                    _, rec = normalize_job(
-                        company_id=company_id,
-                        title=d.get("title"),
-                        apply_url=d.get("detail_url"),
-                        location=loc,
-                        description=d.get("description"),
-                        req_id=d.get("req_id"),
-                        posted_at=d.get("posted"),
-                    )
-                    jobs.append(rec)
-
-                print(f"  normalized: {len(jobs)} jobs")
-
+                fetched, jobs = fut.result()
             except Exception as e:
                 print(f"  ! error fetching {company}: {e}")
-                traceback.print_exc()
+                traceback.print_exception(type(e), e, e.__traceback__)
                 continue
 
-            # Record raw fetch attempt
-            try:
-                upsert_jobs_raw(company_id, None, endpoint, raw_payload)
-            except Exception as e:
-                print(f"  ! jobs_raw upsert failed: {e}")
+            if fetched is None:
+                print(f"  (no handler yet for kind={kind})")
+                continue
 
-            # Upsert normalized jobs
-            try:
-                n = upsert_jobs(company_id, jobs)
-                total_jobs += n
-                print(f"  + upserted {n} jobs")
-            except Exception as e:
-                print(f"  ! jobs upsert failed: {e}")
-                traceback.print_exc()
+            print(f"  fetched: {len(fetched)} jobs")
+            print(f"  normalized: {len(jobs)} jobs")
+            
+            raw_pending.append((company_id, None, endpoint, {"count": len(fetched)}))
+            pending.setdefault(company_id, []).extend(jobs)
+            pending_rows += len(jobs)
+            if pending_rows >= FLUSH_ROWS:
+                total_jobs += _flush(pending, raw_pending)
+                pending_rows = sum(len(rows) for rows in pending.values())
 
-            time.sleep(0.5)
+    total_jobs += _flush(pending, raw_pending)
+    if pending:
+        lost = sum(len(rows) for rows in pending.values())
+        print(f"  ! {lost} jobs from {len(pending)} companies could not be written")
 
-        print(f"\n{'='*50}")
-        print(f"Done. Upserted total {total_jobs} jobs.")
-        print(f"{'='*50}")
+    print(f"\n{'='*50}")
+    print(f"Done. Upserted total {total_jobs} jobs.")
+    print(f"{'='*50}")
 
 
 if __name__ == "__main__":
     os.environ["USE_LOCAL_DB"] = "true"
-    run_from_sources_csv()
+    run_from_sources_csv(refresh_companies="--refresh-companies" in sys.argv[1:])
@@ -5,7 +5,6 @@ Uses sites.yaml for configuration.
 """
 import sys
 import json
-import time
 import traceback
 from typing import Optional, List, Iterable
 
@@ -18,7 +17,7 @@ except ImportError:
 
 from tools.supabase_client import fetch_companies, upsert_jobs_raw, upsert_jobs
 from tools.normalize import normalize_job, india_location_ok
-from connectors.play_renderer import render_and_extract
+from connectors.play_renderer import render_all
 
 
 CFG_PATH = "config/sites.yaml"
@@ -89,6 +88,8 @@ def run(companies_filter: Optional[List[str]] = None):
     total_jobs = 0
     errors = 0
 
+    # Validate every entry first, then render all boards concurrently
+    todo = []
     for s in sites:
         company = (s.get("company") or "").strip()
         if not company:
@@ -123,22 +124,28 @@ def run(companies_filter: Optional[List[str]] = None):
             continue
 
         print(f"[{company}] site -> {url}")
-        
-        try:
-            rows = render_and_extract(
-                url=url,
-                selectors=selectors,
-                max_pages=max_pages,
-                next_selector=next_selector,
-                wait_for=wait_for,
-                force_india=force_india,
-                page_param=page_param,
-                step=step,
-                do_scroll=bool(s.get("do_scroll", True)),
-            )
-        except Exception as e:
+        todo.append((company, company_id, url, {
+            "url": url,
+            "selectors": selectors,
+            "max_pages": max_pages,
+            "next_selector": next_selector,
+            "wait_for": wait_for,
+            "force_india": force_india,
+            "page_param": page_param,
+            "step": step,
+            "do_scroll": bool(s.get("do_scroll", True)),
+            "spa_nav": bool(s.get("spa_nav", False)),
+        }))
+
+    results = render_all([kwargs for *_, kwargs in todo]) if todo else []
+
+    for (company, company_id, url, _), rows in zip(todo, results):
+        print(f"[{company}] results")
+
+        if isinstance(rows, BaseException):
+            e = rows
             print(f"  ! error scraping {company}: {e}")
-            traceback.print_exc()
+            traceback.print_exception(type(e), e, e.__traceback__)
             errors += 1
             
             # Record the error
@@ -188,8 +195,6 @@ def run(companies_filter: Optional[List[str]] = None):
             print(f"  ! jobs upsert failed: {e}")
             traceback.print_exc()
 
-        time.sleep(1)
-
     print(f"Done. Upserted total {total_jobs} jobs (errors: {errors}).")
 
 
@@ -5,6 +5,7 @@ Handles location validation, date parsing, and canonical key generation.
 """
 import re
 from datetime import datetime
+from functools import lru_cache
 from urllib.parse import urlparse, parse_qs
 from typing import Optional, Tuple
 
@@ -38,9 +39,13 @@ INDIA_PHRASES = [
 ]
 
 
-def _contains_word(hay: str, word: str) -> bool:
-    """Check if a word exists in text as a whole word."""
-    return re.search(rf"\b{re.escape(word)}\b", hay, flags=re.I) is not None
+# Every whole-word India marker in one alternation: ISO-ish country codes
+# (e.g. "Mumbai, IN", "Bengaluru, IND"), cities and states
+_INDIA_WORD_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(w) for w in ["IN", "IND"] + CITIES + STATES) + r")\b",
+    re.I,
+)
+_INDIA_PATH_RE = re.compile(r"\bIndia\b", re.I)
 
 
 def _apply_url_implies_india(apply_url: Optional[str]) -> bool:
@@ -59,7 +64,7 @@ def _apply_url_implies_india(apply_url: Optional[str]) -> bool:
                     return True
         
         # Check path for India
-        if _contains_word(u.path, "India"):
+        if _INDIA_PATH_RE.search(u.path):
             return True
     except Exception:
         pass
@@ -67,6 +72,25 @@ def _apply_url_implies_india(apply_url: Optional[str]) -> bool:
     return False
 
 
+@lru_cache(maxsize=4096)
+def _location_is_india(s: str) -> bool:
+    """
+    India check for one stripped location string.
+
+    Memoized: a board's postings share a handful of distinct locations,
+    so each one is scanned once per run instead of once per job.
+    """
+    sl = s.lower()
+
+    # Check explicit India markers/phrases
+    for phrase in INDIA_PHRASES:
+        if phrase in sl:
+            return True
+
+    # Country codes, cities and states in a single scan
+    return sl.startswith("in-") or _INDIA_WORD_RE.search(s) is not None
+
+
 def india_location_ok(loc: Optional[str], apply_url: Optional[str] = None) -> bool:
     """
     Check if a location string indicates an India-based job.
@@ -78,24 +102,8 @@ def india_location_ok(loc: Optional[str], apply_url: Optional[str] = None) -> bo
     Returns:
         True if location appears to be in India
     """
-    if loc:
-        s = loc.strip()
-        sl = s.lower()
-
-        # Check explicit India markers/phrases
-        for phrase in INDIA_PHRASES:
-            if phrase in sl:
-                return True
-
-        # Check ISO-ish / country codes
-        # e.g., "IN-Mumbai", "Mumbai, IN", "Bengaluru, IND"
-        if sl.startswith("in-") or _contains_word(s, "IN") or _contains_word(s, "IND"):
-            return True
-
-        # Check cities and states
-        for w in CITIES + STATES:
-            if _contains_word(s, w):
-                return True
+    if loc and _location_is_india(loc.strip()):
+        return True
 
     # Fallback: check if apply_url reveals India filter
     if _apply_url_implies_india(apply_url):
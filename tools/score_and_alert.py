@@ -2,6 +2,7 @@
 """
 Score recent jobs and send Telegram alerts for high-quality matches.
 """
+import html
 import os
 import sys
 import datetime as dt
@@ -11,7 +12,7 @@ import requests
 from typing import Optional, List
 
 from tools.scoring import score_job
-from tools.alert_telegram import send as tg_send
+from tools.alert_telegram import deliver_batch as tg_deliver_batch
 
 
 def _get_env_var(name: str) -> str:
@@ -41,8 +42,14 @@ def _iso_minutes_ago(mins: int = 180) -> str:
     return (dt.datetime.utcnow() - dt.timedelta(minutes=mins)).isoformat(timespec="seconds") + "Z"
 
 
-def fetch_recent_jobs(since_minutes: int = 180) -> List[dict]:
-    """Fetch jobs created in the last N minutes."""
+def fetch_recent_jobs(since_minutes: int = 180, unscored_only: bool = True) -> List[dict]:
+    """
+    Fetch jobs created in the last N minutes.
+    
+    By default rows a previous run already scored (a manual re-run or
+    retry inside the window) are filtered out server side, so they are
+    neither re-scored nor re-alerted.
+    """
     if not SUPABASE_URL or not SERVICE_ROLE:
         print("ERROR: SUPABASE_URL or SUPABASE_SERVICE_ROLE not set")
         return []
@@ -53,6 +60,8 @@ def fetch_recent_jobs(since_minutes: int = 180) -> List[dict]:
         "order": "first_seen_at.desc",
         "first_seen_at": f"gte.{since}",
     }
+    if unscored_only:
+        params["relevance_score"] = "is.null"
     url = f"{SUPABASE_URL}/rest/v1/jobs?{urllib.parse.urlencode(params)}"
     
     try:
@@ -121,48 +130,56 @@ def main():
     jobs = fetch_recent_jobs(180)
     print(f"Found {len(jobs)} recent jobs to process")
     
-    sent = 0
     scored = 0
+    alerts = []
+    alert_evals = []    # (job_id, score, ctc_pass) per entry of alerts
     
     for j in jobs:
         try:
             score, ctc_pass = score_job(j)
             scored += 1
 
-            # Write score + CTC flag for visibility
-            patch_job_eval(j["id"], score, ctc_pass)
-
-            # Apply filters
-            if _should_skip_by_title(j.get("title")):
-                continue
-            
-            if not _experience_matches(j.get("min_exp"), j.get("max_exp")):
-                continue
-
-            # Send alert for high-quality matches
-            if score >= 80 and ctc_pass:
-                company_name = (j.get("companies") or {}).get("name", "Company")
-                loc = j.get("location_city") or "Location N/A"
-                url = j.get("apply_url") or ""
-                title = j.get("title") or "Job"
+            # Send alert for high-quality matches that pass the filters
+            if (score >= 80 and ctc_pass
+                    and not _should_skip_by_title(j.get("title"))
+                    and _experience_matches(j.get("min_exp"), j.get("max_exp"))):
+                # Escaped: alerts go out with parse_mode=HTML
+                company_name = html.escape((j.get("companies") or {}).get("name") or "Company")
+                loc = html.escape(j.get("location_city") or "Location N/A")
+                url = html.escape(j.get("apply_url") or "")
+                title = html.escape(j.get("title") or "Job")
                 
-                msg = (
+                alerts.append(
                     f"<b>{company_name}</b> — <b>{title}</b>\n"
                     f"{loc}\n"
                     f"Score: <b>{score}</b>\n"
                     f"{url}"
                 )
-                
-                try:
-                    tg_send(msg)
-                    sent += 1
-                except Exception as e:
-                    print(f"Telegram send failed: {e}")
+                alert_evals.append((j["id"], score, ctc_pass))
+                continue
+
+            # Write score + CTC flag for visibility
+            patch_job_eval(j["id"], score, ctc_pass)
                     
         except Exception as e:
             print(f"Error processing job {j.get('id')}: {e}")
             traceback.print_exc()
 
+    # One Telegram message per ~3.8k characters of alerts, not one per job
+    delivered = [False] * len(alerts)
+    try:
+        delivered = tg_deliver_batch(alerts)
+    except Exception as e:
+        print(f"Telegram send failed: {e}")
+
+    # Scored rows are never fetched again (relevance_score=is.null), so an
+    # alert's score is only written once it is delivered; undelivered
+    # alerts stay unscored and are retried by the next run
+    for ok, (job_id, score, ctc_pass) in zip(delivered, alert_evals):
+        if ok:
+            patch_job_eval(job_id, score, ctc_pass)
+    sent = sum(delivered)
+
     print(f"Score+Alert done. Scored={scored}, Sent={sent}")
 
 
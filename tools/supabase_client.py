@@ -15,7 +15,9 @@ if USE_LOCAL_DB:
         from database.local_db import (
             fetch_companies,
             upsert_jobs_raw,
+            upsert_jobs_raw_bulk,
             upsert_jobs,
+            upsert_jobs_bulk,
             init_db,
         )
         print("Using local SQLite database")
@@ -26,8 +28,15 @@ if USE_LOCAL_DB:
 
 if not USE_LOCAL_DB:
     # Use Supabase (remote database)
-    import requests
-    from typing import Optional
+    from typing import Dict, List, Optional
+
+    from connectors._http import make_session, request_with_retry
+
+    BULK_ROWS = 500   # rows per bulk upsert POST
+
+    # One keep-alive pool for every write in the run; 429/5xx and
+    # Retry-After are handled by request_with_retry.
+    _SESSION = make_session(pool_maxsize=4, retry_statuses=False)
 
     def _get_env_var(name: str) -> str:
         """Get required environment variable or exit with helpful message."""
@@ -67,7 +76,7 @@ if not USE_LOCAL_DB:
             "payload": payload,
         }]
         
-        r = requests.post(url, headers=_get_headers(), json=rows, timeout=45)
+        r = request_with_retry("POST", url, session=_SESSION, headers=_get_headers(), json=rows, timeout=45)
         r.raise_for_status()
         
         if r.ok and r.content:
@@ -79,11 +88,21 @@ if not USE_LOCAL_DB:
                 pass
         return None
 
-    def upsert_jobs(company_id: int, rows: list) -> int:
-        """Upsert normalized job records."""
+    def upsert_jobs_raw_bulk(rows: List[tuple]) -> None:
+        """Store several (company_id, source_id, page_url, payload) rows in one POST."""
         if not rows:
-            return 0
+            return
+        url = f"{SUPABASE_URL}/rest/v1/jobs_raw"
+        body = [
+            {"company_id": cid, "source_id": sid, "page_url": page_url, "payload": payload}
+            for cid, sid, page_url, payload in rows
+        ]
+        headers = {**_get_headers(), "Prefer": "return=minimal"}
+        r = request_with_retry("POST", url, session=_SESSION, headers=headers, json=body, timeout=45)
+        r.raise_for_status()
 
+    def _clean_jobs(company_id: int, rows: list) -> list:
+        """De-duplicate one company's records within the batch and tag them."""
         seen, cleaned = set(), []
         for rec in rows:
             k = (
@@ -99,24 +118,42 @@ if not USE_LOCAL_DB:
             r = {kk: vv for kk, vv in rec.items() if kk != "canonical_key"}
             r["company_id"] = company_id
             cleaned.append(r)
+        return cleaned
+
+    def _post_jobs(cleaned: list) -> int:
+        """Upsert cleaned rows, BULK_ROWS per request; returns rows written."""
+        url = f"{SUPABASE_URL}/rest/v1/jobs?on_conflict=company_id,canonical_key&select=id"
+        count = 0
+        for i in range(0, len(cleaned), BULK_ROWS):
+            resp = request_with_retry(
+                "POST", url, session=_SESSION, headers=_get_headers(),
+                json=cleaned[i:i + BULK_ROWS], timeout=60,
+            )
+            resp.raise_for_status()
+            
+            if resp.ok and resp.content:
+                try:
+                    count += len(resp.json())
+                except (ValueError, TypeError):
+                    pass
+        return count
 
-        if not cleaned:
+    def upsert_jobs(company_id: int, rows: list) -> int:
+        """Upsert normalized job records."""
+        if not rows:
             return 0
+        return _post_jobs(_clean_jobs(company_id, rows))
 
-        url = f"{SUPABASE_URL}/rest/v1/jobs?on_conflict=company_id,canonical_key&select=id"
-        resp = requests.post(url, headers=_get_headers(), json=cleaned, timeout=60)
-        resp.raise_for_status()
-        
-        if resp.ok and resp.content:
-            try:
-                return len(resp.json())
-            except (ValueError, TypeError):
-                return 0
-        return 0
+    def upsert_jobs_bulk(rows_by_company: Dict[int, list]) -> int:
+        """Upsert several companies' job records in as few requests as possible."""
+        cleaned = []
+        for company_id, rows in rows_by_company.items():
+            cleaned.extend(_clean_jobs(company_id, rows))
+        return _post_jobs(cleaned)
 
     def fetch_companies() -> list:
         """Fetch all companies from database."""
         url = f"{SUPABASE_URL}/rest/v1/companies?select=id,name,ats_type,careers_url,active"
-        r = requests.get(url, headers=_get_headers(), timeout=45)
+        r = request_with_retry("GET", url, session=_SESSION, headers=_get_headers(), timeout=45)
         r.raise_for_status()
         return r.json() if r.ok else []